@@ -55,8 +55,10 @@ def create_parking_lot(
     )
     parking_lot = lot_repo.create(parking_lot)
     
-    # Create floors and spots
+    # Create floors, then batch-insert all spots in one statement
+    spot_repo = ParkingSpotRepository(db)
     total_spots = 0
+    spot_rows = []
     for floor_data in lot_data.floors:
         floor = FloorModel(
             parking_lot_id=parking_lot.id,
@@ -65,8 +67,8 @@ def create_parking_lot(
         )
         db.add(floor)
         db.flush()
-        
-        # Create spots using factory
+
+        # Collect spot rows using factory defaults
         for spot_data in floor_data.spots:
             spot = SpotFactory.create_spot(
                 spot_number=spot_data.spot_number,
@@ -75,9 +77,17 @@ def create_parking_lot(
             )
             if spot_data.is_charging_enabled:
                 spot.is_charging_enabled = True
-            db.add(spot)
-        
+            spot_rows.append({
+                "floor_id": spot.floor_id,
+                "spot_number": spot.spot_number,
+                "spot_type": spot.spot_type,
+                "status": spot.status,
+                "is_charging_enabled": spot.is_charging_enabled,
+            })
+
         total_spots += floor.total_spots
+
+    spot_repo.bulk_create(spot_rows)
     
     parking_lot.total_floors = len(lot_data.floors)
     db.commit()
@@ -4,7 +4,22 @@ from typing import Optional
 from uuid import UUID
 
 from src.domain.base_entity import BaseEntity
-from src.domain.enums import VehicleType
+from src.domain.enums import SpotType, VehicleType
+
+# Compatibility table evaluated once at import: constant lookup and
+# zero per-call allocation on the spot-allocation hot path.
+_COMPATIBLE_SPOT_TYPES = {
+    VehicleType.MOTORCYCLE: (SpotType.MOTORCYCLE, SpotType.COMPACT),
+    VehicleType.CAR: (SpotType.COMPACT, SpotType.LARGE, SpotType.HANDICAPPED),
+    VehicleType.ELECTRIC_CAR: (
+        SpotType.COMPACT,
+        SpotType.LARGE,
+        SpotType.HANDICAPPED,
+        SpotType.ELECTRIC,
+    ),
+    VehicleType.TRUCK: (SpotType.LARGE,),
+    VehicleType.VAN: (SpotType.LARGE,),
+}
 
 
 class Vehicle(BaseEntity):
@@ -70,26 +85,13 @@ class Vehicle(BaseEntity):
         """
         return self.vehicle_type == VehicleType.ELECTRIC_CAR
     
-    def get_compatible_spot_types(self) -> list:
-        """Get list of compatible spot types for this vehicle.
-        
+    def get_compatible_spot_types(self) -> tuple:
+        """Get compatible spot types for this vehicle.
+
         Returns:
-            List of SpotType enums compatible with this vehicle
+            Tuple of SpotType enums compatible with this vehicle
         """
-        from src.domain.enums import SpotType
-        
-        compatible_spots = []
-        
-        if self.vehicle_type == VehicleType.MOTORCYCLE:
-            compatible_spots = [SpotType.MOTORCYCLE, SpotType.COMPACT]
-        elif self.vehicle_type in [VehicleType.CAR, VehicleType.ELECTRIC_CAR]:
-            compatible_spots = [SpotType.COMPACT, SpotType.LARGE, SpotType.HANDICAPPED]
-            if self.is_electric():
-                compatible_spots.append(SpotType.ELECTRIC)
-        elif self.vehicle_type in [VehicleType.TRUCK, VehicleType.VAN]:
-            compatible_spots = [SpotType.LARGE]
-        
-        return compatible_spots
+        return _COMPATIBLE_SPOT_TYPES.get(self.vehicle_type, ())
     
     def __repr__(self) -> str:
         """String representation."""
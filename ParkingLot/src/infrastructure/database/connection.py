@@ -17,6 +17,7 @@ engine = create_engine(
     pool_size=20,  # Maximum number of connections
     max_overflow=0,  # Additional connections if pool is full
     echo=settings.debug,  # Log SQL queries in debug mode
+    query_cache_size=1200,  # Compiled-SQL cache for hot repository statements
 )
 
 # Session factory
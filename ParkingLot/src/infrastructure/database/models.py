@@ -16,6 +16,8 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     Index,
+    func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
@@ -50,9 +52,9 @@ class ParkingLotModel(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
     # Relationships
-    floors = relationship("FloorModel", back_populates="parking_lot", cascade="all, delete-orphan")
-    tickets = relationship("TicketModel", back_populates="parking_lot")
-    pricing_rules = relationship("PricingRuleModel", back_populates="parking_lot")
+    floors = relationship("FloorModel", back_populates="parking_lot", cascade="all, delete-orphan", lazy="selectin")
+    tickets = relationship("TicketModel", back_populates="parking_lot", lazy="select")
+    pricing_rules = relationship("PricingRuleModel", back_populates="parking_lot", lazy="select")
 
 
 class FloorModel(Base):
@@ -67,8 +69,8 @@ class FloorModel(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     
     # Relationships
-    parking_lot = relationship("ParkingLotModel", back_populates="floors")
-    spots = relationship("ParkingSpotModel", back_populates="floor", cascade="all, delete-orphan")
+    parking_lot = relationship("ParkingLotModel", back_populates="floors", lazy="select")
+    spots = relationship("ParkingSpotModel", back_populates="floor", cascade="all, delete-orphan", lazy="selectin")
     
     # Constraints
     __table_args__ = (
@@ -89,16 +91,29 @@ class ParkingSpotModel(Base):
     is_charging_enabled = Column(Boolean, default=False)
     version = Column(Integer, default=0, nullable=False)  # For optimistic locking
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # Server-side clock: occupy/vacate writes happen from many workers,
+    # so the DB clock keeps version timestamps monotonic across the pool
+    updated_at = Column(
+        DateTime, server_default=func.now(), onupdate=func.now(), nullable=False
+    )
     
     # Relationships
-    floor = relationship("FloorModel", back_populates="spots")
-    tickets = relationship("TicketModel", back_populates="spot")
+    # Entry responses read spot.floor.floor_number for every allocation
+    floor = relationship("FloorModel", back_populates="spots", lazy="joined")
+    tickets = relationship("TicketModel", back_populates="spot", lazy="select")
     
     # Constraints and Indexes
     __table_args__ = (
         UniqueConstraint("floor_id", "spot_number", name="uq_floor_spot_number"),
         Index("idx_floor_status_type", "floor_id", "status", "spot_type"),
+        # Partial index covering availability probes: scans only the
+        # available subset, so lookup cost tracks free spots, not lot size.
+        Index(
+            "ix_spot_floor_status_available",
+            "floor_id",
+            "status",
+            postgresql_where=text("status = 'AVAILABLE'"),
+        ),
     )
 
 
@@ -115,7 +130,7 @@ class VehicleModel(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     
     # Relationships
-    tickets = relationship("TicketModel", back_populates="vehicle")
+    tickets = relationship("TicketModel", back_populates="vehicle", lazy="select")
 
 
 class TicketModel(Base):
@@ -136,10 +151,11 @@ class TicketModel(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
     # Relationships
-    parking_lot = relationship("ParkingLotModel", back_populates="tickets")
-    spot = relationship("ParkingSpotModel", back_populates="tickets")
-    vehicle = relationship("VehicleModel", back_populates="tickets")
-    payments = relationship("PaymentModel", back_populates="ticket")
+    parking_lot = relationship("ParkingLotModel", back_populates="tickets", lazy="select")
+    spot = relationship("ParkingSpotModel", back_populates="tickets", lazy="select")
+    # Nearly every ticket render needs the plate, so join it eagerly
+    vehicle = relationship("VehicleModel", back_populates="tickets", lazy="joined")
+    payments = relationship("PaymentModel", back_populates="ticket", lazy="select")
     
     # Indexes
     __table_args__ = (
@@ -165,7 +181,7 @@ class PaymentModel(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
     # Relationships
-    ticket = relationship("TicketModel", back_populates="payments")
+    ticket = relationship("TicketModel", back_populates="payments", lazy="select")
     
     # Indexes
     __table_args__ = (
@@ -192,7 +208,7 @@ class PricingRuleModel(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     
     # Relationships
-    parking_lot = relationship("ParkingLotModel", back_populates="pricing_rules")
+    parking_lot = relationship("ParkingLotModel", back_populates="pricing_rules", lazy="select")
     
     # Indexes
     __table_args__ = (
@@ -242,7 +258,7 @@ class CouponModel(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     
     # Relationships
-    usage_records = relationship("CouponUsageModel", back_populates="coupon")
+    usage_records = relationship("CouponUsageModel", back_populates="coupon", lazy="select")
 
 
 class CouponUsageModel(Base):
@@ -257,7 +273,7 @@ class CouponUsageModel(Base):
     used_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     
     # Relationships
-    coupon = relationship("CouponModel", back_populates="usage_records")
+    coupon = relationship("CouponModel", back_populates="usage_records", lazy="select")
 
 
 class AuditLogModel(Base):
@@ -3,6 +3,7 @@ from abc import ABC, abstractmethod
 from typing import Generic, List, Optional, Type, TypeVar
 from uuid import UUID
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from src.infrastructure.database.connection import Base
@@ -38,6 +39,24 @@ class BaseRepository(ABC, Generic[ModelType]):
         self.db.refresh(entity)
         return entity
     
+    def bulk_create(self, rows: List[dict]) -> None:
+        """Create many entities in a single INSERT.
+
+        Used on provisioning paths (e.g. creating all spots for a new
+        floor) where row-at-a-time inserts would mean one round-trip
+        per entity.
+
+        Args:
+            rows: List of column-value dicts, one per entity
+        """
+        if not rows:
+            return
+        self.db.execute(
+            insert(self.model).execution_options(insertmanyvalues_page_size=1000),
+            rows,
+        )
+        self.db.flush()
+
     def get_by_id(self, id: UUID) -> Optional[ModelType]:
         """Get entity by ID.
         
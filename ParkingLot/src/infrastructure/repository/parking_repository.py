@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, case, or_, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload
 
@@ -160,7 +160,7 @@ class ParkingSpotRepository(BaseRepository[ParkingSpotModel]):
         """
         # Build query for available spots
         from src.infrastructure.database.models import FloorModel
-        
+
         query = self.db.query(self.model).join(
             FloorModel, self.model.floor_id == FloorModel.id
         ).filter(
@@ -170,15 +170,17 @@ class ParkingSpotRepository(BaseRepository[ParkingSpotModel]):
                 self.model.spot_type.in_(compatible_spot_types)
             )
         )
-        
-        # Try preferred type first
+
+        # Rank the preferred type first so one statement covers both the
+        # preferred and fallback cases instead of two round-trips
         if preferred_type and preferred_type in compatible_spot_types:
-            spot = query.filter(self.model.spot_type == preferred_type).first()
-            if spot:
-                return spot
-        
-        # Find any compatible spot
-        return query.first()
+            order_key = case(
+                (self.model.spot_type == preferred_type, 0),
+                else_=1
+            )
+            query = query.order_by(order_key)
+
+        return query.limit(1).first()
     
     def occupy_spot_with_lock(self, spot_id: UUID) -> bool:
         """Occupy a spot using optimistic locking.
@@ -203,8 +205,7 @@ class ParkingSpotRepository(BaseRepository[ParkingSpotModel]):
                 )
             ).update({
                 "status": SpotStatus.OCCUPIED,
-                "version": spot.version + 1,
-                "updated_at": datetime.utcnow()
+                "version": spot.version + 1
             }, synchronize_session=False)
             
             self.db.flush()
@@ -216,22 +217,29 @@ class ParkingSpotRepository(BaseRepository[ParkingSpotModel]):
     
     def vacate_spot(self, spot_id: UUID) -> bool:
         """Vacate a spot.
-        
+
+        Runs a single conditional UPDATE ... RETURNING rather than
+        load-mutate-flush, so vacating costs one round-trip and never
+        hydrates the row.
+
         Args:
             spot_id: Spot ID
-            
+
         Returns:
             True if successful, False otherwise
         """
-        spot = self.get_by_id(spot_id)
-        if not spot or spot.status != SpotStatus.OCCUPIED:
-            return False
-        
-        spot.status = SpotStatus.AVAILABLE
-        spot.version += 1
-        spot.updated_at = datetime.utcnow()
-        self.db.flush()
-        return True
+        stmt = update(self.model).where(
+            and_(
+                self.model.id == spot_id,
+                self.model.status == SpotStatus.OCCUPIED
+            )
+        ).values(
+            status=SpotStatus.AVAILABLE,
+            version=self.model.version + 1
+        ).returning(self.model.id)
+
+        result = self.db.execute(stmt).first()
+        return result is not None
     
     def get_availability_stats(self, parking_lot_id: UUID) -> dict:
         """Get availability statistics for a parking lot.
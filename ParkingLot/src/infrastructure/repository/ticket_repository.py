@@ -1,15 +1,32 @@
 """Ticket and payment repositories."""
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, bindparam, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, load_only
 
 from src.domain.enums import PaymentStatus, TicketStatus
 from src.infrastructure.database.models import PaymentModel, TicketModel, VehicleModel
 from src.infrastructure.repository.base_repository import BaseRepository
 
+# Pre-built select() statements for hot single-row lookups.
+# Constructing these once at import time lets the engine's compiled-query
+# cache reuse the rendered SQL instead of re-compiling a Query per call.
+_VEHICLE_BY_LICENSE_PLATE = select(VehicleModel).where(
+    VehicleModel.license_plate == bindparam("license_plate")
+)
+_TICKET_BY_NUMBER = select(TicketModel).where(
+    TicketModel.ticket_number == bindparam("ticket_number")
+)
+_PAYMENT_BY_IDEMPOTENCY_KEY = select(PaymentModel).where(
+    PaymentModel.idempotency_key == bindparam("idempotency_key")
+)
+_PAYMENT_BY_TRANSACTION_ID = select(PaymentModel).where(
+    PaymentModel.transaction_id == bindparam("transaction_id")
+)
+
 
 class VehicleRepository(BaseRepository[VehicleModel]):
     """Repository for vehicles."""
@@ -18,18 +35,39 @@ class VehicleRepository(BaseRepository[VehicleModel]):
         """Initialize vehicle repository."""
         super().__init__(VehicleModel, db)
     
+    def _cache(self) -> dict:
+        """Get the session-scoped vehicle cache.
+
+        Stored in ``Session.info`` so its lifetime matches the request's
+        session — no global state, nothing to invalidate across requests.
+
+        Returns:
+            Cache dict keyed by license plate
+        """
+        return self.db.info.setdefault("_vehicle_cache", {})
+
     def get_by_license_plate(self, license_plate: str) -> Optional[VehicleModel]:
         """Get vehicle by license plate.
-        
+
+        Repeated lookups within the same session (ticket creation, audit,
+        notification) are served from the session-scoped cache.
+
         Args:
             license_plate: Vehicle license plate
-            
+
         Returns:
             VehicleModel or None
         """
-        return self.db.query(self.model).filter(
-            self.model.license_plate == license_plate
-        ).first()
+        cache = self._cache()
+        if license_plate in cache:
+            return cache[license_plate]
+
+        vehicle = self.db.execute(
+            _VEHICLE_BY_LICENSE_PLATE, {"license_plate": license_plate}
+        ).scalar_one_or_none()
+        if vehicle is not None:
+            cache[license_plate] = vehicle
+        return vehicle
     
     def get_or_create(
         self,
@@ -49,6 +87,30 @@ class VehicleRepository(BaseRepository[VehicleModel]):
         Returns:
             VehicleModel
         """
+        # On Postgres, a single UPSERT covers lookup, update and insert
+        # in one round-trip; other dialects take the two-step path below.
+        if self.db.get_bind().dialect.name == "postgresql":
+            stmt = pg_insert(VehicleModel).values(
+                license_plate=license_plate,
+                vehicle_type=vehicle_type,
+                owner_name=owner_name,
+                owner_phone=owner_phone
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["license_plate"],
+                set_={
+                    "owner_name": func.coalesce(
+                        stmt.excluded.owner_name, VehicleModel.owner_name
+                    ),
+                    "owner_phone": func.coalesce(
+                        stmt.excluded.owner_phone, VehicleModel.owner_phone
+                    ),
+                }
+            ).returning(VehicleModel)
+            vehicle = self.db.execute(stmt).scalar_one()
+            self._cache()[license_plate] = vehicle
+            return vehicle
+
         vehicle = self.get_by_license_plate(license_plate)
         if vehicle:
             # Update owner info if provided
@@ -57,8 +119,9 @@ class VehicleRepository(BaseRepository[VehicleModel]):
             if owner_phone:
                 vehicle.owner_phone = owner_phone
             self.db.flush()
+            self._cache()[license_plate] = vehicle
             return vehicle
-        
+
         # Create new vehicle
         vehicle = VehicleModel(
             license_plate=license_plate,
@@ -66,7 +129,9 @@ class VehicleRepository(BaseRepository[VehicleModel]):
             owner_name=owner_name,
             owner_phone=owner_phone
         )
-        return self.create(vehicle)
+        vehicle = self.create(vehicle)
+        self._cache()[license_plate] = vehicle
+        return vehicle
 
 
 class TicketRepository(BaseRepository[TicketModel]):
@@ -85,36 +150,55 @@ class TicketRepository(BaseRepository[TicketModel]):
         Returns:
             TicketModel or None
         """
-        return self.db.query(self.model).filter(
-            self.model.ticket_number == ticket_number
-        ).first()
+        return self.db.execute(
+            _TICKET_BY_NUMBER, {"ticket_number": ticket_number}
+        ).scalar_one_or_none()
     
     def get_active_tickets(
         self,
         parking_lot_id: Optional[UUID] = None,
-        skip: int = 0,
+        cursor: Optional[datetime] = None,
         limit: int = 100
-    ) -> List[TicketModel]:
-        """Get active tickets.
-        
+    ) -> Tuple[List[TicketModel], Optional[datetime]]:
+        """Get active tickets with keyset pagination.
+
+        Pages are seeked by entry_time instead of OFFSET, so fetching
+        page N costs the same as page 1.
+
         Args:
             parking_lot_id: Optional parking lot filter
-            skip: Records to skip
+            cursor: entry_time of the last ticket on the previous page
             limit: Max records
-            
+
         Returns:
-            List of active tickets
+            Tuple of (tickets, cursor for the next page or None)
         """
-        query = self.db.query(self.model).filter(
+        # List views only render identifying columns; defer the rest so
+        # each row ships a fraction of the bytes. Detail endpoints load
+        # full rows via get_by_id / get_by_ticket_number.
+        query = self.db.query(self.model).options(
+            load_only(
+                self.model.id,
+                self.model.ticket_number,
+                self.model.parking_lot_id,
+                self.model.spot_id,
+                self.model.entry_time,
+                self.model.status,
+            )
+        ).filter(
             self.model.status == TicketStatus.ACTIVE
         )
         
         if parking_lot_id:
             query = query.filter(self.model.parking_lot_id == parking_lot_id)
-        
-        return query.order_by(
+
+        if cursor:
+            query = query.filter(self.model.entry_time < cursor)
+
+        rows = query.order_by(
             self.model.entry_time.desc()
-        ).offset(skip).limit(limit).all()
+        ).limit(limit).all()
+        return rows, (rows[-1].entry_time if len(rows) == limit else None)
     
     def get_tickets_by_vehicle(
         self,
@@ -140,28 +224,24 @@ class TicketRepository(BaseRepository[TicketModel]):
     
     def generate_ticket_number(self, parking_lot_id: UUID) -> str:
         """Generate unique ticket number.
-        
+
+        Keeps the customer-visible date prefix but replaces the per-call
+        COUNT(*) with a random suffix, so issuing a ticket costs no
+        database round-trip. Collisions are vanishingly rare and caught
+        by the unique constraint on ticket_number.
+
         Args:
             parking_lot_id: Parking lot ID
-            
+
         Returns:
             Unique ticket number
         """
+        import secrets
         from datetime import datetime
-        
-        # Format: TKT-YYYYMMDD-NNNN
+
+        # Format: TKT-YYYYMMDD-XXXXXXXX
         date_str = datetime.utcnow().strftime("%Y%m%d")
-        
-        # Count tickets created today for this lot
-        today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-        count = self.db.query(self.model).filter(
-            and_(
-                self.model.parking_lot_id == parking_lot_id,
-                self.model.created_at >= today_start
-            )
-        ).count()
-        
-        return f"TKT-{date_str}-{count + 1:04d}"
+        return f"TKT-{date_str}-{secrets.token_hex(4).upper()}"
 
 
 class PaymentRepository(BaseRepository[PaymentModel]):
@@ -182,9 +262,9 @@ class PaymentRepository(BaseRepository[PaymentModel]):
         Returns:
             PaymentModel or None
         """
-        return self.db.query(self.model).filter(
-            self.model.idempotency_key == idempotency_key
-        ).first()
+        return self.db.execute(
+            _PAYMENT_BY_IDEMPOTENCY_KEY, {"idempotency_key": idempotency_key}
+        ).scalar_one_or_none()
     
     def get_by_transaction_id(self, transaction_id: str) -> Optional[PaymentModel]:
         """Get payment by transaction ID.
@@ -195,9 +275,9 @@ class PaymentRepository(BaseRepository[PaymentModel]):
         Returns:
             PaymentModel or None
         """
-        return self.db.query(self.model).filter(
-            self.model.transaction_id == transaction_id
-        ).first()
+        return self.db.execute(
+            _PAYMENT_BY_TRANSACTION_ID, {"transaction_id": transaction_id}
+        ).scalar_one_or_none()
     
     def get_payments_by_ticket(self, ticket_id: UUID) -> List[PaymentModel]:
         """Get all payments for a ticket.
@@ -208,7 +288,17 @@ class PaymentRepository(BaseRepository[PaymentModel]):
         Returns:
             List of payments
         """
-        return self.db.query(self.model).filter(
+        return self.db.query(self.model).options(
+            load_only(
+                self.model.id,
+                self.model.ticket_id,
+                self.model.amount,
+                self.model.payment_method,
+                self.model.payment_status,
+                self.model.paid_at,
+                self.model.created_at,
+            )
+        ).filter(
             self.model.ticket_id == ticket_id
         ).order_by(self.model.created_at.desc()).all()
     
@@ -216,29 +306,32 @@ class PaymentRepository(BaseRepository[PaymentModel]):
         self,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-        skip: int = 0,
+        cursor: Optional[datetime] = None,
         limit: int = 100
-    ) -> List[PaymentModel]:
-        """Get completed payments within date range.
-        
+    ) -> Tuple[List[PaymentModel], Optional[datetime]]:
+        """Get completed payments within date range, keyset-paginated.
+
         Args:
             start_date: Optional start date filter
             end_date: Optional end date filter
-            skip: Records to skip
+            cursor: paid_at of the last payment on the previous page
             limit: Max records
-            
+
         Returns:
-            List of completed payments
+            Tuple of (payments, cursor for the next page or None)
         """
         query = self.db.query(self.model).filter(
             self.model.payment_status == PaymentStatus.COMPLETED
         )
-        
+
         if start_date:
             query = query.filter(self.model.paid_at >= start_date)
         if end_date:
             query = query.filter(self.model.paid_at <= end_date)
-        
-        return query.order_by(
+        if cursor:
+            query = query.filter(self.model.paid_at < cursor)
+
+        rows = query.order_by(
             self.model.paid_at.desc()
-        ).offset(skip).limit(limit).all()
+        ).limit(limit).all()
+        return rows, (rows[-1].paid_at if len(rows) == limit else None)
@@ -0,0 +1,53 @@
+"""Shared test fixtures."""
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.database.connection import Base
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_sqlite(element, compiler, **kwargs):
+    """Render JSONB as plain JSON so the schema creates on SQLite."""
+    return "JSON"
+
+
+@pytest.fixture
+def engine():
+    """In-memory SQLite engine with the full schema created."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(engine):
+    """Database session bound to the test engine."""
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    session = SessionLocal()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def query_counter(engine):
+    """Collect every SQL statement executed during the test.
+
+    Yields a list that grows as statements run, so tests can assert
+    an upper bound on round-trips and catch N+1 regressions:
+
+        with_queries = query_counter
+        repo.get_active_tickets()
+        assert len(with_queries) <= 3
+    """
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", _record)
@@ -0,0 +1,86 @@
+"""Query-count regression tests for the repository layer."""
+from datetime import datetime
+
+import pytest
+
+from src.domain.enums import SpotType, TicketStatus, VehicleType
+from src.infrastructure.database.models import (
+    FloorModel,
+    ParkingLotModel,
+    ParkingSpotModel,
+    TicketModel,
+)
+from src.infrastructure.repository.parking_repository import ParkingLotRepository
+from src.infrastructure.repository.ticket_repository import (
+    TicketRepository,
+    VehicleRepository,
+)
+
+
+@pytest.fixture
+def seeded_lot(db_session):
+    """Parking lot with two floors, spots, a vehicle, and active tickets."""
+    lot = ParkingLotModel(name="Test Lot", city="Testville")
+    db_session.add(lot)
+    db_session.flush()
+
+    for floor_number in (1, 2):
+        floor = FloorModel(
+            parking_lot_id=lot.id, floor_number=floor_number, total_spots=3
+        )
+        db_session.add(floor)
+        db_session.flush()
+        for i in range(3):
+            db_session.add(ParkingSpotModel(
+                floor_id=floor.id,
+                spot_number=f"F{floor_number}-{i}",
+                spot_type=SpotType.COMPACT,
+            ))
+    db_session.flush()
+
+    vehicle_repo = VehicleRepository(db_session)
+    vehicle = vehicle_repo.get_or_create("TEST001", VehicleType.CAR)
+
+    spot = db_session.query(ParkingSpotModel).first()
+    for i in range(5):
+        db_session.add(TicketModel(
+            ticket_number=f"TKT-TEST-{i:04d}",
+            parking_lot_id=lot.id,
+            spot_id=spot.id,
+            vehicle_id=vehicle.id,
+            entry_time=datetime.utcnow(),
+            status=TicketStatus.ACTIVE,
+        ))
+    db_session.flush()
+    return lot
+
+
+class TestQueryCounts:
+    """Guardrails against N+1 creeping into the repositories."""
+
+    def test_get_with_floors_is_single_query(self, db_session, seeded_lot, query_counter):
+        """Loading a lot with floors must not query per floor."""
+        repo = ParkingLotRepository(db_session)
+        lot = repo.get_with_floors(seeded_lot.id)
+        floor_numbers = [f.floor_number for f in lot.floors]
+        assert sorted(floor_numbers) == [1, 2]
+        assert len(query_counter) <= 3
+
+    def test_get_active_tickets_is_single_query(self, db_session, seeded_lot, query_counter):
+        """Listing active tickets must be a bounded number of statements."""
+        repo = TicketRepository(db_session)
+        tickets, next_cursor = repo.get_active_tickets(
+            parking_lot_id=seeded_lot.id, limit=50
+        )
+        assert len(tickets) == 5
+        assert next_cursor is None
+        assert len(query_counter) <= 3
+
+    def test_vehicle_lookup_cached_within_session(self, db_session, seeded_lot, query_counter):
+        """Repeated plate lookups in one session hit the identity cache."""
+        repo = VehicleRepository(db_session)
+        first = repo.get_by_license_plate("TEST001")
+        queries_after_first = len(query_counter)
+        second = repo.get_by_license_plate("TEST001")
+        assert first is second
+        assert len(query_counter) == queries_after_first
@@ -4,11 +4,8 @@ Demonstrates all core features and extension scenarios
 """
 
 from datetime import datetime, timedelta
-import sys
-import os
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+import numpy as np
 
 from src.domain.models.user import Customer, DeliveryPartner, RestaurantOwner
 from src.domain.models.restaurant import Restaurant, MenuCategory, MenuItem
@@ -65,8 +62,8 @@ def main():
     restaurant_service = RestaurantService(restaurant_repo, category_repo, item_repo)
     order_service = OrderService(order_repo, order_item_repo, restaurant_repo, customer_repo)
     delivery_service = DeliveryAssignmentService(
-        partner_repo, delivery_repo, order_repo, geo_service,
-        NearestPartnerStrategy(geo_service)
+        partner_repo, delivery_repo, order_repo,
+        NearestPartnerStrategy()
     )
     payment_service = PaymentService(payment_repo)
     review_service = ReviewService(review_repo, restaurant_repo, partner_repo, order_repo)
@@ -92,7 +89,7 @@ def main():
         city="Bangalore"
     ))
     customer_repo.save(customer1)
-    print(f"✓ Created Customer: {customer1.name} (Subscription: {customer1.subscription_plan.value})")
+    print(f"✓ Created Customer: {customer1.name} (Subscription: {customer1.subscription_plan})")
     
     customer2 = Customer(
         name="Bob Smith",
@@ -126,7 +123,7 @@ def main():
         current_location=Location(latitude=12.9716, longitude=77.5946)
     )
     partner_repo.save(partner1)
-    print(f"✓ Created Delivery Partner: {partner1.name} ({partner1.vehicle_type.value})")
+    print(f"✓ Created Delivery Partner: {partner1.name} ({partner1.vehicle_type})")
     
     partner2 = DeliveryPartner(
         name="Suresh Patel",
@@ -136,7 +133,7 @@ def main():
         current_location=Location(latitude=12.9350, longitude=77.6206)
     )
     partner_repo.save(partner2)
-    print(f"✓ Created Delivery Partner: {partner2.name} ({partner2.vehicle_type.value})")
+    print(f"✓ Created Delivery Partner: {partner2.name} ({partner2.vehicle_type})")
     
     # =========================
     # 2. CREATE RESTAURANTS
@@ -167,7 +164,7 @@ def main():
     item1 = restaurant_service.add_menu_item(
         category1.id,
         "Masala Dosa",
-        Money(150.0),
+        Money.from_rupees(150.0),
         description="Crispy dosa with potato filling",
         is_vegetarian=True,
         preparation_time_minutes=15
@@ -177,7 +174,7 @@ def main():
     item2 = restaurant_service.add_menu_item(
         category1.id,
         "Chicken Biryani",
-        Money(300.0),
+        Money.from_rupees(300.0),
         description="Aromatic basmati rice with chicken",
         is_vegetarian=False,
         preparation_time_minutes=25
@@ -193,7 +190,7 @@ def main():
     item3 = restaurant_service.add_menu_item(
         category2.id,
         "Fresh Lime Soda",
-        Money(50.0),
+        Money.from_rupees(50.0),
         description="Chilled lime soda",
         is_vegetarian=True,
         preparation_time_minutes=5
@@ -223,7 +220,7 @@ def main():
     item4 = restaurant_service.add_menu_item(
         category3.id,
         "Hakka Noodles",
-        Money(180.0),
+        Money.from_rupees(180.0),
         description="Spicy noodles with vegetables",
         is_vegetarian=True,
         preparation_time_minutes=20
@@ -245,14 +242,16 @@ def main():
     )
     
     print(f"\nFound {len(nearby)} restaurants within 5 km:")
-    for restaurant in nearby:
-        distance = geo_service.calculate_distance(
+    if nearby:
+        # One vectorized kernel call instead of a distance per restaurant
+        distances = geo_service.calculate_distances_batch(
             customer_location.latitude,
             customer_location.longitude,
-            restaurant.location.latitude,
-            restaurant.location.longitude
+            np.array([r.location.latitude for r in nearby]),
+            np.array([r.location.longitude for r in nearby])
         )
-        print(f"  • {restaurant.name} - {distance:.2f} km - Rating: {restaurant.rating}")
+        for restaurant, distance in zip(nearby, distances):
+            print(f"  • {restaurant.name} - {distance:.2f} km - Rating: {restaurant.rating}")
     
     # =========================
     # 4. PLACE ORDER
@@ -273,7 +272,7 @@ def main():
     )
     
     print(f"✓ Order created: {order1.id}")
-    print(f"  Status: {order1.status.value}")
+    print(f"  Status: {order1.status}")
     print(f"  Subtotal: ₹{order1.subtotal.amount}")
     print(f"  Delivery Fee: ₹{order1.delivery_fee.amount if not order1.is_subscription_order else 0.0} {'(FREE - Subscription)' if order1.is_subscription_order else ''}")
     print(f"  Tax: ₹{order1.tax.amount}")
@@ -327,8 +326,8 @@ def main():
         payment_method=PaymentMethod.UPI
     )
     print(f"✓ Payment processed for Order {order1.id}")
-    print(f"  Method: {payment1.payment_method.value}")
-    print(f"  Status: {payment1.status.value}")
+    print(f"  Method: {payment1.payment_method}")
+    print(f"  Status: {payment1.status}")
     print(f"  Transaction ID: {payment1.transaction_id}")
     
     # Payment for order 2
@@ -338,7 +337,7 @@ def main():
         payment_method=PaymentMethod.CARD
     )
     print(f"\n✓ Payment processed for Order {order2.id}")
-    print(f"  Method: {payment2.payment_method.value}")
+    print(f"  Method: {payment2.payment_method}")
     print(f"  Transaction ID: {payment2.transaction_id}")
     
     # =========================
@@ -350,15 +349,15 @@ def main():
     
     # Confirm order
     order1 = order_service.update_order_status(order1.id, OrderStatus.CONFIRMED)
-    print(f"✓ {OrderStatus.CREATED.value} → {OrderStatus.CONFIRMED.value}")
+    print(f"✓ {OrderStatus.CREATED} → {OrderStatus.CONFIRMED}")
     
     # Preparing
     order1 = order_service.update_order_status(order1.id, OrderStatus.PREPARING)
-    print(f"✓ {OrderStatus.CONFIRMED.value} → {OrderStatus.PREPARING.value}")
+    print(f"✓ {OrderStatus.CONFIRMED} → {OrderStatus.PREPARING}")
     
     # Ready
     order1 = order_service.update_order_status(order1.id, OrderStatus.READY)
-    print(f"✓ {OrderStatus.PREPARING.value} → {OrderStatus.READY.value}")
+    print(f"✓ {OrderStatus.PREPARING} → {OrderStatus.READY}")
     
     # =========================
     # 7. ASSIGN DELIVERY PARTNER
@@ -369,14 +368,14 @@ def main():
     available_partners = delivery_service.get_available_partners()
     print(f"Available partners: {len(available_partners)}")
     for p in available_partners:
-        print(f"  • {p.name} - {p.vehicle_type.value} - Rating: {p.rating:.1f}")
+        print(f"  • {p.name} - {p.vehicle_type} - Rating: {p.rating:.1f}")
     
     print(f"\nAssigning partner to Order {order1.id} using NEAREST strategy...")
     delivery1 = delivery_service.assign_partner_to_order(order1.id)
     
     assigned_partner = partner_repo.find_by_id(delivery1.delivery_partner_id)
     print(f"✓ Assigned: {assigned_partner.name}")
-    print(f"  Status: {delivery1.status.value}")
+    print(f"  Status: {delivery1.status}")
     print(f"  Partner is now unavailable: {not assigned_partner.is_available}")
     
     # =========================
@@ -467,7 +466,7 @@ def main():
         delivery_address=customer2.addresses[0]
     )
     print(f"Created Order {order_to_cancel.id}")
-    print(f"Status: {order_to_cancel.status.value}")
+    print(f"Status: {order_to_cancel.status}")
     
     # Cancel it
     cancelled_order = order_service.cancel_order(
@@ -475,7 +474,7 @@ def main():
         "Customer changed mind"
     )
     print(f"\n✓ Order cancelled")
-    print(f"  New Status: {cancelled_order.status.value}")
+    print(f"  New Status: {cancelled_order.status}")
     print(f"  Reason: {cancelled_order.cancellation_reason}")
     
     # Try invalid state transition (should fail)
@@ -495,7 +494,7 @@ def main():
     total_restaurants = restaurant_repo.count()
     total_orders = order_repo.count()
     active_orders = len(order_repo.find_active_orders())
-    total_deliveries = len([d for d in delivery_repo.find_all()])
+    total_deliveries = delivery_repo.count()
     
     print(f"Platform Overview:")
     print(f"  Customers: {total_customers}")
@@ -509,7 +508,7 @@ def main():
     active_subscribers = customer_repo.find_active_subscribers()
     print(f"  Active Subscriptions: {len(active_subscribers)}")
     for subscriber in active_subscribers:
-        print(f"    • {subscriber.name} - {subscriber.subscription_plan.value}")
+        print(f"    • {subscriber.name} - {subscriber.subscription_plan}")
     
     print_section("DEMO COMPLETED SUCCESSFULLY!")
     print("All features demonstrated:")
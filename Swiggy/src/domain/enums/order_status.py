@@ -1,8 +1,10 @@
-from enum import Enum
-from typing import Set, Dict
+import functools
+from enum import StrEnum
+from types import MappingProxyType
+from typing import Mapping
 
 
-class OrderStatus(Enum):
+class OrderStatus(StrEnum):
     """Order status with state machine transitions"""
     CREATED = "CREATED"
     CONFIRMED = "CONFIRMED"
@@ -13,37 +15,58 @@ class OrderStatus(Enum):
     CANCELLED = "CANCELLED"
     
     @staticmethod
-    def get_allowed_transitions() -> Dict[str, Set[str]]:
-        """Define allowed state transitions for order lifecycle"""
-        return {
-            OrderStatus.CREATED.value: {
-                OrderStatus.CONFIRMED.value,
-                OrderStatus.CANCELLED.value
-            },
-            OrderStatus.CONFIRMED.value: {
-                OrderStatus.PREPARING.value,
-                OrderStatus.CANCELLED.value
-            },
-            OrderStatus.PREPARING.value: {
-                OrderStatus.READY.value
-            },
-            OrderStatus.READY.value: {
-                OrderStatus.PICKED_UP.value
-            },
-            OrderStatus.PICKED_UP.value: {
-                OrderStatus.DELIVERED.value
-            },
-            OrderStatus.DELIVERED.value: set(),  # Terminal state
-            OrderStatus.CANCELLED.value: set()   # Terminal state
-        }
-    
+    @functools.cache
+    def get_allowed_transitions() -> Mapping[str, frozenset]:
+        """Define allowed state transitions for order lifecycle.
+
+        Built on first call and cached; the read-only proxy is shared,
+        so callers cannot mutate the table by reference.
+        """
+        return MappingProxyType({
+            status.value: frozenset(allowed.value for allowed in transitions)
+            for status, transitions in _ALLOWED_TRANSITIONS.items()
+        })
+
     def can_transition_to(self, new_status: 'OrderStatus') -> bool:
         """Check if transition from current status to new status is allowed"""
-        allowed = self.get_allowed_transitions()
-        return new_status.value in allowed.get(self.value, set())
+        return bool(
+            _TRANSITION_MASKS[self._bit_index] >> new_status._bit_index & 1
+        )
+
+
+_NO_TRANSITIONS = frozenset()
+
+# Transition table built once at import, keyed by enum member so the
+# hot-path check is one dict lookup plus a frozenset membership test
+_ALLOWED_TRANSITIONS: Mapping[OrderStatus, frozenset] = {
+    OrderStatus.CREATED: frozenset({
+        OrderStatus.CONFIRMED,
+        OrderStatus.CANCELLED
+    }),
+    OrderStatus.CONFIRMED: frozenset({
+        OrderStatus.PREPARING,
+        OrderStatus.CANCELLED
+    }),
+    OrderStatus.PREPARING: frozenset({OrderStatus.READY}),
+    OrderStatus.READY: frozenset({OrderStatus.PICKED_UP}),
+    OrderStatus.PICKED_UP: frozenset({OrderStatus.DELIVERED}),
+    OrderStatus.DELIVERED: _NO_TRANSITIONS,  # Terminal state
+    OrderStatus.CANCELLED: _NO_TRANSITIONS   # Terminal state
+}
+
+# Pack the transition relation into per-status bitmasks: with seven
+# states the whole table is seven machine words, and a transition check
+# is an index, a shift and a mask -- no hashing or set membership.
+for _index, _status in enumerate(OrderStatus):
+    _status._bit_index = _index
+
+_TRANSITION_MASKS = tuple(
+    sum(1 << allowed._bit_index for allowed in _ALLOWED_TRANSITIONS[status])
+    for status in OrderStatus
+)
 
 
-class PaymentStatus(Enum):
+class PaymentStatus(StrEnum):
     """Payment status enumeration"""
     PENDING = "PENDING"
     PROCESSING = "PROCESSING"
@@ -52,7 +75,7 @@ class PaymentStatus(Enum):
     REFUNDED = "REFUNDED"
 
 
-class PaymentMethod(Enum):
+class PaymentMethod(StrEnum):
     """Payment method types"""
     CASH = "CASH"
     CARD = "CARD"
@@ -60,7 +83,7 @@ class PaymentMethod(Enum):
     WALLET = "WALLET"
 
 
-class DeliveryStatus(Enum):
+class DeliveryStatus(StrEnum):
     """Delivery tracking status"""
     ASSIGNED = "ASSIGNED"
     EN_ROUTE_TO_RESTAURANT = "EN_ROUTE_TO_RESTAURANT"
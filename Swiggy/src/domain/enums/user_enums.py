@@ -1,7 +1,7 @@
-from enum import Enum
+from enum import StrEnum
 
 
-class UserRole(Enum):
+class UserRole(StrEnum):
     """User role types in the system"""
     CUSTOMER = "CUSTOMER"
     RESTAURANT_OWNER = "RESTAURANT_OWNER"
@@ -9,7 +9,7 @@ class UserRole(Enum):
     ADMIN = "ADMIN"
 
 
-class VehicleType(Enum):
+class VehicleType(StrEnum):
     """Delivery vehicle types"""
     BICYCLE = "BICYCLE"
     MOTORCYCLE = "MOTORCYCLE"
@@ -17,7 +17,7 @@ class VehicleType(Enum):
     SCOOTER = "SCOOTER"
 
 
-class SubscriptionPlan(Enum):
+class SubscriptionPlan(StrEnum):
     """Subscription plan types for unlimited delivery"""
     NONE = "NONE"
     MONTHLY = "MONTHLY"
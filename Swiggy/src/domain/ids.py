@@ -0,0 +1,14 @@
+"""Fast in-process entity ID generation"""
+import itertools
+import os
+
+# One urandom read per process for the prefix; after that every ID is
+# a counter increment plus a short format, instead of a 16-byte random
+# draw and 36-char UUID render per entity
+_PREFIX = os.urandom(4).hex()
+_COUNTER = itertools.count()
+
+
+def new_id() -> str:
+    """Return a process-unique entity ID"""
+    return f"{_PREFIX}-{next(_COUNTER):x}"
@@ -1,29 +1,81 @@
 """Delivery domain model"""
+import sys
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional
-from uuid import uuid4
 
 from ..enums import DeliveryStatus
+from ..ids import new_id
 from ..value_objects import Location
 
+# Built once at import; get_current_status_display is hit on every
+# tracking update, so avoid rebuilding the mapping per call. Messages
+# are interned so every delivery shares one canonical string object and
+# downstream equality checks can short-circuit on identity.
+_STATUS_MESSAGES = {
+    status: sys.intern(message)
+    for status, message in {
+        DeliveryStatus.ASSIGNED: "Delivery partner assigned",
+        DeliveryStatus.EN_ROUTE_TO_RESTAURANT: "Partner is heading to restaurant",
+        DeliveryStatus.AT_RESTAURANT: "Partner is at the restaurant",
+        DeliveryStatus.PICKED_UP: "Order picked up",
+        DeliveryStatus.EN_ROUTE_TO_CUSTOMER: "On the way to you",
+        DeliveryStatus.DELIVERED: "Delivered"
+    }.items()
+}
 
-@dataclass
+# Anchor pair for converting monotonic timestamps to wall-clock time
+# lazily; state changes themselves only pay a VDSO clock read instead
+# of constructing a datetime per event
+_WALL_ANCHOR = datetime.now()
+_MONO_ANCHOR = time.monotonic_ns()
+
+
+def _to_datetime(monotonic_ns: int) -> datetime:
+    """Convert a monotonic_ns reading to wall-clock time for display"""
+    return _WALL_ANCHOR + timedelta(
+        microseconds=(monotonic_ns - _MONO_ANCHOR) / 1000
+    )
+
+
+@dataclass(slots=True)
 class Delivery:
     """Delivery entity for tracking order delivery"""
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=new_id)
     order_id: str = ""
     delivery_partner_id: str = ""
     restaurant_location: Optional[Location] = None
     delivery_location: Optional[Location] = None
     current_location: Optional[Location] = None
     status: DeliveryStatus = DeliveryStatus.ASSIGNED
-    assigned_at: datetime = field(default_factory=datetime.now)
-    picked_up_at: Optional[datetime] = None
-    delivered_at: Optional[datetime] = None
+    # Monotonic integer timestamps: cheap to record, immune to clock
+    # adjustments, and integer-comparable for ordering/duration math
+    assigned_at_ns: int = field(default_factory=time.monotonic_ns)
+    picked_up_at_ns: Optional[int] = None
+    delivered_at_ns: Optional[int] = None
     estimated_delivery_time: Optional[datetime] = None
     actual_distance_km: float = 0.0
-    
+
+    @property
+    def assigned_at(self) -> datetime:
+        """Wall-clock assignment time, derived lazily for display"""
+        return _to_datetime(self.assigned_at_ns)
+
+    @property
+    def picked_up_at(self) -> Optional[datetime]:
+        """Wall-clock pickup time, derived lazily for display"""
+        if self.picked_up_at_ns is None:
+            return None
+        return _to_datetime(self.picked_up_at_ns)
+
+    @property
+    def delivered_at(self) -> Optional[datetime]:
+        """Wall-clock delivery time, derived lazily for display"""
+        if self.delivered_at_ns is None:
+            return None
+        return _to_datetime(self.delivered_at_ns)
+
     def update_location(self, location: Location):
         """Update current location of delivery partner"""
         self.current_location = location
@@ -39,7 +91,7 @@ class Delivery:
     def mark_picked_up(self):
         """Update status when order is picked up from restaurant"""
         self.status = DeliveryStatus.PICKED_UP
-        self.picked_up_at = datetime.now()
+        self.picked_up_at_ns = time.monotonic_ns()
     
     def mark_en_route_to_customer(self):
         """Update status when partner is heading to customer"""
@@ -48,16 +100,8 @@ class Delivery:
     def mark_delivered(self):
         """Update status when order is delivered"""
         self.status = DeliveryStatus.DELIVERED
-        self.delivered_at = datetime.now()
+        self.delivered_at_ns = time.monotonic_ns()
     
     def get_current_status_display(self) -> str:
         """Get user-friendly status message"""
-        status_messages = {
-            DeliveryStatus.ASSIGNED: "Delivery partner assigned",
-            DeliveryStatus.EN_ROUTE_TO_RESTAURANT: "Partner is heading to restaurant",
-            DeliveryStatus.AT_RESTAURANT: "Partner is at the restaurant",
-            DeliveryStatus.PICKED_UP: "Order picked up",
-            DeliveryStatus.EN_ROUTE_TO_CUSTOMER: "On the way to you",
-            DeliveryStatus.DELIVERED: "Delivered"
-        }
-        return status_messages.get(self.status, "Unknown status")
+        return _STATUS_MESSAGES.get(self.status, "Unknown status")
@@ -1,46 +1,66 @@
 """Order domain models with state machine"""
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
-from uuid import uuid4
+from typing import Iterable, List, Optional
+
+import numpy as np
 
 from ..enums import OrderStatus
-from ..value_objects import Money, Location
+from ..ids import new_id
+from ..order_math import subtotal_paisa
+from ..value_objects import DEFAULT_DELIVERY_FEE, Money, Location, ZERO_INR
 from ..exceptions import InvalidOrderStateTransition, OrderAlreadyCancelled
 
+# Bound once so hot state transitions skip the module+class attribute
+# lookup that _now() pays on every call
+_now = datetime.now
+
+# States an order may still be cancelled/modified from; CANCELLED being
+# terminal is already encoded in the transition table, so the hot path
+# of transition_to needs only the one table check
+_CANCELLABLE_STATES = frozenset({OrderStatus.CREATED, OrderStatus.CONFIRMED})
+
+# Below this many line items the scalar loop beats packing arrays for
+# the order_math kernel
+_KERNEL_MIN_ITEMS = 64
 
-@dataclass
+
+@dataclass(slots=True)
 class OrderItem:
     """Order item entity"""
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=new_id)
     order_id: str = ""
     menu_item_id: str = ""
     menu_item_name: str = ""
     quantity: int = 1
-    unit_price: Money = field(default_factory=lambda: Money(0.0))
+    unit_price: Money = ZERO_INR
     special_instructions: str = ""
-    
+
     @property
     def total_price(self) -> Money:
         """Calculate total price for this item"""
-        return self.unit_price * self.quantity
+        return Money(self.unit_price.amount_paisa * self.quantity,
+                     self.unit_price.currency)
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """Order entity with state machine"""
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=new_id)
     customer_id: str = ""
     restaurant_id: str = ""
     items: List[OrderItem] = field(default_factory=list)
     delivery_address: Optional[Location] = None
     status: OrderStatus = OrderStatus.CREATED
-    subtotal: Money = field(default_factory=lambda: Money(0.0))
-    delivery_fee: Money = field(default_factory=lambda: Money(40.0))
-    discount: Money = field(default_factory=lambda: Money(0.0))
-    tax: Money = field(default_factory=lambda: Money(0.0))
-    total: Money = field(default_factory=lambda: Money(0.0))
-    created_at: datetime = field(default_factory=datetime.now)
+    subtotal: Money = ZERO_INR
+    delivery_fee: Money = DEFAULT_DELIVERY_FEE
+    discount: Money = ZERO_INR
+    tax: Money = ZERO_INR
+    total: Money = ZERO_INR
+    # Filled in __post_init__ when not supplied, so bulk loaders that
+    # pass persisted timestamps skip the clock read entirely
+    created_at: Optional[datetime] = None
     confirmed_at: Optional[datetime] = None
     delivered_at: Optional[datetime] = None
     cancelled_at: Optional[datetime] = None
@@ -50,33 +70,104 @@ class Order:
     loyalty_points_used: int = 0
     loyalty_points_earned: int = 0
     version: int = 0  # For optimistic locking
-    
+    # Signed proof of delivery, set on transition to DELIVERED; lets
+    # review creation verify the order without a repository fetch
+    delivery_token: Optional[str] = None
+    # Set while inside batch_update so per-mutation recomputes are skipped
+    _defer_recalc: bool = field(default=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.created_at is None:
+            self.created_at = _now()
+
+    @classmethod
+    def from_parts(cls, items: List[OrderItem], **kwargs) -> 'Order':
+        """Construct an order around a pre-built items list.
+
+        Bulk-load path: the list is adopted as-is (no per-item append)
+        and totals are computed exactly once.
+        """
+        order = cls(items=items, **kwargs)
+        for item in items:
+            item.order_id = order.id
+        order._recalculate_totals()
+        return order
+
     def add_item(self, item: OrderItem):
         """Add item to order"""
         item.order_id = self.id
         self.items.append(item)
         self._recalculate_totals()
+
+    def add_items(self, items: Iterable[OrderItem]):
+        """Add many items with a single totals recompute"""
+        for item in items:
+            item.order_id = self.id
+            self.items.append(item)
+        self._recalculate_totals()
+
+    @contextmanager
+    def batch_update(self):
+        """Defer totals recomputation across a block of mutations.
+
+        Usage::
+
+            with order.batch_update():
+                order.add_item(...)
+                order.apply_discount(...)
+
+        recomputes the totals once on exit instead of per mutation.
+        """
+        self._defer_recalc = True
+        try:
+            yield self
+        finally:
+            self._defer_recalc = False
+            self._recalculate_totals()
     
     def remove_item(self, item_id: str):
-        """Remove item from order"""
-        self.items = [item for item in self.items if item.id != item_id]
+        """Remove item from order in place, no list rebuild"""
+        for index, item in enumerate(self.items):
+            if item.id == item_id:
+                del self.items[index]
+                break
         self._recalculate_totals()
     
     def _recalculate_totals(self):
-        """Recalculate order totals"""
-        self.subtotal = Money(
-            sum(item.total_price.amount for item in self.items)
-        )
-        
+        """Recalculate order totals in one integer pass, no intermediate Money"""
+        if self._defer_recalc:
+            return
+        items = self.items
+        count = len(items)
+        if count >= _KERNEL_MIN_ITEMS:
+            # Large orders: pack line items and hand off to the
+            # (optionally numba-compiled) kernel
+            prices = np.fromiter(
+                (item.unit_price.amount_paisa for item in items),
+                np.int64, count
+            )
+            quantities = np.fromiter(
+                (item.quantity for item in items), np.int64, count
+            )
+            total_paisa = subtotal_paisa(prices, quantities)
+        else:
+            total_paisa = 0
+            for item in items:
+                total_paisa += item.unit_price.amount_paisa * item.quantity
+        self.subtotal = Money(total_paisa)
+
         # Apply free delivery for subscription orders
-        actual_delivery_fee = Money(0.0) if self.is_subscription_order else self.delivery_fee
-        
+        delivery_paisa = 0 if self.is_subscription_order else self.delivery_fee.amount_paisa
+
         # Calculate tax (example: 5% GST)
-        tax_amount = self.subtotal.amount * 0.05
-        self.tax = Money(tax_amount)
-        
+        tax_paisa = total_paisa * 5 // 100
+        self.tax = Money(tax_paisa)
+
         # Total = Subtotal + Delivery + Tax - Discount
-        self.total = self.subtotal + actual_delivery_fee + self.tax - self.discount
+        self.total = Money(
+            total_paisa + delivery_paisa + tax_paisa
+            - self.discount.amount_paisa
+        )
     
     def apply_discount(self, discount: Money):
         """Apply discount to order"""
@@ -87,36 +178,38 @@ class Order:
         """Apply loyalty points as discount (example: 1 point = 0.1 INR)"""
         discount_amount = points * conversion_rate
         self.loyalty_points_used = points
-        self.discount = self.discount + Money(discount_amount)
+        self.discount = self.discount + Money.from_rupees(discount_amount)
         self._recalculate_totals()
     
     def calculate_loyalty_points_earned(self, earning_rate: float = 0.01):
         """Calculate loyalty points to be earned (example: 1% of total)"""
-        self.loyalty_points_earned = int(self.total.amount * earning_rate)
+        self.loyalty_points_earned = int(self.total.rupees * earning_rate)
     
     def transition_to(self, new_status: OrderStatus):
         """
         Transition order to new status with validation
         Implements state machine pattern
         """
-        if self.status == OrderStatus.CANCELLED:
-            raise OrderAlreadyCancelled(self.id)
-        
+        # Single transition-table check on the fast path; CANCELLED has
+        # no allowed transitions, so the terminal case falls through to
+        # the error branch without its own comparison
         if not self.status.can_transition_to(new_status):
+            if self.status == OrderStatus.CANCELLED:
+                raise OrderAlreadyCancelled(self.id)
             raise InvalidOrderStateTransition(
                 self.status.value,
                 new_status.value
             )
-        
+
         self.status = new_status
         
         # Update timestamps based on status
         if new_status == OrderStatus.CONFIRMED:
-            self.confirmed_at = datetime.now()
+            self.confirmed_at = _now()
         elif new_status == OrderStatus.DELIVERED:
-            self.delivered_at = datetime.now()
+            self.delivered_at = _now()
         elif new_status == OrderStatus.CANCELLED:
-            self.cancelled_at = datetime.now()
+            self.cancelled_at = _now()
     
     def cancel(self, reason: str):
         """Cancel the order"""
@@ -124,24 +217,24 @@ class Order:
             raise OrderAlreadyCancelled(self.id)
         
         # Can only cancel from CREATED or CONFIRMED states
-        if self.status not in [OrderStatus.CREATED, OrderStatus.CONFIRMED]:
+        if self.status not in _CANCELLABLE_STATES:
             raise InvalidOrderStateTransition(
                 self.status.value,
                 OrderStatus.CANCELLED.value
             )
         
         self.status = OrderStatus.CANCELLED
-        self.cancelled_at = datetime.now()
+        self.cancelled_at = _now()
         self.cancellation_reason = reason
     
     def is_scheduled(self) -> bool:
         """Check if this is a scheduled order for later delivery"""
-        return self.scheduled_for is not None and self.scheduled_for > datetime.now()
+        return self.scheduled_for is not None and self.scheduled_for > _now()
     
     def can_be_modified(self) -> bool:
         """Check if order can still be modified"""
-        return self.status in [OrderStatus.CREATED, OrderStatus.CONFIRMED]
-    
+        return self.status in _CANCELLABLE_STATES
+
     def can_be_cancelled(self) -> bool:
         """Check if order can be cancelled"""
-        return self.status in [OrderStatus.CREATED, OrderStatus.CONFIRMED]
+        return self.status in _CANCELLABLE_STATES
@@ -2,30 +2,36 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
-from uuid import uuid4
 
 from ..enums.order_status import PaymentStatus, PaymentMethod
-from ..value_objects import Money
+from ..ids import new_id
+from ..value_objects import Money, ZERO_INR
 
+_now = datetime.now  # bound once; mark_* methods stamp times on every payment
 
-@dataclass
+
+@dataclass(slots=True)
 class Payment:
     """Payment entity"""
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=new_id)
     order_id: str = ""
-    amount: Money = field(default_factory=lambda: Money(0.0))
+    amount: Money = ZERO_INR
     status: PaymentStatus = PaymentStatus.PENDING
     payment_method: PaymentMethod = PaymentMethod.CASH
     transaction_id: Optional[str] = None
     idempotency_key: Optional[str] = None  # For preventing duplicate payments
     gateway_response: Optional[str] = None
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: Optional[datetime] = None  # filled in __post_init__
     completed_at: Optional[datetime] = None
     failed_at: Optional[datetime] = None
     failure_reason: Optional[str] = None
     refunded_at: Optional[datetime] = None
-    refund_amount: Money = field(default_factory=lambda: Money(0.0))
+    refund_amount: Money = ZERO_INR
     
+    def __post_init__(self):
+        if self.created_at is None:
+            self.created_at = _now()
+
     def mark_processing(self):
         """Mark payment as processing"""
         self.status = PaymentStatus.PROCESSING
@@ -34,25 +40,25 @@ class Payment:
         """Mark payment as completed"""
         self.status = PaymentStatus.COMPLETED
         self.transaction_id = transaction_id
-        self.completed_at = datetime.now()
+        self.completed_at = _now()
     
     def mark_failed(self, reason: str):
         """Mark payment as failed"""
         self.status = PaymentStatus.FAILED
         self.failure_reason = reason
-        self.failed_at = datetime.now()
+        self.failed_at = _now()
     
     def process_refund(self, amount: Money):
         """Process refund for the payment"""
         if self.status != PaymentStatus.COMPLETED:
             raise ValueError("Cannot refund a payment that is not completed")
         
-        if amount.amount > self.amount.amount:
+        if amount.amount_paisa > self.amount.amount_paisa:
             raise ValueError("Refund amount cannot exceed payment amount")
         
         self.status = PaymentStatus.REFUNDED
         self.refund_amount = amount
-        self.refunded_at = datetime.now()
+        self.refunded_at = _now()
     
     def is_successful(self) -> bool:
         """Check if payment was successful"""
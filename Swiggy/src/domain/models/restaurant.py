@@ -1,26 +1,30 @@
 """Restaurant and Menu domain models"""
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
-from uuid import uuid4
+from typing import Dict, List, Optional
 
-from ..value_objects import Location, Money, Rating
+from ..ids import new_id
+from ..value_objects import DEFAULT_DELIVERY_FEE, DEFAULT_MIN_ORDER, Location, Money, Rating, ZERO_INR
 
 
-@dataclass
+@dataclass(slots=True)
 class MenuItem:
     """Menu item entity"""
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=new_id)
     category_id: str = ""
     name: str = ""
     description: str = ""
-    price: Money = field(default_factory=lambda: Money(0.0))
+    price: Money = ZERO_INR
     is_available: bool = True
     is_vegetarian: bool = True
     preparation_time_minutes: int = 15
     image_url: Optional[str] = None
-    created_at: datetime = field(default_factory=datetime.now)
-    
+    created_at: Optional[datetime] = None  # filled in __post_init__
+
+    def __post_init__(self):
+        if self.created_at is None:
+            self.created_at = datetime.now()
+
     def mark_unavailable(self):
         """Mark item as unavailable"""
         self.is_available = False
@@ -30,35 +34,51 @@ class MenuItem:
         self.is_available = True
 
 
-@dataclass
+@dataclass(slots=True)
 class MenuCategory:
     """Menu category entity"""
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=new_id)
     restaurant_id: str = ""
     name: str = ""
     description: str = ""
     display_order: int = 0
     items: List[MenuItem] = field(default_factory=list)
-    created_at: datetime = field(default_factory=datetime.now)
-    
+    created_at: Optional[datetime] = None  # filled in __post_init__
+    # Back-reference set by Restaurant.add_category so item changes keep
+    # the restaurant's flat item index current
+    _restaurant: Optional['Restaurant'] = field(
+        default=None, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        if self.created_at is None:
+            self.created_at = datetime.now()
+
     def add_item(self, item: MenuItem):
         """Add menu item to category"""
         item.category_id = self.id
         self.items.append(item)
-    
+        if self._restaurant is not None:
+            self._restaurant._item_index[item.id] = item
+
     def remove_item(self, item_id: str):
-        """Remove menu item from category"""
-        self.items = [item for item in self.items if item.id != item_id]
+        """Remove menu item from category in place, no list rebuild"""
+        for index, item in enumerate(self.items):
+            if item.id == item_id:
+                del self.items[index]
+                break
+        if self._restaurant is not None:
+            self._restaurant._item_index.pop(item_id, None)
     
     def get_available_items(self) -> List[MenuItem]:
         """Get all available items in category"""
         return [item for item in self.items if item.is_available]
 
 
-@dataclass
+@dataclass(slots=True)
 class Restaurant:
     """Restaurant entity"""
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=new_id)
     owner_id: str = ""
     name: str = ""
     description: str = ""
@@ -66,40 +86,59 @@ class Restaurant:
     cuisine_types: List[str] = field(default_factory=list)
     menu_categories: List[MenuCategory] = field(default_factory=list)
     is_active: bool = True
-    rating: Rating = field(default_factory=lambda: Rating(5.0))
+    # Running sum of review ratings; the Rating object is only built
+    # when the rating property is read
+    _rating_sum: float = 0.0
     total_reviews: int = 0
     opening_time: str = "09:00"
     closing_time: str = "22:00"
-    minimum_order_amount: Money = field(default_factory=lambda: Money(100.0))
-    delivery_fee: Money = field(default_factory=lambda: Money(40.0))
+    minimum_order_amount: Money = DEFAULT_MIN_ORDER
+    delivery_fee: Money = DEFAULT_DELIVERY_FEE
     average_preparation_time: int = 30  # minutes
-    created_at: datetime = field(default_factory=datetime.now)
-    
+    created_at: Optional[datetime] = None  # filled in __post_init__
+    # Flat item-id index across all categories, maintained by
+    # add/remove paths so lookups skip the category scan
+    _item_index: Dict[str, MenuItem] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        if self.created_at is None:
+            self.created_at = datetime.now()
+
     def add_category(self, category: MenuCategory):
         """Add menu category to restaurant"""
         category.restaurant_id = self.id
+        category._restaurant = self
         self.menu_categories.append(category)
-    
+        for item in category.items:
+            self._item_index[item.id] = item
+
     def remove_category(self, category_id: str):
-        """Remove menu category from restaurant"""
-        self.menu_categories = [
-            cat for cat in self.menu_categories if cat.id != category_id
-        ]
-    
+        """Remove menu category from restaurant in place, no list rebuild"""
+        for index, category in enumerate(self.menu_categories):
+            if category.id == category_id:
+                for item in category.items:
+                    self._item_index.pop(item.id, None)
+                category._restaurant = None
+                del self.menu_categories[index]
+                break
+
     def get_menu_item(self, item_id: str) -> Optional[MenuItem]:
-        """Find menu item by ID across all categories"""
-        for category in self.menu_categories:
-            for item in category.items:
-                if item.id == item_id:
-                    return item
-        return None
+        """Find menu item by ID in O(1) via the flat index"""
+        return self._item_index.get(item_id)
     
+    @property
+    def rating(self) -> Rating:
+        """Average review rating (5.0 until the first review lands)"""
+        if self.total_reviews == 0:
+            return Rating(5.0)
+        return Rating(self._rating_sum / self.total_reviews)
+
     def update_rating(self, new_rating: float):
         """Update restaurant rating with new review"""
-        current_total = self.rating.value * self.total_reviews
-        new_total = current_total + new_rating
+        self._rating_sum += new_rating
         self.total_reviews += 1
-        self.rating = Rating(new_total / self.total_reviews)
     
     def is_accepting_orders(self) -> bool:
         """Check if restaurant is currently accepting orders"""
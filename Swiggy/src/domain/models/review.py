@@ -2,15 +2,15 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
-from uuid import uuid4
 
+from ..ids import new_id
 from ..value_objects import Rating
 
 
-@dataclass
+@dataclass(slots=True)
 class Review:
     """Review entity for restaurants and deliveries"""
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=new_id)
     customer_id: str = ""
     order_id: str = ""
     restaurant_id: Optional[str] = None
@@ -19,9 +19,13 @@ class Review:
     comment: str = ""
     food_rating: Optional[Rating] = None
     delivery_rating: Optional[Rating] = None
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: Optional[datetime] = None  # filled in __post_init__
     is_verified: bool = False  # Verified if customer actually ordered
     
+    def __post_init__(self):
+        if self.created_at is None:
+            self.created_at = datetime.now()
+
     def verify(self):
         """Mark review as verified"""
         self.is_verified = True
@@ -2,25 +2,31 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, List
-from uuid import uuid4
 
 from ..enums import UserRole, VehicleType, SubscriptionPlan
+from ..ids import new_id
 from ..value_objects import Location
 
+_now = datetime.now
 
-@dataclass
+
+@dataclass(slots=True)
 class User:
     """Base user entity"""
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=new_id)
     email: str = ""
     phone: str = ""
     name: str = ""
     role: UserRole = UserRole.CUSTOMER
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: Optional[datetime] = None  # filled in __post_init__
     is_active: bool = True
 
+    def __post_init__(self):
+        if self.created_at is None:
+            self.created_at = _now()
+
 
-@dataclass
+@dataclass(slots=True)
 class Customer(User):
     """Customer entity extending User"""
     addresses: List[Location] = field(default_factory=list)
@@ -29,6 +35,9 @@ class Customer(User):
     subscription_expiry: Optional[datetime] = None
     
     def __post_init__(self):
+        # Explicit base call: dataclass slots=True recreates the class,
+        # which breaks zero-argument super() in methods
+        User.__post_init__(self)
         self.role = UserRole.CUSTOMER
     
     def has_active_subscription(self) -> bool:
@@ -37,7 +46,7 @@ class Customer(User):
             return False
         if self.subscription_expiry is None:
             return False
-        return datetime.now() < self.subscription_expiry
+        return _now() < self.subscription_expiry
     
     def add_loyalty_points(self, points: int):
         """Add loyalty points to customer account"""
@@ -51,26 +60,34 @@ class Customer(User):
         return False
 
 
-@dataclass
+@dataclass(slots=True)
 class RestaurantOwner(User):
     """Restaurant owner entity"""
     restaurant_ids: List[str] = field(default_factory=list)
     
     def __post_init__(self):
+        # Explicit base call: dataclass slots=True recreates the class,
+        # which breaks zero-argument super() in methods
+        User.__post_init__(self)
         self.role = UserRole.RESTAURANT_OWNER
 
 
-@dataclass
+@dataclass(slots=True)
 class DeliveryPartner(User):
     """Delivery partner entity"""
     current_location: Optional[Location] = None
     vehicle_type: VehicleType = VehicleType.MOTORCYCLE
     is_available: bool = True
     current_order_id: Optional[str] = None
-    rating: float = 5.0
+    # Running sum/count of review ratings; average derived on read
+    _rating_sum: float = 0.0
+    _rating_count: int = 0
     total_deliveries: int = 0
     
     def __post_init__(self):
+        # Explicit base call: dataclass slots=True recreates the class,
+        # which breaks zero-argument super() in methods
+        User.__post_init__(self)
         self.role = UserRole.DELIVERY_PARTNER
     
     def assign_order(self, order_id: str):
@@ -88,12 +105,14 @@ class DeliveryPartner(User):
         """Update current location of delivery partner"""
         self.current_location = location
     
+    @property
+    def rating(self) -> float:
+        """Average review rating (5.0 until the first review lands)"""
+        if self._rating_count == 0:
+            return 5.0
+        return self._rating_sum / self._rating_count
+
     def update_rating(self, new_rating: float):
-        """Update average rating (simplified)"""
-        if self.total_deliveries == 0:
-            self.rating = new_rating
-        else:
-            # Simple moving average
-            total_rating = self.rating * self.total_deliveries
-            total_rating += new_rating
-            self.rating = total_rating / (self.total_deliveries + 1)
+        """Update average rating with a running sum, no re-multiply"""
+        self._rating_sum += new_rating
+        self._rating_count += 1
@@ -0,0 +1,31 @@
+"""Numeric kernel for order subtotal recomputation.
+
+Follows the same convention as services.geospatial_kernels: compiled
+with numba when it is installed, plain NumPy otherwise. Packing the
+price/quantity arrays costs a pass over the items, so the kernel only
+pays off for large orders — Order keeps a scalar integer loop below
+that size.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is an optional speedup
+    njit = None
+
+
+def _subtotal_paisa(prices_paisa, quantities):
+    """Sum of price * quantity over parallel int64 arrays, in paisa"""
+    total = 0
+    for i in range(prices_paisa.shape[0]):
+        total += prices_paisa[i] * quantities[i]
+    return total
+
+
+if njit is not None:
+    _subtotal_paisa = njit(cache=True)(_subtotal_paisa)
+
+
+def subtotal_paisa(prices_paisa: np.ndarray, quantities: np.ndarray) -> int:
+    """Compute an order subtotal in paisa from packed line-item arrays"""
+    return int(_subtotal_paisa(prices_paisa, quantities))
@@ -1,56 +1,133 @@
 """Value objects for the domain layer"""
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Location:
-    """Immutable location value object"""
+    """Immutable location value object.
+
+    Locations key geospatial dicts and sets, so the hash over all five
+    fields is computed once at construction instead of on every lookup.
+    """
     latitude: float
     longitude: float
     address: Optional[str] = None
     city: Optional[str] = None
     postal_code: Optional[str] = None
-    
+    _hash: int = field(init=False, repr=False, compare=False, default=0)
+
     def __post_init__(self):
         if not (-90 <= self.latitude <= 90):
             raise ValueError(f"Invalid latitude: {self.latitude}")
         if not (-180 <= self.longitude <= 180):
             raise ValueError(f"Invalid longitude: {self.longitude}")
-    
+        object.__setattr__(self, '_hash', hash((
+            self.latitude, self.longitude,
+            self.address, self.city, self.postal_code
+        )))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    @classmethod
+    def unchecked(cls, latitude: float, longitude: float,
+                  address: Optional[str] = None, city: Optional[str] = None,
+                  postal_code: Optional[str] = None) -> 'Location':
+        """Fast constructor for known-good coordinates.
+
+        Skips the range validation in __post_init__ — intended for
+        trusted paths such as reloading persisted data or relaying GPS
+        pings that were validated at the edge.
+        """
+        obj = object.__new__(cls)
+        set_attr = object.__setattr__
+        set_attr(obj, 'latitude', latitude)
+        set_attr(obj, 'longitude', longitude)
+        set_attr(obj, 'address', address)
+        set_attr(obj, 'city', city)
+        set_attr(obj, 'postal_code', postal_code)
+        set_attr(obj, '_hash', hash((
+            latitude, longitude, address, city, postal_code
+        )))
+        return obj
+
     def to_tuple(self) -> tuple:
         """Return (latitude, longitude) tuple for geospatial calculations"""
         return (self.latitude, self.longitude)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Money:
-    """Immutable money value object"""
-    amount: float
+    """Immutable money value object.
+
+    Amounts are stored as integer paisa (1/100 rupee), so arithmetic is
+    exact integer math with no float rounding drift. Use `from_rupees`
+    when constructing from a rupee figure and `rupees` when displaying.
+    """
+    amount_paisa: int
     currency: str = "INR"
-    
+
     def __post_init__(self):
-        if self.amount < 0:
+        if self.amount_paisa < 0:
             raise ValueError("Amount cannot be negative")
-    
+
+    @classmethod
+    def from_rupees(cls, rupees: float, currency: str = "INR") -> 'Money':
+        """Build from a rupee amount, rounding to the nearest paisa"""
+        return cls(round(rupees * 100), currency)
+
+    @classmethod
+    def of(cls, amount_paisa: int, currency: str = "INR") -> 'Money':
+        """Interned constructor for frequently repeated amounts.
+
+        Same principle as CPython's small-int cache: prices like zero
+        or the standard delivery fee recur across many entities, so
+        repeated `of` calls return one shared instance and equality
+        checks can short-circuit on identity.
+        """
+        key = (amount_paisa, currency)
+        cached = _MONEY_INTERN.get(key)
+        if cached is None:
+            cached = _MONEY_INTERN[key] = cls(amount_paisa, currency)
+        return cached
+
+    @property
+    def rupees(self) -> float:
+        """Rupee value, for display and reporting"""
+        return self.amount_paisa / 100
+
+    # Alias kept so read sites predating paisa storage still work
+    amount = rupees
+
     def __add__(self, other: 'Money') -> 'Money':
         if self.currency != other.currency:
             raise ValueError("Cannot add money with different currencies")
-        return Money(self.amount + other.amount, self.currency)
-    
+        return Money(self.amount_paisa + other.amount_paisa, self.currency)
+
     def __sub__(self, other: 'Money') -> 'Money':
         if self.currency != other.currency:
             raise ValueError("Cannot subtract money with different currencies")
-        return Money(self.amount - other.amount, self.currency)
-    
+        return Money(self.amount_paisa - other.amount_paisa, self.currency)
+
     def __mul__(self, factor: float) -> 'Money':
-        return Money(self.amount * factor, self.currency)
-    
+        return Money(round(self.amount_paisa * factor), self.currency)
+
     def __str__(self) -> str:
-        return f"{self.currency} {self.amount:.2f}"
+        return f"{self.currency} {self.rupees:.2f}"
+
+
+_MONEY_INTERN: Dict[Tuple[int, str], Money] = {}
+
+# Shared instances for the common field defaults; Money is frozen, so
+# every entity can safely reference the same object instead of
+# constructing a fresh one per instantiation
+ZERO_INR = Money.of(0)
+DEFAULT_DELIVERY_FEE = Money.of(4000)
+DEFAULT_MIN_ORDER = Money.of(10000)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Rating:
     """Immutable rating value object"""
     value: float
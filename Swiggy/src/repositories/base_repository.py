@@ -1,52 +1,226 @@
 """Base repository with CRUD operations using Repository pattern"""
+import threading
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, Optional, List, Dict, Any
+from typing import Generic, TypeVar, Optional, List, Dict, Any, Callable, Set, ValuesView
 
 T = TypeVar('T')
 
 
 class BaseRepository(ABC, Generic[T]):
-    """Abstract base repository for all entities"""
-    
+    """Abstract base repository for all entities.
+
+    Subclasses may declare secondary indexes over entity attributes with
+    `_register_unique_index` / `_register_multi_index`; `save` and
+    `delete` keep the index dicts in sync, so indexed lookups are
+    O(1)/O(k) instead of a full scan over `_storage`.
+
+    Mutations take `_lock` (reentrant, so subclass overrides can wrap
+    their own shadow-structure updates in the same lock around a
+    `super()` call). Point reads ride on CPython's atomic dict ops and
+    stay lock-free; callers needing a multi-step critical section
+    (read-modify-write across entities) hold `repo._lock` themselves.
+    """
+
     def __init__(self):
         # In-memory storage for demo purposes
         # In production, this would use a real database
+        self._lock = threading.RLock()
         self._storage: Dict[str, T] = {}
-    
+        # Index name -> key extractor; None keys are not indexed
+        self._index_key_fns: Dict[str, Callable[[T], Any]] = {}
+        # Index name -> {key: entity id} (unique) or {key: set of ids}
+        self._indexes: Dict[str, Dict[Any, Any]] = {}
+        self._unique_index_names: Set[str] = set()
+        self._ordered_index_names: Set[str] = set()
+        # Entity id -> {index name: key it was last indexed under}.
+        # Entities are mutable and get re-saved after mutation, so the
+        # old keys must be remembered rather than re-extracted.
+        self._indexed_keys: Dict[str, Dict[str, Any]] = {}
+
+    def _register_unique_index(self, name: str, key_fn: Callable[[T], Any]):
+        """Declare a one-to-one index (key -> entity id)"""
+        self._index_key_fns[name] = key_fn
+        self._indexes[name] = {}
+        self._unique_index_names.add(name)
+
+    def _register_multi_index(self, name: str, key_fn: Callable[[T], Any]):
+        """Declare a one-to-many index (key -> set of entity ids)"""
+        self._index_key_fns[name] = key_fn
+        self._indexes[name] = {}
+
+    def _register_ordered_multi_index(self, name: str, key_fn: Callable[[T], Any]):
+        """Declare a one-to-many index backed by a list in insertion order.
+
+        Useful when queries want results ordered by save time: reverse
+        iteration gives newest-first without a per-query sort.
+        """
+        self._index_key_fns[name] = key_fn
+        self._indexes[name] = {}
+        self._ordered_index_names.add(name)
+
+    def _add_index_entry(self, name: str, key: Any, entity_id: str):
+        index = self._indexes[name]
+        if name in self._unique_index_names:
+            index[key] = entity_id
+        elif name in self._ordered_index_names:
+            index.setdefault(key, []).append(entity_id)
+        else:
+            index.setdefault(key, set()).add(entity_id)
+
+    def _remove_index_entry(self, name: str, key: Any, entity_id: str):
+        index = self._indexes[name]
+        if name in self._unique_index_names:
+            if index.get(key) == entity_id:
+                del index[key]
+            return
+        ids = index.get(key)
+        if ids is None:
+            return
+        if name in self._ordered_index_names:
+            try:
+                ids.remove(entity_id)
+            except ValueError:
+                pass
+        else:
+            ids.discard(entity_id)
+        if not ids:
+            del index[key]
+
+    def _reindex_entity(self, entity_id: str, entity: T):
+        """Update every registered index for a saved entity.
+
+        Entries whose key did not change are left untouched, so
+        re-saving a mutated entity keeps its slot in ordered indexes
+        (and skips redundant dict work in the others).
+        """
+        old_keys = self._indexed_keys.get(entity_id, {})
+        new_keys = {}
+        for name, key_fn in self._index_key_fns.items():
+            key = key_fn(entity)
+            if key is not None:
+                new_keys[name] = key
+        for name, old_key in old_keys.items():
+            if new_keys.get(name) != old_key:
+                self._remove_index_entry(name, old_key, entity_id)
+        for name, key in new_keys.items():
+            if old_keys.get(name) != key:
+                self._add_index_entry(name, key, entity_id)
+        if new_keys:
+            self._indexed_keys[entity_id] = new_keys
+        else:
+            self._indexed_keys.pop(entity_id, None)
+
+    def _unindex_entity(self, entity_id: str):
+        """Remove an entity's previously recorded index entries"""
+        keys = self._indexed_keys.pop(entity_id, None)
+        if not keys:
+            return
+        for name, key in keys.items():
+            self._remove_index_entry(name, key, entity_id)
+
+    def _find_by_unique_index(self, name: str, key: Any) -> Optional[T]:
+        """Look up a single entity through a unique index"""
+        entity_id = self._indexes[name].get(key)
+        if entity_id is None:
+            return None
+        return self._storage.get(entity_id)
+
+    def _find_by_multi_index(self, name: str, key: Any,
+                             reverse: bool = False) -> List[T]:
+        """Look up all entities matching a key through a multi index.
+
+        `reverse=True` walks an ordered index newest-first.
+        """
+        ids = self._indexes[name].get(key)
+        if not ids:
+            return []
+        if reverse:
+            ids = reversed(ids)
+        return [self._storage[entity_id] for entity_id in ids]
+
     def save(self, entity: T) -> T:
-        """Save or update an entity"""
+        """Save or update an entity, keeping secondary indexes in sync"""
         entity_id = self._get_entity_id(entity)
-        self._storage[entity_id] = entity
+        with self._lock:
+            if self._index_key_fns:
+                self._reindex_entity(entity_id, entity)
+            self._storage[entity_id] = entity
         return entity
-    
+
+    def save_bulk(self, entities: List[T]) -> List[T]:
+        """Save many entities in one call.
+
+        Bulk-load path for entities with pre-set ids (e.g. hydrated from
+        persistent storage); skips per-entity method dispatch when no
+        indexes are registered. The whole batch commits under one lock
+        acquisition.
+        """
+        with self._lock:
+            if self._index_key_fns:
+                for entity in entities:
+                    self.save(entity)
+            else:
+                storage = self._storage
+                get_id = self._get_entity_id
+                for entity in entities:
+                    storage[get_id(entity)] = entity
+        return entities
+
     def find_by_id(self, entity_id: str) -> Optional[T]:
         """Find entity by ID"""
         return self._storage.get(entity_id)
-    
+
+    def find_by_ids(self, entity_ids: List[str]) -> Dict[str, T]:
+        """Find many entities in one call, keyed by id.
+
+        Ids with no entity are simply absent from the result — the
+        batch equivalent of an `IN (...)` query for N+1-free prefetch.
+        """
+        storage = self._storage
+        return {
+            entity_id: storage[entity_id]
+            for entity_id in entity_ids if entity_id in storage
+        }
+
     def find_all(self) -> List[T]:
-        """Get all entities"""
+        """Get all entities as a snapshot copy"""
         return list(self._storage.values())
-    
+
+    def iter_all(self) -> ValuesView[T]:
+        """Get a live, allocation-free view over all entities.
+
+        Prefer this for read-only iteration; use find_all when a
+        snapshot is needed (e.g. the storage mutates while iterating).
+        """
+        return self._storage.values()
+
     def delete(self, entity_id: str) -> bool:
         """Delete entity by ID"""
-        if entity_id in self._storage:
-            del self._storage[entity_id]
-            return True
+        with self._lock:
+            if entity_id in self._storage:
+                del self._storage[entity_id]
+                if self._index_key_fns:
+                    self._unindex_entity(entity_id)
+                return True
         return False
-    
+
     def exists(self, entity_id: str) -> bool:
         """Check if entity exists"""
         return entity_id in self._storage
-    
+
     def count(self) -> int:
         """Count total entities"""
         return len(self._storage)
-    
+
     @abstractmethod
     def _get_entity_id(self, entity: T) -> str:
         """Get the ID field from entity (must be implemented by subclasses)"""
         pass
-    
+
     def clear_all(self):
         """Clear all data (useful for testing)"""
-        self._storage.clear()
+        with self._lock:
+            self._storage.clear()
+            self._indexed_keys.clear()
+            for index in self._indexes.values():
+                index.clear()
@@ -1,43 +1,158 @@
 """Delivery repository"""
-from typing import List, Optional
+from operator import attrgetter
+from typing import Dict, List, Optional
+
+import numpy as np
+
 from .base_repository import BaseRepository
 from ..domain.models.delivery import Delivery
 from ..domain.enums import DeliveryStatus
 
+# Stable small-int codes for statuses so the SoA shadow can store them
+# as uint8 and compare without enum dispatch
+_STATUS_CODES = {status: code for code, status in enumerate(DeliveryStatus)}
+_DELIVERED_CODE = _STATUS_CODES[DeliveryStatus.DELIVERED]
+
+# C-implemented key extractor; avoids a Python frame per comparison key
+_BY_ASSIGNED_NS = attrgetter('assigned_at_ns')
+
 
 class DeliveryRepository(BaseRepository[Delivery]):
-    """Repository for delivery entities"""
-    
+    """Repository for delivery entities.
+
+    Point queries go through the hash indexes; in addition a
+    structure-of-arrays shadow (partner code, status code, timestamps)
+    is kept in parallel arrays so partner-wide scans and aggregations
+    run as vectorized masks over contiguous memory instead of
+    per-object attribute fetches.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._register_unique_index("order_id", lambda d: d.order_id)
+        self._register_multi_index("partner_id", lambda d: d.delivery_partner_id)
+        self._capacity = 16
+        self._size = 0
+        self._partner_codes = np.empty(self._capacity, dtype=np.int32)
+        self._status_codes = np.empty(self._capacity, dtype=np.uint8)
+        self._assigned_ns = np.empty(self._capacity, dtype=np.int64)
+        self._delivered_ns = np.empty(self._capacity, dtype=np.int64)
+        self._rows: Dict[str, int] = {}   # delivery id -> row index
+        self._row_ids: List[str] = []     # row index -> delivery id
+        self._partner_code_of: Dict[str, int] = {}
+
     def _get_entity_id(self, entity: Delivery) -> str:
         return entity.id
-    
+
+    def save(self, entity: Delivery) -> Delivery:
+        """Save or update a delivery, keeping the SoA shadow in sync"""
+        with self._lock:
+            entity = super().save(entity)
+            row = self._rows.get(entity.id)
+            if row is None:
+                if self._size == self._capacity:
+                    self._capacity *= 2
+                    self._partner_codes = np.resize(self._partner_codes, self._capacity)
+                    self._status_codes = np.resize(self._status_codes, self._capacity)
+                    self._assigned_ns = np.resize(self._assigned_ns, self._capacity)
+                    self._delivered_ns = np.resize(self._delivered_ns, self._capacity)
+                row = self._size
+                self._rows[entity.id] = row
+                self._row_ids.append(entity.id)
+                self._size += 1
+            partner_codes = self._partner_code_of
+            self._partner_codes[row] = partner_codes.setdefault(
+                entity.delivery_partner_id, len(partner_codes)
+            )
+            self._status_codes[row] = _STATUS_CODES[entity.status]
+            self._assigned_ns[row] = entity.assigned_at_ns
+            self._delivered_ns[row] = (
+                entity.delivered_at_ns if entity.delivered_at_ns is not None else -1
+            )
+        return entity
+
+    def delete(self, entity_id: str) -> bool:
+        """Delete a delivery, swap-removing its SoA row"""
+        with self._lock:
+            if not super().delete(entity_id):
+                return False
+            row = self._rows.pop(entity_id)
+            last = self._size - 1
+            if row != last:
+                # Move the last row into the vacated slot
+                moved_id = self._row_ids[last]
+                self._partner_codes[row] = self._partner_codes[last]
+                self._status_codes[row] = self._status_codes[last]
+                self._assigned_ns[row] = self._assigned_ns[last]
+                self._delivered_ns[row] = self._delivered_ns[last]
+                self._row_ids[row] = moved_id
+                self._rows[moved_id] = row
+            self._row_ids.pop()
+            self._size -= 1
+        return True
+
     def find_by_order(self, order_id: str) -> Optional[Delivery]:
         """Find delivery by order ID"""
-        for delivery in self._storage.values():
-            if delivery.order_id == order_id:
-                return delivery
-        return None
-    
+        return self._find_by_unique_index("order_id", order_id)
+
     def find_by_partner(self, partner_id: str) -> List[Delivery]:
         """Find all deliveries for a partner"""
-        deliveries = [
-            d for d in self._storage.values()
-            if d.delivery_partner_id == partner_id
-        ]
-        deliveries.sort(key=lambda d: d.assigned_at, reverse=True)
+        deliveries = self._find_by_multi_index("partner_id", partner_id)
+        deliveries.sort(key=_BY_ASSIGNED_NS, reverse=True)
         return deliveries
-    
+
     def find_active_deliveries(self, partner_id: str) -> List[Delivery]:
         """Find active (non-delivered) deliveries for a partner"""
-        return [
-            d for d in self._storage.values()
-            if (d.delivery_partner_id == partner_id and 
-                d.status != DeliveryStatus.DELIVERED)
-        ]
-    
+        code = self._partner_code_of.get(partner_id)
+        if code is None:
+            return []
+        size = self._size
+        mask = (
+            (self._partner_codes[:size] == code)
+            & (self._status_codes[:size] != _DELIVERED_CODE)
+        )
+        storage = self._storage
+        row_ids = self._row_ids
+        return [storage[row_ids[row]] for row in np.nonzero(mask)[0]]
+
     def find_by_status(self, status: DeliveryStatus) -> List[Delivery]:
-        """Find deliveries by status"""
-        return [
-            d for d in self._storage.values()
-            if d.status == status
-        ]
+        """Find deliveries by status.
+
+        One vectorized compare over the uint8 status column — keeps the
+        save path free of a status index while the scan stays a single
+        SIMD-friendly pass over contiguous memory.
+        """
+        size = self._size
+        if size == 0:
+            return []
+        rows = np.nonzero(
+            self._status_codes[:size] == _STATUS_CODES[status]
+        )[0]
+        storage = self._storage
+        row_ids = self._row_ids
+        return [storage[row_ids[row]] for row in rows]
+
+    def partner_stats(self, partner_id: str) -> Dict[str, float]:
+        """Vectorized delivery stats for a partner.
+
+        Returns total/delivered counts and the mean assignment-to-
+        delivery time in minutes (0.0 when nothing is delivered yet),
+        computed with array masks rather than per-delivery iteration.
+        """
+        code = self._partner_code_of.get(partner_id)
+        if code is None:
+            return {"total": 0, "delivered": 0, "avg_delivery_minutes": 0.0}
+        size = self._size
+        mask = self._partner_codes[:size] == code
+        delivered = mask & (self._status_codes[:size] == _DELIVERED_CODE)
+        durations_ns = (
+            self._delivered_ns[:size][delivered]
+            - self._assigned_ns[:size][delivered]
+        )
+        return {
+            "total": int(mask.sum()),
+            "delivered": int(delivered.sum()),
+            "avg_delivery_minutes": (
+                float(durations_ns.mean()) / 60e9 if durations_ns.size else 0.0
+            ),
+        }
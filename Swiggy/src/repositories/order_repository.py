@@ -1,16 +1,44 @@
 """Order repository with optimistic locking support"""
+import heapq
 from typing import List, Optional
 from datetime import datetime
 from .base_repository import BaseRepository
 from ..domain.models.order import Order, OrderItem
 from ..domain.enums import OrderStatus
 
+_now = datetime.now
+
+# Built once; find_active_orders runs on every dispatch sweep
+_TERMINAL_STATES = frozenset({OrderStatus.DELIVERED, OrderStatus.CANCELLED})
+
 
 class OrderRepository(BaseRepository[Order]):
     """Repository for order entities with concurrency control"""
-    
+
+    def __init__(self):
+        super().__init__()
+        self._register_ordered_multi_index("customer_id", lambda o: o.customer_id)
+        self._register_ordered_multi_index("restaurant_id", lambda o: o.restaurant_id)
+        self._register_multi_index("status", lambda o: o.status)
+        # Min-heap of (scheduled_for, order id) so the scheduled-order
+        # poller peeks the earliest due time instead of scanning every
+        # order; stale entries are skipped on pop (tombstone-on-read)
+        self._scheduled_heap = []
+        self._scheduled_pushed = set()
+
     def _get_entity_id(self, entity: Order) -> str:
         return entity.id
+
+    def save(self, entity: Order) -> Order:
+        """Save or update an order, enqueueing scheduled ones"""
+        with self._lock:
+            entity = super().save(entity)
+            if entity.scheduled_for and entity.status == OrderStatus.CREATED:
+                key = (entity.scheduled_for, entity.id)
+                if key not in self._scheduled_pushed:
+                    heapq.heappush(self._scheduled_heap, key)
+                    self._scheduled_pushed.add(key)
+        return entity
     
     def save_with_version_check(self, order: Order, expected_version: int) -> Order:
         """
@@ -30,56 +58,61 @@ class OrderRepository(BaseRepository[Order]):
         return self.save(order)
     
     def find_by_customer(self, customer_id: str) -> List[Order]:
-        """Find all orders for a customer"""
-        orders = [
-            order for order in self._storage.values()
-            if order.customer_id == customer_id
-        ]
-        # Sort by created_at descending (newest first)
-        orders.sort(key=lambda o: o.created_at, reverse=True)
-        return orders
-    
+        """Find all orders for a customer, newest first"""
+        # Orders are only appended and created_at is monotonic at insert
+        # time, so reverse insertion order replaces the per-query sort
+        return self._find_by_multi_index("customer_id", customer_id,
+                                         reverse=True)
+
     def find_by_restaurant(self, restaurant_id: str) -> List[Order]:
-        """Find all orders for a restaurant"""
-        orders = [
-            order for order in self._storage.values()
-            if order.restaurant_id == restaurant_id
-        ]
-        orders.sort(key=lambda o: o.created_at, reverse=True)
-        return orders
-    
+        """Find all orders for a restaurant, newest first"""
+        return self._find_by_multi_index("restaurant_id", restaurant_id,
+                                         reverse=True)
+
     def find_by_status(self, status: OrderStatus) -> List[Order]:
         """Find all orders with a specific status"""
-        return [
-            order for order in self._storage.values()
-            if order.status == status
-        ]
+        return self._find_by_multi_index("status", status)
     
     def find_active_orders(self) -> List[Order]:
-        """Find all non-terminal orders"""
-        terminal_states = {OrderStatus.DELIVERED, OrderStatus.CANCELLED}
-        return [
-            order for order in self._storage.values()
-            if order.status not in terminal_states
-        ]
+        """Find all non-terminal orders via the status index"""
+        storage = self._storage
+        active = []
+        for status, ids in self._indexes["status"].items():
+            if status not in _TERMINAL_STATES:
+                active.extend(storage[order_id] for order_id in ids)
+        return active
     
     def find_scheduled_orders(self) -> List[Order]:
         """Find orders scheduled for later delivery"""
-        now = datetime.now()
+        now = _now()
         return [
             order for order in self._storage.values()
             if order.scheduled_for and order.scheduled_for > now
         ]
     
-    def find_ready_scheduled_orders(self) -> List[Order]:
-        """Find scheduled orders that are ready to be processed"""
-        now = datetime.now()
-        return [
-            order for order in self._storage.values()
-            if (order.scheduled_for and 
-                order.scheduled_for <= now and 
-                order.status == OrderStatus.CREATED)
-        ]
+    def pop_ready_scheduled_orders(self) -> List[Order]:
+        """Dequeue scheduled orders that are ready to be processed.
+
+        Pops due entries off the min-heap — O(log N) per ready order
+        instead of a full scan per poll. Entries whose order was since
+        deleted, rescheduled or moved past CREATED are discarded.
+        Consuming is destructive: a caller that fails to process a
+        returned order must save() it again to re-enqueue it.
+        """
+        now = _now()
+        ready = []
+        with self._lock:
+            heap = self._scheduled_heap
+            while heap and heap[0][0] <= now:
+                key = heapq.heappop(heap)
+                self._scheduled_pushed.discard(key)
+                scheduled_for, order_id = key
+                order = self._storage.get(order_id)
+                if (order and
+                        order.scheduled_for == scheduled_for and
+                        order.status == OrderStatus.CREATED):
+                    ready.append(order)
+        return ready
 
 
 class OrderItemRepository(BaseRepository[OrderItem]):
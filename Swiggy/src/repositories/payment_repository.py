@@ -7,45 +7,56 @@ from ..domain.enums.order_status import PaymentStatus
 
 class PaymentRepository(BaseRepository[Payment]):
     """Repository for payment entities"""
-    
+
+    def __init__(self):
+        super().__init__()
+        self._register_unique_index("order_id", lambda p: p.order_id)
+        self._register_unique_index("transaction_id", lambda p: p.transaction_id)
+        self._register_unique_index("idempotency_key", lambda p: p.idempotency_key)
+        self._register_multi_index("status", lambda p: p.status)
+
     def _get_entity_id(self, entity: Payment) -> str:
         return entity.id
-    
+
     def find_by_order(self, order_id: str) -> Optional[Payment]:
         """Find payment by order ID"""
-        for payment in self._storage.values():
-            if payment.order_id == order_id:
-                return payment
-        return None
-    
+        return self._find_by_unique_index("order_id", order_id)
+
     def find_by_transaction_id(self, transaction_id: str) -> Optional[Payment]:
         """Find payment by transaction ID"""
-        for payment in self._storage.values():
-            if payment.transaction_id == transaction_id:
-                return payment
-        return None
-    
+        return self._find_by_unique_index("transaction_id", transaction_id)
+
     def find_by_idempotency_key(self, idempotency_key: str) -> Optional[Payment]:
         """
         Find payment by idempotency key
         Used to prevent duplicate payment processing
         """
-        for payment in self._storage.values():
-            if payment.idempotency_key == idempotency_key:
-                return payment
-        return None
-    
+        return self._find_by_unique_index("idempotency_key", idempotency_key)
+
+    def save_if_absent(self, payment: Payment) -> Payment:
+        """Insert a payment, or return the existing one for its key.
+
+        The check and insert happen under the repository lock, so two
+        concurrent requests with the same idempotency key cannot both
+        insert — the loser gets the winner's payment back.
+        """
+        with self._lock:
+            if payment.idempotency_key:
+                existing = self._find_by_unique_index(
+                    "idempotency_key", payment.idempotency_key
+                )
+                if existing is not None:
+                    return existing
+            return self.save(payment)
+
     def find_by_status(self, status: PaymentStatus) -> List[Payment]:
         """Find payments by status"""
-        return [
-            p for p in self._storage.values()
-            if p.status == status
-        ]
-    
+        return self._find_by_multi_index("status", status)
+
     def find_pending_payments(self) -> List[Payment]:
         """Find all pending payments"""
         return self.find_by_status(PaymentStatus.PENDING)
-    
+
     def find_failed_payments(self) -> List[Payment]:
         """Find all failed payments"""
         return self.find_by_status(PaymentStatus.FAILED)
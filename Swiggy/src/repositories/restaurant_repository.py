@@ -1,59 +1,194 @@
 """Restaurant repository with geospatial queries"""
 from typing import List, Optional
+
+import numpy as np
+
 from .base_repository import BaseRepository
 from ..domain.models.restaurant import Restaurant, MenuCategory, MenuItem
+from ..services.geogrid import bounding_box, cell_of, covering_cells
+from ..services.geospatial_kernels import haversine_batch
 
 
 class RestaurantRepository(BaseRepository[Restaurant]):
-    """Repository for restaurant entities"""
-    
+    """Repository for restaurant entities.
+
+    Keeps a structure-of-arrays view of restaurant coordinates
+    (parallel float64 arrays) alongside the object store, so nearby
+    queries stream through contiguous memory instead of pointer-chasing
+    per-restaurant Location objects.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._capacity = 16
+        self._size = 0
+        self._lats = np.empty(self._capacity, dtype=np.float64)
+        self._lons = np.empty(self._capacity, dtype=np.float64)
+        self._rows = {}      # restaurant id -> row index
+        self._row_ids = []   # row index -> restaurant id
+        # Inverted index: lowercased cuisine -> restaurant ids, plus the
+        # cuisines each id was last indexed under so updates can evict
+        # stale buckets
+        self._cuisine_index = {}
+        self._cuisines_of = {}
+        # Live set of active restaurant ids, maintained on save
+        self._active_ids = set()
+        # id -> lowercased name, refreshed on save so search never
+        # re-lowercases per query (cuisines reuse _cuisines_of)
+        self._name_lower = {}
+        # Grid-cell spatial index: cell -> restaurant ids, plus each
+        # id's current cell for eviction on move
+        self._cell_index = {}
+        self._cell_of_id = {}
+
     def _get_entity_id(self, entity: Restaurant) -> str:
         return entity.id
-    
+
+    def save(self, entity: Restaurant) -> Restaurant:
+        """Save or update a restaurant, keeping the coordinate SoA in sync"""
+        with self._lock:
+            entity = super().save(entity)
+
+            if entity.location:
+                lat, lon = entity.location.latitude, entity.location.longitude
+            else:
+                lat = lon = np.nan  # NaN rows never pass a radius filter
+
+            row = self._rows.get(entity.id)
+            if row is None:
+                if self._size == self._capacity:
+                    self._capacity *= 2
+                    self._lats = np.resize(self._lats, self._capacity)
+                    self._lons = np.resize(self._lons, self._capacity)
+                row = self._size
+                self._rows[entity.id] = row
+                self._row_ids.append(entity.id)
+                self._size += 1
+            self._lats[row] = lat
+            self._lons[row] = lon
+            self._update_cell(entity.id, entity.location)
+
+            self._name_lower[entity.id] = entity.name.lower()
+            cuisines = tuple(c.lower() for c in entity.cuisine_types)
+            old_cuisines = self._cuisines_of.get(entity.id, ())
+            if cuisines != old_cuisines:
+                self._unindex_cuisines(entity.id, old_cuisines)
+                for cuisine in cuisines:
+                    self._cuisine_index.setdefault(cuisine, set()).add(entity.id)
+                self._cuisines_of[entity.id] = cuisines
+            if entity.is_active:
+                self._active_ids.add(entity.id)
+            else:
+                self._active_ids.discard(entity.id)
+        return entity
+
+    def _update_cell(self, entity_id, location):
+        new_cell = (
+            cell_of(location.latitude, location.longitude)
+            if location else None
+        )
+        old_cell = self._cell_of_id.get(entity_id)
+        if new_cell == old_cell:
+            return
+        if old_cell is not None:
+            ids = self._cell_index.get(old_cell)
+            if ids is not None:
+                ids.discard(entity_id)
+                if not ids:
+                    del self._cell_index[old_cell]
+        if new_cell is not None:
+            self._cell_index.setdefault(new_cell, set()).add(entity_id)
+            self._cell_of_id[entity_id] = new_cell
+        else:
+            self._cell_of_id.pop(entity_id, None)
+
+    def _unindex_cuisines(self, entity_id, cuisines):
+        for cuisine in cuisines:
+            ids = self._cuisine_index.get(cuisine)
+            if ids is not None:
+                ids.discard(entity_id)
+                if not ids:
+                    del self._cuisine_index[cuisine]
+
+    def delete(self, entity_id: str) -> bool:
+        """Delete a restaurant, swap-removing its SoA row"""
+        with self._lock:
+            if not super().delete(entity_id):
+                return False
+            row = self._rows.pop(entity_id)
+            last = self._size - 1
+            if row != last:
+                # Move the last row into the vacated slot
+                moved_id = self._row_ids[last]
+                self._lats[row] = self._lats[last]
+                self._lons[row] = self._lons[last]
+                self._row_ids[row] = moved_id
+                self._rows[moved_id] = row
+            self._row_ids.pop()
+            self._size -= 1
+            self._update_cell(entity_id, None)
+            self._unindex_cuisines(
+                entity_id, self._cuisines_of.pop(entity_id, ())
+            )
+            self._active_ids.discard(entity_id)
+            self._name_lower.pop(entity_id, None)
+        return True
+
     def find_active_restaurants(self) -> List[Restaurant]:
         """Find all active restaurants"""
-        return [r for r in self._storage.values() if r.is_active]
-    
+        return [self._storage[rid] for rid in self._active_ids]
+
     def find_by_cuisine(self, cuisine_type: str) -> List[Restaurant]:
-        """Find restaurants by cuisine type"""
-        return [
-            r for r in self._storage.values()
-            if cuisine_type.lower() in [c.lower() for c in r.cuisine_types]
-        ]
+        """Find restaurants by cuisine type via the inverted index"""
+        ids = self._cuisine_index.get(cuisine_type.lower())
+        if not ids:
+            return []
+        return [self._storage[rid] for rid in ids]
     
     def find_nearby_restaurants(self, latitude: float, longitude: float,
                                radius_km: float = 5.0) -> List[Restaurant]:
         """
         Find restaurants within a radius of given location
-        Uses Haversine formula for distance calculation
+        The grid index prunes to cells overlapping the radius, a
+        bounding-box mask rejects corner-cell outliers, then one
+        vectorized Haversine pass ranks the survivors closest-first
         """
-        from ..services.geospatial_service import GeospatialService
-        
-        geo_service = GeospatialService()
+        candidates = []
+        for cell in covering_cells(latitude, longitude, radius_km):
+            ids = self._cell_index.get(cell)
+            if ids:
+                candidates.extend(ids)
+        if not candidates:
+            return []
+
+        rows = np.fromiter(
+            (self._rows[rid] for rid in candidates),
+            np.intp, len(candidates)
+        )
+        cand_lats = self._lats[rows]
+        cand_lons = self._lons[rows]
+        lat_lo, lat_hi, lon_lo, lon_hi = bounding_box(
+            latitude, longitude, radius_km
+        )
+        keep = np.nonzero(
+            (cand_lats >= lat_lo) & (cand_lats <= lat_hi) &
+            (cand_lons >= lon_lo) & (cand_lons <= lon_hi)
+        )[0]
+        if keep.size == 0:
+            return []
+
+        distances = haversine_batch(
+            latitude, longitude, cand_lats[keep], cand_lons[keep]
+        )
+
         nearby_restaurants = []
-        
-        for restaurant in self._storage.values():
-            if not restaurant.is_active or not restaurant.location:
-                continue
-            
-            distance = geo_service.calculate_distance(
-                latitude, longitude,
-                restaurant.location.latitude,
-                restaurant.location.longitude
-            )
-            
-            if distance <= radius_km:
+        for index in np.argsort(distances):
+            if not distances[index] <= radius_km:
+                break
+            restaurant = self._storage[candidates[keep[index]]]
+            if restaurant.is_active:
                 nearby_restaurants.append(restaurant)
-        
-        # Sort by distance (closest first)
-        nearby_restaurants.sort(
-            key=lambda r: geo_service.calculate_distance(
-                latitude, longitude,
-                r.location.latitude,
-                r.location.longitude
-            )
-        )
-        
+
         return nearby_restaurants
     
     def find_by_owner(self, owner_id: str) -> List[Restaurant]:
@@ -68,16 +203,21 @@ class RestaurantRepository(BaseRepository[Restaurant]):
         ]
     
     def search(self, query: str) -> List[Restaurant]:
-        """Search restaurants by name or cuisine"""
+        """Search restaurants by name or cuisine.
+
+        Matches against the pre-lowercased name and cuisine shadows
+        kept up to date on save, so no per-query re-lowercasing.
+        """
         query_lower = query.lower()
-        results = []
-        
-        for restaurant in self._storage.values():
-            if (query_lower in restaurant.name.lower() or
-                any(query_lower in cuisine.lower() for cuisine in restaurant.cuisine_types)):
-                results.append(restaurant)
-        
-        return results
+        storage = self._storage
+        cuisines_of = self._cuisines_of
+        return [
+            storage[rid]
+            for rid, name_lower in self._name_lower.items()
+            if query_lower in name_lower or
+            any(query_lower in cuisine
+                for cuisine in cuisines_of.get(rid, ()))
+        ]
 
 
 class MenuCategoryRepository(BaseRepository[MenuCategory]):
@@ -5,57 +5,112 @@ from ..domain.models.review import Review
 
 
 class ReviewRepository(BaseRepository[Review]):
-    """Repository for review entities"""
-    
+    """Repository for review entities.
+
+    Reviews are append-mostly, so per-restaurant rating aggregates are
+    maintained incrementally on save/delete and the average is O(1)
+    instead of a scan-and-sum per call. The ordered indexes keep
+    reviews in creation order, so newest-first listings need no sort.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._register_ordered_multi_index(
+            "restaurant_id", lambda r: r.restaurant_id or None
+        )
+        self._register_ordered_multi_index(
+            "delivery_partner_id", lambda r: r.delivery_partner_id or None
+        )
+        self._register_ordered_multi_index(
+            "customer_id", lambda r: r.customer_id or None
+        )
+        # restaurant id -> (rating sum, review count), plus the
+        # (restaurant id, rating) each review was last counted under so
+        # updates and deletes can back out their contribution
+        self._rating_sums = {}
+        self._rating_counts = {}
+        self._counted_as = {}
+
     def _get_entity_id(self, entity: Review) -> str:
         return entity.id
-    
+
+    def save(self, entity: Review) -> Review:
+        """Save or update a review, keeping rating aggregates in sync"""
+        with self._lock:
+            entity = super().save(entity)
+            if entity.restaurant_id:
+                counted = (entity.restaurant_id, entity.rating.value)
+            else:  # delivery-only reviews carry no restaurant rating
+                counted = None
+            old_counted = self._counted_as.get(entity.id)
+            if counted != old_counted:
+                if old_counted is not None:
+                    self._uncount(*old_counted)
+                if counted is not None:
+                    restaurant_id, rating = counted
+                    self._rating_sums[restaurant_id] = (
+                        self._rating_sums.get(restaurant_id, 0.0) + rating
+                    )
+                    self._rating_counts[restaurant_id] = (
+                        self._rating_counts.get(restaurant_id, 0) + 1
+                    )
+                    self._counted_as[entity.id] = counted
+                else:
+                    self._counted_as.pop(entity.id, None)
+        return entity
+
+    def _uncount(self, restaurant_id, rating):
+        self._rating_sums[restaurant_id] -= rating
+        self._rating_counts[restaurant_id] -= 1
+        if not self._rating_counts[restaurant_id]:
+            del self._rating_sums[restaurant_id]
+            del self._rating_counts[restaurant_id]
+
+    def delete(self, entity_id: str) -> bool:
+        """Delete a review, backing its rating out of the aggregates"""
+        with self._lock:
+            if not super().delete(entity_id):
+                return False
+            counted = self._counted_as.pop(entity_id, None)
+            if counted is not None:
+                self._uncount(*counted)
+        return True
+
     def find_by_restaurant(self, restaurant_id: str) -> List[Review]:
-        """Find all reviews for a restaurant"""
-        reviews = [
-            r for r in self._storage.values()
-            if r.restaurant_id == restaurant_id
-        ]
-        reviews.sort(key=lambda r: r.created_at, reverse=True)
-        return reviews
-    
+        """Find all reviews for a restaurant, newest first"""
+        return self._find_by_multi_index(
+            "restaurant_id", restaurant_id, reverse=True
+        )
+
     def find_by_delivery_partner(self, partner_id: str) -> List[Review]:
-        """Find all reviews for a delivery partner"""
-        reviews = [
-            r for r in self._storage.values()
-            if r.delivery_partner_id == partner_id
-        ]
-        reviews.sort(key=lambda r: r.created_at, reverse=True)
-        return reviews
-    
+        """Find all reviews for a delivery partner, newest first"""
+        return self._find_by_multi_index(
+            "delivery_partner_id", partner_id, reverse=True
+        )
+
     def find_by_customer(self, customer_id: str) -> List[Review]:
-        """Find all reviews created by a customer"""
-        reviews = [
-            r for r in self._storage.values()
-            if r.customer_id == customer_id
-        ]
-        reviews.sort(key=lambda r: r.created_at, reverse=True)
-        return reviews
-    
+        """Find all reviews created by a customer, newest first"""
+        return self._find_by_multi_index(
+            "customer_id", customer_id, reverse=True
+        )
+
     def find_by_order(self, order_id: str) -> List[Review]:
         """Find all reviews for an order"""
         return [
             r for r in self._storage.values()
             if r.order_id == order_id
         ]
-    
+
     def find_verified_reviews(self, restaurant_id: str) -> List[Review]:
         """Find verified reviews for a restaurant"""
         return [
-            r for r in self._storage.values()
-            if r.restaurant_id == restaurant_id and r.is_verified
+            r for r in self.find_by_restaurant(restaurant_id)
+            if r.is_verified
         ]
-    
+
     def calculate_average_rating(self, restaurant_id: str) -> float:
-        """Calculate average rating for a restaurant"""
-        reviews = self.find_by_restaurant(restaurant_id)
-        if not reviews:
+        """Average rating for a restaurant from the running aggregates"""
+        count = self._rating_counts.get(restaurant_id, 0)
+        if not count:
             return 5.0
-        
-        total_rating = sum(r.rating.value for r in reviews)
-        return total_rating / len(reviews)
+        return self._rating_sums[restaurant_id] / count
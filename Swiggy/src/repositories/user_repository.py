@@ -1,29 +1,35 @@
 """User repository"""
 from typing import Optional, List
+
+import numpy as np
+
 from .base_repository import BaseRepository
 from ..domain.models.user import User, Customer, DeliveryPartner, RestaurantOwner
 from ..domain.enums import UserRole
+from ..services.geogrid import bounding_box, cell_of, covering_cells
+from ..services.geospatial_kernels import haversine_batch
 
 
 class UserRepository(BaseRepository[User]):
     """Repository for user entities"""
-    
+
+    def __init__(self):
+        super().__init__()
+        # Login hot path: email/phone resolve through unique indexes
+        # instead of scanning every user
+        self._register_unique_index("email", lambda u: u.email or None)
+        self._register_unique_index("phone", lambda u: u.phone or None)
+
     def _get_entity_id(self, entity: User) -> str:
         return entity.id
-    
+
     def find_by_email(self, email: str) -> Optional[User]:
         """Find user by email"""
-        for user in self._storage.values():
-            if user.email == email:
-                return user
-        return None
-    
+        return self._find_by_unique_index("email", email)
+
     def find_by_phone(self, phone: str) -> Optional[User]:
         """Find user by phone number"""
-        for user in self._storage.values():
-            if user.phone == phone:
-                return user
-        return None
+        return self._find_by_unique_index("phone", phone)
     
     def find_by_role(self, role: UserRole) -> List[User]:
         """Find all users by role"""
@@ -52,40 +58,147 @@ class CustomerRepository(BaseRepository[Customer]):
 
 
 class DeliveryPartnerRepository(BaseRepository[DeliveryPartner]):
-    """Repository for delivery partner entities"""
-    
+    """Repository for delivery partner entities.
+
+    Partner coordinates live in parallel float64 arrays beside the
+    object store (same structure-of-arrays layout as
+    RestaurantRepository), so radius queries run one vectorized
+    Haversine pass instead of per-partner trig.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._capacity = 16
+        self._size = 0
+        self._lats = np.empty(self._capacity, dtype=np.float64)
+        self._lons = np.empty(self._capacity, dtype=np.float64)
+        self._rows = {}      # partner id -> row index
+        self._row_ids = []   # row index -> partner id
+        # Grid-cell spatial index: cell -> partner ids, plus each id's
+        # current cell for eviction on move
+        self._cell_index = {}
+        self._cell_of_id = {}
+        # Live set of available partner ids, maintained on save
+        self._available_ids = set()
+
     def _get_entity_id(self, entity: DeliveryPartner) -> str:
         return entity.id
-    
+
+    def save(self, entity: DeliveryPartner) -> DeliveryPartner:
+        """Save or update a partner, keeping the coordinate SoA in sync"""
+        with self._lock:
+            entity = super().save(entity)
+
+            if entity.current_location:
+                lat = entity.current_location.latitude
+                lon = entity.current_location.longitude
+            else:
+                lat = lon = np.nan  # NaN rows never pass a radius filter
+
+            row = self._rows.get(entity.id)
+            if row is None:
+                if self._size == self._capacity:
+                    self._capacity *= 2
+                    self._lats = np.resize(self._lats, self._capacity)
+                    self._lons = np.resize(self._lons, self._capacity)
+                row = self._size
+                self._rows[entity.id] = row
+                self._row_ids.append(entity.id)
+                self._size += 1
+            self._lats[row] = lat
+            self._lons[row] = lon
+            self._update_cell(entity.id, entity.current_location)
+            if entity.is_available:
+                self._available_ids.add(entity.id)
+            else:
+                self._available_ids.discard(entity.id)
+        return entity
+
+    def _update_cell(self, entity_id, location):
+        new_cell = (
+            cell_of(location.latitude, location.longitude)
+            if location else None
+        )
+        old_cell = self._cell_of_id.get(entity_id)
+        if new_cell == old_cell:
+            return
+        if old_cell is not None:
+            ids = self._cell_index.get(old_cell)
+            if ids is not None:
+                ids.discard(entity_id)
+                if not ids:
+                    del self._cell_index[old_cell]
+        if new_cell is not None:
+            self._cell_index.setdefault(new_cell, set()).add(entity_id)
+            self._cell_of_id[entity_id] = new_cell
+        else:
+            self._cell_of_id.pop(entity_id, None)
+
+    def delete(self, entity_id: str) -> bool:
+        """Delete a partner, swap-removing its SoA row"""
+        with self._lock:
+            if not super().delete(entity_id):
+                return False
+            row = self._rows.pop(entity_id)
+            last = self._size - 1
+            if row != last:
+                # Move the last row into the vacated slot
+                moved_id = self._row_ids[last]
+                self._lats[row] = self._lats[last]
+                self._lons[row] = self._lons[last]
+                self._row_ids[row] = moved_id
+                self._rows[moved_id] = row
+            self._row_ids.pop()
+            self._size -= 1
+            self._update_cell(entity_id, None)
+            self._available_ids.discard(entity_id)
+        return True
+
     def find_available_partners(self) -> List[DeliveryPartner]:
         """Find all available delivery partners"""
-        return [
-            partner for partner in self._storage.values()
-            if partner.is_available
-        ]
-    
-    def find_by_location(self, latitude: float, longitude: float, 
+        return [self._storage[pid] for pid in self._available_ids]
+
+    def find_by_location(self, latitude: float, longitude: float,
                         radius_km: float = 10.0) -> List[DeliveryPartner]:
         """
         Find delivery partners near a location
-        Uses simple distance calculation for demo
+        The grid index prunes to cells overlapping the radius, a
+        bounding-box mask rejects corner-cell outliers, then one
+        vectorized Haversine pass filters the survivors
         """
-        from ..services.geospatial_service import GeospatialService
-        
-        geo_service = GeospatialService()
-        nearby_partners = []
-        
-        for partner in self._storage.values():
-            if partner.current_location:
-                distance = geo_service.calculate_distance(
-                    latitude, longitude,
-                    partner.current_location.latitude,
-                    partner.current_location.longitude
-                )
-                if distance <= radius_km:
-                    nearby_partners.append(partner)
-        
-        return nearby_partners
+        candidates = []
+        for cell in covering_cells(latitude, longitude, radius_km):
+            ids = self._cell_index.get(cell)
+            if ids:
+                candidates.extend(ids)
+        if not candidates:
+            return []
+
+        rows = np.fromiter(
+            (self._rows[rid] for rid in candidates),
+            np.intp, len(candidates)
+        )
+        cand_lats = self._lats[rows]
+        cand_lons = self._lons[rows]
+        lat_lo, lat_hi, lon_lo, lon_hi = bounding_box(
+            latitude, longitude, radius_km
+        )
+        keep = np.nonzero(
+            (cand_lats >= lat_lo) & (cand_lats <= lat_hi) &
+            (cand_lons >= lon_lo) & (cand_lons <= lon_hi)
+        )[0]
+        if keep.size == 0:
+            return []
+
+        distances = haversine_batch(
+            latitude, longitude, cand_lats[keep], cand_lons[keep]
+        )
+
+        storage = self._storage
+        return [
+            storage[candidates[keep[index]]]
+            for index in np.nonzero(distances <= radius_km)[0]
+        ]
 
 
 class RestaurantOwnerRepository(BaseRepository[RestaurantOwner]):
@@ -1,15 +1,16 @@
 """Delivery partner assignment service with strategy pattern"""
+import math
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from ..domain.models.user import DeliveryPartner
 from ..domain.models.delivery import Delivery
 from ..domain.models.order import Order
+from ..domain.value_objects import Location
 from ..domain.enums import DeliveryStatus
 from ..domain.exceptions import NoDeliveryPartnerAvailable
 from ..repositories.user_repository import DeliveryPartnerRepository
 from ..repositories.delivery_repository import DeliveryRepository
 from ..repositories.order_repository import OrderRepository
-from ..services.geospatial_service import GeospatialService
 
 
 class PartnerAssignmentStrategy(ABC):
@@ -24,36 +25,40 @@ class PartnerAssignmentStrategy(ABC):
 
 class NearestPartnerStrategy(PartnerAssignmentStrategy):
     """Assign nearest available partner"""
-    
-    def __init__(self, geo_service: GeospatialService):
-        self.geo_service = geo_service
-    
+
     def select_partner(self, partners: List[DeliveryPartner],
                        order: Order) -> Optional[DeliveryPartner]:
         """Select nearest partner to restaurant"""
         if not partners or not order.delivery_address:
             return None
-        
+
         # Filter partners with location
         partners_with_location = [
             p for p in partners if p.current_location is not None
         ]
-        
+
         if not partners_with_location:
             # Return first available partner if none have location
             return partners[0] if partners else None
-        
-        # Find nearest partner
-        nearest_partner = min(
-            partners_with_location,
-            key=lambda p: self.geo_service.calculate_distance(
-                order.delivery_address.latitude,
-                order.delivery_address.longitude,
-                p.current_location.latitude,
-                p.current_location.longitude
-            )
-        )
-        
+
+        # Find nearest partner. Ranking only needs a monotone key, so
+        # the tight loop compares squared equirectangular offsets in
+        # degrees — one cos up front, then two multiplies and a compare
+        # per partner, no lambda or key= dispatch
+        lat = order.delivery_address.latitude
+        lon = order.delivery_address.longitude
+        cos_lat = math.cos(math.radians(lat))
+        nearest_partner = None
+        best_d2 = math.inf
+        for partner in partners_with_location:
+            location = partner.current_location
+            dx = (location.longitude - lon) * cos_lat
+            dy = location.latitude - lat
+            d2 = dx * dx + dy * dy
+            if d2 < best_d2:
+                best_d2 = d2
+                nearest_partner = partner
+
         return nearest_partner
 
 
@@ -88,13 +93,11 @@ class DeliveryAssignmentService:
                  partner_repo: DeliveryPartnerRepository,
                  delivery_repo: DeliveryRepository,
                  order_repo: OrderRepository,
-                 geo_service: GeospatialService,
                  strategy: Optional[PartnerAssignmentStrategy] = None):
         self.partner_repo = partner_repo
         self.delivery_repo = delivery_repo
         self.order_repo = order_repo
-        self.geo_service = geo_service
-        self.strategy = strategy or NearestPartnerStrategy(geo_service)
+        self.strategy = strategy or NearestPartnerStrategy()
     
     def set_strategy(self, strategy: PartnerAssignmentStrategy):
         """Change assignment strategy at runtime"""
@@ -113,33 +116,36 @@ class DeliveryAssignmentService:
         if not order.delivery_address:
             raise ValueError("Order has no delivery address")
         
-        # Find available partners near restaurant
-        available_partners = self.partner_repo.find_available_partners()
-        
-        if not available_partners:
-            raise NoDeliveryPartnerAvailable("No partners currently available")
-        
-        # Use strategy to select best partner
-        selected_partner = self.strategy.select_partner(available_partners, order)
-        
-        if not selected_partner:
-            raise NoDeliveryPartnerAvailable()
-        
-        # Create delivery
-        delivery = Delivery(
-            order_id=order_id,
-            delivery_partner_id=selected_partner.id,
-            delivery_location=order.delivery_address,
-            status=DeliveryStatus.ASSIGNED
-        )
-        
-        # Update partner status
-        selected_partner.assign_order(order_id)
-        self.partner_repo.save(selected_partner)
-        
+        # Hold the partner-repo lock across find -> select -> assign so
+        # two concurrent orders cannot claim the same partner
+        with self.partner_repo._lock:
+            # Find available partners near restaurant
+            available_partners = self.partner_repo.find_available_partners()
+
+            if not available_partners:
+                raise NoDeliveryPartnerAvailable("No partners currently available")
+
+            # Use strategy to select best partner
+            selected_partner = self.strategy.select_partner(available_partners, order)
+
+            if not selected_partner:
+                raise NoDeliveryPartnerAvailable()
+
+            # Create delivery
+            delivery = Delivery(
+                order_id=order_id,
+                delivery_partner_id=selected_partner.id,
+                delivery_location=order.delivery_address,
+                status=DeliveryStatus.ASSIGNED
+            )
+
+            # Update partner status
+            selected_partner.assign_order(order_id)
+            self.partner_repo.save(selected_partner)
+
         # Save delivery
         self.delivery_repo.save(delivery)
-        
+
         return delivery
     
     def update_delivery_location(self, delivery_id: str,
@@ -149,7 +155,6 @@ class DeliveryAssignmentService:
         if not delivery:
             raise ValueError(f"Delivery {delivery_id} not found")
         
-        from ..domain.value_objects import Location
         location = Location(latitude=latitude, longitude=longitude)
         delivery.update_location(location)
         
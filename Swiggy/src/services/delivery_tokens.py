@@ -0,0 +1,47 @@
+"""HMAC-signed delivery tokens for review verification
+
+A token is issued when an order is delivered and proves, without a
+repository lookup, that a given customer received a given order from a
+given restaurant. The token is self-contained —
+``order_id|customer_id|restaurant_id.signature`` — so verifiers check
+the signature and then compare the embedded claims against what the
+caller asserts.
+"""
+import hashlib
+import hmac
+import secrets
+from typing import Optional, Tuple
+
+# Process-local signing key: tokens only need to outlive the in-memory
+# repositories they stand in for. A multi-process deployment would load
+# this from configuration instead.
+_SECRET = secrets.token_bytes(32)
+
+_SEP = "|"
+
+
+def _sign(payload: str) -> str:
+    return hmac.new(_SECRET, payload.encode(), hashlib.sha256).hexdigest()
+
+
+def issue_delivery_token(order_id: str, customer_id: str,
+                         restaurant_id: str) -> str:
+    """Issue a signed token binding an order to its customer and restaurant"""
+    payload = _SEP.join((order_id, customer_id, restaurant_id))
+    return f"{payload}.{_sign(payload)}"
+
+
+def parse_delivery_token(token: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Return the (order_id, customer_id, restaurant_id) claims if the
+    token's signature is valid, else None
+    """
+    payload, sep, signature = token.rpartition(".")
+    if not sep:
+        return None
+    if not hmac.compare_digest(signature, _sign(payload)):
+        return None
+    parts = payload.split(_SEP)
+    if len(parts) != 3:
+        return None
+    return parts[0], parts[1], parts[2]
@@ -0,0 +1,54 @@
+"""Fixed-grid spatial cells for candidate pruning.
+
+A cell is an integer (lat band, lon band) pair at CELL_DEG degrees
+(~5.5 km per band). Repositories bucket entity ids by cell on save, so
+a radius query probes only the cell neighborhood that can overlap the
+radius and runs precise Haversine over those few candidates instead of
+the whole table — a hand-rolled stand-in for a geohash/S2 index with
+no extra dependency.
+"""
+import math
+from typing import List, Tuple
+
+Cell = Tuple[int, int]
+
+CELL_DEG = 0.05
+_KM_PER_DEG = 111.0
+
+
+def cell_of(latitude: float, longitude: float) -> Cell:
+    """Grid cell containing the coordinate"""
+    return (
+        math.floor(latitude / CELL_DEG),
+        math.floor(longitude / CELL_DEG),
+    )
+
+
+def bounding_box(latitude: float, longitude: float,
+                 radius_km: float) -> Tuple[float, float, float, float]:
+    """(lat_lo, lat_hi, lon_lo, lon_hi) enclosing the radius.
+
+    Four float compares against this box reject candidates before any
+    trig; cells overlapping the radius still include corner points
+    outside it, so the box test prunes what cell pruning cannot.
+    """
+    dlat = radius_km / _KM_PER_DEG
+    cos_lat = max(math.cos(math.radians(latitude)), 0.01)
+    dlon = radius_km / (_KM_PER_DEG * cos_lat)
+    return (latitude - dlat, latitude + dlat,
+            longitude - dlon, longitude + dlon)
+
+
+def covering_cells(latitude: float, longitude: float,
+                   radius_km: float) -> List[Cell]:
+    """All cells whose contents may lie within radius_km of the point"""
+    span_lat = int(radius_km / (_KM_PER_DEG * CELL_DEG)) + 1
+    # Longitude degrees shrink with latitude; clamp near the poles
+    cos_lat = max(math.cos(math.radians(latitude)), 0.01)
+    span_lon = int(radius_km / (_KM_PER_DEG * cos_lat * CELL_DEG)) + 1
+    base_lat, base_lon = cell_of(latitude, longitude)
+    return [
+        (base_lat + dlat, base_lon + dlon)
+        for dlat in range(-span_lat, span_lat + 1)
+        for dlon in range(-span_lon, span_lon + 1)
+    ]
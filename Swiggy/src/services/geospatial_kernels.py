@@ -0,0 +1,93 @@
+"""Vectorized geospatial kernels.
+
+The batch Haversine below operates on contiguous float64 arrays (SoA
+layout) so the whole candidate scan runs as one vectorized kernel
+instead of one interpreted trig call per restaurant. When Numba is
+installed the kernels are additionally JIT-compiled (cached to disk,
+with fastmath); without it the plain NumPy/math paths are used.
+"""
+import math
+from math import asin, cos, sin, sqrt
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; NumPy alone is still vectorized
+    njit = None
+
+EARTH_RADIUS_KM = 6371.0
+_KM_PER_DEG = EARTH_RADIUS_KM * math.pi / 180.0
+_DEG2RAD = math.pi / 180.0
+_TWO_R_KM = 2.0 * EARTH_RADIUS_KM
+
+
+def _haversine_batch(lat0, lon0, lats, lons):
+    lat0_rad = np.radians(lat0)
+    lats_rad = np.radians(lats)
+    dlat = lats_rad - lat0_rad
+    dlon = np.radians(lons) - np.radians(lon0)
+
+    a = (np.sin(dlat / 2.0) ** 2 +
+         np.cos(lat0_rad) * np.cos(lats_rad) *
+         np.sin(dlon / 2.0) ** 2)
+
+    return EARTH_RADIUS_KM * 2.0 * np.arcsin(np.sqrt(a))
+
+
+if njit is not None:
+    _haversine_batch = njit(cache=True, fastmath=True)(_haversine_batch)
+
+
+def haversine_batch(lat0: float, lon0: float,
+                    lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Distances in km from (lat0, lon0) to every (lats[i], lons[i])"""
+    return _haversine_batch(
+        float(lat0), float(lon0),
+        np.ascontiguousarray(lats, dtype=np.float64),
+        np.ascontiguousarray(lons, dtype=np.float64)
+    )
+
+
+def haversine_km(lat1: float, lon1: float,
+                 lat2: float, lon2: float) -> float:
+    """Scalar Haversine distance in km for single-pair hot paths.
+
+    Degree conversion is folded into multiplies by _DEG2RAD and the
+    trig names are imported directly, so the pure-Python path does no
+    math-module attribute lookups and only four transcendental calls.
+    """
+    lat1_rad = lat1 * _DEG2RAD
+    lat2_rad = lat2 * _DEG2RAD
+    sin_dlat = sin((lat2_rad - lat1_rad) * 0.5)
+    sin_dlon = sin((lon2 - lon1) * _DEG2RAD * 0.5)
+
+    a = (sin_dlat * sin_dlat +
+         cos(lat1_rad) * cos(lat2_rad) * sin_dlon * sin_dlon)
+
+    return _TWO_R_KM * asin(sqrt(a))
+
+
+def approx_distance_sq_km(lat1: float, lon1: float,
+                          lat2: float, lon2: float) -> float:
+    """Squared equirectangular distance in km² for short-range ranking.
+
+    One cos and no sqrt/asin per pair; monotone in true distance at
+    city scale, so it is a valid min/sort key. Use haversine_km when
+    the actual distance matters.
+    """
+    dlat = lat2 - lat1
+    dlon = (lon2 - lon1) * cos((lat1 + lat2) * 0.5 * _DEG2RAD)
+    return (dlat * dlat + dlon * dlon) * (_KM_PER_DEG * _KM_PER_DEG)
+
+
+if njit is not None:
+    haversine_km = njit(cache=True, fastmath=True)(haversine_km)
+    approx_distance_sq_km = njit(cache=True, fastmath=True)(
+        approx_distance_sq_km
+    )
+    # Warm the kernels at import so the first request does not pay
+    # compilation latency
+    haversine_km(0.0, 0.0, 0.0, 0.0)
+    approx_distance_sq_km(0.0, 0.0, 0.0, 0.0)
+    haversine_batch(0.0, 0.0, np.zeros(1), np.zeros(1))
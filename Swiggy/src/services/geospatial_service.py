@@ -1,39 +1,63 @@
 """Geospatial service for distance calculations and location-based queries"""
-import math
-from typing import Tuple
+from functools import lru_cache
+
+import numpy as np
+
+from .geospatial_kernels import (
+    EARTH_RADIUS_KM, approx_distance_sq_km, haversine_batch, haversine_km
+)
+
+
+@lru_cache(maxsize=100_000)
+def _cached_haversine_km(lat1: float, lon1: float,
+                         lat2: float, lon2: float) -> float:
+    # Module-level so `self` never enters the cache key; callers pass
+    # pre-quantized coordinates
+    return haversine_km(lat1, lon1, lat2, lon2)
 
 
 class GeospatialService:
     """Service for geospatial operations"""
-    
-    EARTH_RADIUS_KM = 6371.0  # Earth's radius in kilometers
-    
-    def calculate_distance(self, lat1: float, lon1: float, 
+
+    EARTH_RADIUS_KM = EARTH_RADIUS_KM  # Earth's radius in kilometers
+
+    def calculate_distance(self, lat1: float, lon1: float,
                           lat2: float, lon2: float) -> float:
         """
         Calculate distance between two coordinates using Haversine formula
         Returns distance in kilometers
+
+        Popular pairs recur (few hot restaurants, slow-moving partners),
+        so results are memoized on coordinates quantized to 5 decimal
+        places (~1 m). The bulk array path bypasses this cache.
         """
-        # Convert to radians
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        lon1_rad = math.radians(lon1)
-        lon2_rad = math.radians(lon2)
-        
-        # Haversine formula
-        dlat = lat2_rad - lat1_rad
-        dlon = lon2_rad - lon1_rad
-        
-        a = (math.sin(dlat / 2) ** 2 + 
-             math.cos(lat1_rad) * math.cos(lat2_rad) * 
-             math.sin(dlon / 2) ** 2)
-        
-        c = 2 * math.asin(math.sqrt(a))
-        
-        distance = self.EARTH_RADIUS_KM * c
-        return distance
+        return _cached_haversine_km(
+            round(lat1, 5), round(lon1, 5),
+            round(lat2, 5), round(lon2, 5)
+        )
+
+    @staticmethod
+    def clear_distance_cache():
+        """Drop all memoized distances (admin/testing hook)"""
+        _cached_haversine_km.cache_clear()
     
-    def estimate_delivery_time(self, distance_km: float, 
+    def approx_distance_sq_km(self, lat1: float, lon1: float,
+                              lat2: float, lon2: float) -> float:
+        """
+        Squared equirectangular distance in km² — a cheap monotone
+        ranking key for short-range nearest/sort queries
+        """
+        return approx_distance_sq_km(lat1, lon1, lat2, lon2)
+
+    def calculate_distances_batch(self, lat0: float, lon0: float,
+                                  lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+        """
+        Calculate distances from one origin to many candidate coordinates
+        Takes parallel latitude/longitude arrays, returns distances in km
+        """
+        return haversine_batch(lat0, lon0, lats, lons)
+
+    def estimate_delivery_time(self, distance_km: float,
                                preparation_time_minutes: int = 30) -> int:
         """
         Estimate total delivery time in minutes
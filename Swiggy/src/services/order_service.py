@@ -14,6 +14,7 @@ from ..domain.exceptions import (
 from ..repositories.order_repository import OrderRepository, OrderItemRepository
 from ..repositories.restaurant_repository import RestaurantRepository
 from ..repositories.user_repository import CustomerRepository
+from .delivery_tokens import issue_delivery_token
 
 
 class OrderService:
@@ -58,27 +59,28 @@ class OrderService:
             is_subscription_order=is_subscription_order
         )
         
-        # Add items
+        # Build all items first, then persist them in one batch
+        order_items = []
         for item_data in items:
             menu_item = restaurant.get_menu_item(item_data['menu_item_id'])
-            
+
             if not menu_item:
                 raise ValueError(f"Menu item {item_data['menu_item_id']} not found")
-            
+
             if not menu_item.is_available:
                 raise InsufficientInventory(menu_item.name)
-            
-            order_item = OrderItem(
+
+            order_items.append(OrderItem(
                 menu_item_id=menu_item.id,
                 menu_item_name=menu_item.name,
                 quantity=item_data.get('quantity', 1),
                 unit_price=menu_item.price,
                 special_instructions=item_data.get('special_instructions', '')
-            )
-            
-            order.add_item(order_item)
-            self.order_item_repo.save(order_item)
-        
+            ))
+
+        order.add_items(order_items)  # single totals recompute
+        self.order_item_repo.save_bulk(order_items)
+
         # Calculate loyalty points
         order.calculate_loyalty_points_earned()
         
@@ -110,12 +112,18 @@ class OrderService:
         # Use state machine to validate transition
         order.transition_to(new_status)
         
-        # Award loyalty points when order is delivered
-        if new_status == OrderStatus.DELIVERED and order.loyalty_points_earned > 0:
-            customer = self.customer_repo.find_by_id(order.customer_id)
-            if customer:
-                customer.add_loyalty_points(order.loyalty_points_earned)
-                self.customer_repo.save(customer)
+        if new_status == OrderStatus.DELIVERED:
+            # Proof of delivery for review verification (see
+            # ReviewService): an HMAC check replaces an order fetch
+            order.delivery_token = issue_delivery_token(
+                order.id, order.customer_id, order.restaurant_id
+            )
+            # Award loyalty points when order is delivered
+            if order.loyalty_points_earned > 0:
+                customer = self.customer_repo.find_by_id(order.customer_id)
+                if customer:
+                    customer.add_loyalty_points(order.loyalty_points_earned)
+                    self.customer_repo.save(customer)
         
         # Save with version increment
         self.order_repo.save_with_version_check(order, order.version)
@@ -164,14 +172,18 @@ class OrderService:
         Process scheduled orders that are ready
         Returns list of orders that were processed
         """
-        ready_orders = self.order_repo.find_ready_scheduled_orders()
+        ready_orders = self.order_repo.pop_ready_scheduled_orders()
         processed = []
-        
+
         for order in ready_orders:
             try:
                 self.update_order_status(order.id, OrderStatus.CONFIRMED)
                 processed.append(order)
             except Exception as e:
                 print(f"Failed to process scheduled order {order.id}: {e}")
+                # The heap entry was consumed by the pop above; save()
+                # re-enqueues the still-CREATED order so it is retried
+                # on the next poll instead of dropping out of scheduling
+                self.order_repo.save(order)
         
         return processed
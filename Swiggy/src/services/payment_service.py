@@ -66,24 +66,28 @@ class UPIPaymentGateway(PaymentGateway):
         return True
 
 
+# Gateways are stateless, so one shared instance per method serves every
+# payment instead of rebuilding the mapping and a fresh object per call
+_GATEWAYS = {
+    PaymentMethod.CASH: CashPaymentGateway(),
+    PaymentMethod.CARD: CardPaymentGateway(),
+    PaymentMethod.UPI: UPIPaymentGateway(),
+    PaymentMethod.WALLET: CardPaymentGateway()  # Similar to card
+}
+
+
 class PaymentGatewayFactory:
     """Factory for creating payment gateways"""
-    
+
     @staticmethod
     def create_gateway(payment_method: PaymentMethod) -> PaymentGateway:
-        """Create appropriate payment gateway based on method"""
-        gateways = {
-            PaymentMethod.CASH: CashPaymentGateway,
-            PaymentMethod.CARD: CardPaymentGateway,
-            PaymentMethod.UPI: UPIPaymentGateway,
-            PaymentMethod.WALLET: CardPaymentGateway  # Similar to card
-        }
-        
-        gateway_class = gateways.get(payment_method)
-        if not gateway_class:
-            raise ValueError(f"Unsupported payment method: {payment_method}")
-        
-        return gateway_class()
+        """Return the shared gateway for a payment method.
+
+        PaymentMethod is a closed enum with a gateway registered for
+        every variant, so the lookup cannot miss for any real method;
+        a hand-built value would surface as a KeyError.
+        """
+        return _GATEWAYS[payment_method]
 
 
 class PaymentService:
@@ -98,29 +102,25 @@ class PaymentService:
         """
         Create and process a payment with idempotency support
         """
-        # Check idempotency key to prevent duplicate payments
-        if idempotency_key:
-            existing_payment = self.payment_repo.find_by_idempotency_key(
-                idempotency_key
-            )
-            if existing_payment:
-                return existing_payment
-        
         # Check if payment already exists for order
         existing_payment = self.payment_repo.find_by_order(order_id)
         if existing_payment and existing_payment.is_successful():
             return existing_payment
-        
-        # Create payment
+
+        # Create payment; the atomic insert-or-return-existing closes
+        # the check-then-act race on the idempotency key
         payment = Payment(
             order_id=order_id,
             amount=amount,
             payment_method=payment_method,
             idempotency_key=idempotency_key or str(uuid4())
         )
-        
-        self.payment_repo.save(payment)
-        
+
+        saved = self.payment_repo.save_if_absent(payment)
+        if saved is not payment:
+            # A request with the same idempotency key got there first
+            return saved
+
         # Process payment
         return self.process_payment(payment.id)
     
@@ -138,8 +138,8 @@ class PaymentService:
         
         try:
             # Get appropriate gateway
-            gateway = PaymentGatewayFactory.create_gateway(payment.payment_method)
-            
+            gateway = _GATEWAYS[payment.payment_method]
+
             # Process payment
             success, transaction_id = gateway.process_payment(payment.amount)
             
@@ -171,8 +171,8 @@ class PaymentService:
         refund_amount = amount or payment.amount
         
         try:
-            gateway = PaymentGatewayFactory.create_gateway(payment.payment_method)
-            
+            gateway = _GATEWAYS[payment.payment_method]
+
             if gateway.process_refund(payment.transaction_id, refund_amount):
                 payment.process_refund(refund_amount)
                 self.payment_repo.save(payment)
@@ -60,10 +60,14 @@ class RestaurantService:
             description=description
         )
         
+        # find_by_id returns the stored aggregate itself, so the
+        # in-place add_category is already visible; adding a category
+        # touches none of the restaurant's indexed fields, making a
+        # parent re-save (and its reindex pass) pure overhead. One
+        # write: the new child.
         restaurant.add_category(category)
-        self.restaurant_repo.save(restaurant)
         self.category_repo.save(category)
-        
+
         return category
     
     def add_menu_item(self, category_id: str, name: str, 
@@ -80,10 +84,12 @@ class RestaurantService:
             **kwargs
         )
         
+        # Same single-flush rule as add_menu_category: the stored
+        # category is mutated in place and its indexed fields are
+        # untouched, so only the new item needs a write.
         category.add_item(item)
-        self.category_repo.save(category)
         self.item_repo.save(item)
-        
+
         return item
     
     def update_item_availability(self, item_id: str, is_available: bool) -> bool:
@@ -1,11 +1,12 @@
 """Review and rating service"""
-from typing import List, Optional
+from typing import Dict, List, Optional
 from ..domain.models.review import Review
 from ..domain.value_objects import Rating
 from ..repositories.review_repository import ReviewRepository
 from ..repositories.restaurant_repository import RestaurantRepository
 from ..repositories.user_repository import DeliveryPartnerRepository
 from ..repositories.order_repository import OrderRepository
+from .delivery_tokens import parse_delivery_token
 
 
 class ReviewService:
@@ -23,14 +24,23 @@ class ReviewService:
     
     def create_restaurant_review(self, customer_id: str, order_id: str,
                                  restaurant_id: str, rating: float,
-                                 comment: str = "") -> Review:
+                                 comment: str = "",
+                                 delivery_token: Optional[str] = None) -> Review:
         """Create a review for a restaurant"""
-        # Verify customer actually ordered from this restaurant
-        order = self.order_repo.find_by_id(order_id)
-        is_verified = (order and 
-                      order.customer_id == customer_id and
-                      order.restaurant_id == restaurant_id)
-        
+        # Verify customer actually ordered from this restaurant. A
+        # delivery token (issued when the order was delivered) proves
+        # this with an HMAC check, skipping the order lookup; the
+        # repository fetch remains as the tokenless fallback.
+        if delivery_token is not None:
+            is_verified = parse_delivery_token(delivery_token) == (
+                order_id, customer_id, restaurant_id
+            )
+        else:
+            order = self.order_repo.find_by_id(order_id)
+            is_verified = (order and
+                          order.customer_id == customer_id and
+                          order.restaurant_id == restaurant_id)
+
         review = Review(
             customer_id=customer_id,
             order_id=order_id,
@@ -41,20 +51,28 @@ class ReviewService:
         )
         
         self.review_repo.save(review)
-        
+
         # Update restaurant rating
-        self._update_restaurant_rating(restaurant_id)
-        
+        self._update_restaurant_rating(restaurant_id, rating)
+
         return review
     
     def create_delivery_review(self, customer_id: str, order_id: str,
                                delivery_partner_id: str, rating: float,
-                               comment: str = "") -> Review:
+                               comment: str = "",
+                               delivery_token: Optional[str] = None) -> Review:
         """Create a review for a delivery partner"""
-        # Verify delivery
-        order = self.order_repo.find_by_id(order_id)
-        is_verified = order and order.customer_id == customer_id
-        
+        # Verify delivery; the token's embedded claims cover the
+        # order/customer pair this review needs
+        if delivery_token is not None:
+            claims = parse_delivery_token(delivery_token)
+            is_verified = (claims is not None and
+                           claims[0] == order_id and
+                           claims[1] == customer_id)
+        else:
+            order = self.order_repo.find_by_id(order_id)
+            is_verified = order and order.customer_id == customer_id
+
         review = Review(
             customer_id=customer_id,
             order_id=order_id,
@@ -65,12 +83,62 @@ class ReviewService:
         )
         
         self.review_repo.save(review)
-        
+
         # Update partner rating
-        self._update_partner_rating(delivery_partner_id)
-        
+        self._update_partner_rating(delivery_partner_id, rating)
+
         return review
     
+    def create_reviews_bulk(self, review_requests: List[Dict]) -> List[Review]:
+        """
+        Create many reviews with a single order prefetch
+        review_requests: List of dicts with 'customer_id', 'order_id',
+        'rating', either 'restaurant_id' or 'delivery_partner_id', and
+        optional 'comment'
+
+        All referenced orders are fetched in one find_by_ids call and
+        verified in memory, so a batch of N reviews does two repository
+        round-trips instead of N+1.
+        """
+        orders = self.order_repo.find_by_ids(
+            [request['order_id'] for request in review_requests]
+        )
+
+        reviews = []
+        for request in review_requests:
+            order = orders.get(request['order_id'])
+            restaurant_id = request.get('restaurant_id')
+            partner_id = request.get('delivery_partner_id')
+            is_verified = bool(
+                order and
+                order.customer_id == request['customer_id'] and
+                (restaurant_id is None or
+                 order.restaurant_id == restaurant_id)
+            )
+            reviews.append(Review(
+                customer_id=request['customer_id'],
+                order_id=request['order_id'],
+                restaurant_id=restaurant_id,
+                delivery_partner_id=partner_id,
+                rating=Rating(request['rating']),
+                comment=request.get('comment', ''),
+                is_verified=is_verified
+            ))
+
+        self.review_repo.save_bulk(reviews)
+
+        for review in reviews:
+            if review.restaurant_id:
+                self._update_restaurant_rating(
+                    review.restaurant_id, review.rating.value
+                )
+            if review.delivery_partner_id:
+                self._update_partner_rating(
+                    review.delivery_partner_id, review.rating.value
+                )
+
+        return reviews
+
     def get_restaurant_reviews(self, restaurant_id: str) -> List[Review]:
         """Get all reviews for a restaurant"""
         return self.review_repo.find_by_restaurant(restaurant_id)
@@ -79,26 +147,24 @@ class ReviewService:
         """Get all reviews for a delivery partner"""
         return self.review_repo.find_by_delivery_partner(partner_id)
     
-    def _update_restaurant_rating(self, restaurant_id: str):
-        """Update restaurant's average rating"""
+    def _update_restaurant_rating(self, restaurant_id: str, rating: float):
+        """Fold one new review rating into the restaurant's aggregate.
+
+        The entity keeps a running (sum, count), so this is O(1) — no
+        review fetch or mean recompute per write.
+        """
         restaurant = self.restaurant_repo.find_by_id(restaurant_id)
         if not restaurant:
             return
-        
-        avg_rating = self.review_repo.calculate_average_rating(restaurant_id)
-        restaurant.update_rating(avg_rating)
+
+        restaurant.update_rating(rating)
         self.restaurant_repo.save(restaurant)
-    
-    def _update_partner_rating(self, partner_id: str):
-        """Update delivery partner's average rating"""
+
+    def _update_partner_rating(self, partner_id: str, rating: float):
+        """Fold one new review rating into the partner's aggregate"""
         partner = self.partner_repo.find_by_id(partner_id)
         if not partner:
             return
-        
-        reviews = self.review_repo.find_by_delivery_partner(partner_id)
-        if not reviews:
-            return
-        
-        avg_rating = sum(r.rating.value for r in reviews) / len(reviews)
-        partner.update_rating(avg_rating)
+
+        partner.update_rating(rating)
         self.partner_repo.save(partner)
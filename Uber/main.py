@@ -95,23 +95,23 @@ def main():
     threads = []
     
     # Rider 1 -> UberGo
-    t1 = threading.Thread(target=simulate_ride_request, args=(riders[0], Location(0,0), Location(5,5), UberGo(1), ride_svc))
+    t1 = threading.Thread(target=simulate_ride_request, args=(riders[0], Location(0,0), Location(5,5), UberGo(), ride_svc))
     threads.append(t1)
 
     # Rider 2 -> UberGo (Competing for d1/d2)
-    t2 = threading.Thread(target=simulate_ride_request, args=(user_svc.get_rider(202), Location(0.1,0.1), Location(6,6), UberGo(2), ride_svc))
+    t2 = threading.Thread(target=simulate_ride_request, args=(user_svc.get_rider(202), Location(0.1,0.1), Location(6,6), UberGo(), ride_svc))
     threads.append(t2)
 
     # Rider 4 -> UberGo (Competing)
-    t4 = threading.Thread(target=simulate_ride_request, args=(user_svc.get_rider(204), Location(0.2,0.2), Location(7,7), UberGo(4), ride_svc))
+    t4 = threading.Thread(target=simulate_ride_request, args=(user_svc.get_rider(204), Location(0.2,0.2), Location(7,7), UberGo(), ride_svc))
     threads.append(t4)
     
     # Rider 3 -> UberXL (Should get d3)
-    t3 = threading.Thread(target=simulate_ride_request, args=(user_svc.get_rider(203), Location(0,0), Location(5,5), UberXL(3), ride_svc))
+    t3 = threading.Thread(target=simulate_ride_request, args=(user_svc.get_rider(203), Location(0,0), Location(5,5), UberXL(), ride_svc))
     threads.append(t3)
     
     # Rider 5 -> TTL Test (Force Expiry)
-    t5 = threading.Thread(target=simulate_ride_request, args=(user_svc.get_rider(205), Location(0,0), Location(5,5), UberGo(5), ride_svc, True))
+    t5 = threading.Thread(target=simulate_ride_request, args=(user_svc.get_rider(205), Location(0,0), Location(5,5), UberGo(), ride_svc, True))
     threads.append(t5)
 
 
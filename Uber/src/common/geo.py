@@ -0,0 +1,53 @@
+"""Geodesic distance helpers shared by fare estimation and matching.
+
+Two tiers, matching how the callers use them:
+
+- Full haversine for fares, where the number in km is what's billed.
+- Squared equirectangular for ranking (see the matching strategies),
+  where only the ordering matters and the cos-latitude-scaled planar
+  approximation is exact enough over pickup-radius scales.
+"""
+import math
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0
+_DEG2RAD = math.pi / 180.0
+_TWO_R_KM = 2.0 * EARTH_RADIUS_KM
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points, in kilometers."""
+    lat1_rad = lat1 * _DEG2RAD
+    lat2_rad = lat2 * _DEG2RAD
+    sin_dlat = math.sin((lat2_rad - lat1_rad) * 0.5)
+    sin_dlon = math.sin((lon2 - lon1) * _DEG2RAD * 0.5)
+    a = (sin_dlat * sin_dlat +
+         math.cos(lat1_rad) * math.cos(lat2_rad) * sin_dlon * sin_dlon)
+    return _TWO_R_KM * math.asin(math.sqrt(a))
+
+
+def haversine_vec(lat0: float, lon0: float, lats, lons):
+    """Great-circle distances from one point to arrays of points, in km.
+
+    One set of vectorized trig passes over the whole batch; the origin's
+    trig is computed once as scalars.
+    """
+    lat0_rad = lat0 * _DEG2RAD
+    lats_rad = lats * _DEG2RAD
+    sin_dlat = np.sin((lats_rad - lat0_rad) * 0.5)
+    sin_dlon = np.sin((lons - lon0) * (_DEG2RAD * 0.5))
+    a = (sin_dlat * sin_dlat +
+         math.cos(lat0_rad) * np.cos(lats_rad) * sin_dlon * sin_dlon)
+    return _TWO_R_KM * np.arcsin(np.sqrt(a))
+
+
+def haversine_pairwise(lat1s, lon1s, lat2s, lon2s):
+    """Element-wise great-circle distances between two point arrays, km."""
+    lat1s_rad = lat1s * _DEG2RAD
+    lat2s_rad = lat2s * _DEG2RAD
+    sin_dlat = np.sin((lat2s_rad - lat1s_rad) * 0.5)
+    sin_dlon = np.sin((lon2s - lon1s) * (_DEG2RAD * 0.5))
+    a = (sin_dlat * sin_dlat +
+         np.cos(lat1s_rad) * np.cos(lat2s_rad) * sin_dlon * sin_dlon)
+    return _TWO_R_KM * np.arcsin(np.sqrt(a))
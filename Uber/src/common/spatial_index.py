@@ -1,45 +1,153 @@
-from typing import List, Dict, Set
+import math
+from typing import List, Dict, Set, Tuple
 from src.model.location import Location
 
+# Rough km per degree of latitude, for sizing cell rings against a
+# radius expressed in km
+_KM_PER_DEG = 111.0
+# Hard cap on ring count so a huge radius can't degenerate into a
+# full-grid sweep
+_MAX_RINGS = 3
+
 class SpatialIndex:
     """
     A simple Grid-based Spatial Index.
     Divides the world into cells of fixed size (LAT/LON DEGREES).
     """
+    __slots__ = ("_cell_size", "_inv_cell_size", "_grid", "_driver_cell")
+
     def __init__(self, cell_size_degrees: float = 0.01):
         # 0.01 degrees is approx 1.11 km
         self._cell_size = cell_size_degrees
-        self._grid: Dict[str, Set['Driver']] = {} # CellID -> Set of Drivers
+        # Multiply by the reciprocal instead of dividing in every cell
+        # computation; float division is the slower operation
+        self._inv_cell_size = 1.0 / cell_size_degrees
+        # (x, y) int tuple keys: hashing a tuple of two ints is far
+        # cheaper than formatting and hashing an "x,y" string per
+        # update/search, and allocates nothing
+        self._grid: Dict[Tuple[int, int], Set['Driver']] = {}
+        # driver user_id -> cell the driver was last indexed under, so
+        # a moving driver is evicted from its old cell instead of
+        # leaking into every cell it ever visited
+        self._driver_cell: Dict[int, Tuple[int, int]] = {}
+
+    def _get_cell_id(self, location: Location) -> Tuple[int, int]:
+        inv = self._inv_cell_size
+        return (int(location.latitude * inv),
+                int(location.longitude * inv))
+
+    @property
+    def cell_size_degrees(self) -> float:
+        return self._cell_size
+
+    def cell_of(self, location: Location) -> Tuple[int, int]:
+        """Public cell lookup so callers can key per-cell locking."""
+        return self._get_cell_id(location)
+
+    def neighborhood_cells(self, center: Location) -> List[Tuple[int, int]]:
+        """The 9-cell Moore neighborhood, center cell first.
+
+        Ordering matters: a caller scanning for the nearest driver can
+        often stop after the center cell (see iter_nearby consumers).
+        """
+        cx, cy = self._get_cell_id(center)
+        cells = [(cx, cy)]
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                if dx or dy:
+                    cells.append((cx + dx, cy + dy))
+        return cells
+
+    def drivers_in_cell(self, cell_id: Tuple[int, int]) -> List['Driver']:
+        """Snapshot of one cell's drivers (empty list if vacant)."""
+        cell = self._grid.get(cell_id)
+        return list(cell) if cell else []
 
-    def _get_cell_id(self, location: Location) -> str:
-        x = int(location.latitude / self._cell_size)
-        y = int(location.longitude / self._cell_size)
-        return f"{x},{y}"
+    def current_cell_of(self, driver: 'Driver') -> Tuple[int, int]:
+        """Cell the driver is currently indexed under, or None."""
+        return self._driver_cell.get(driver.user_id)
 
     def update(self, driver: 'Driver'):
-        """Adds or updates a driver in the grid."""
+        """Adds or updates a driver in the grid, moving it between cells."""
         cell_id = self._get_cell_id(driver.location)
-        if cell_id not in self._grid:
-             self._grid[cell_id] = set()
-        self._grid[cell_id].add(driver)
+        old_cell_id = self._driver_cell.get(driver.user_id)
+        if old_cell_id == cell_id:
+            return  # Same cell, nothing to re-hash
+        if old_cell_id is not None:
+            old_cell = self._grid.get(old_cell_id)
+            if old_cell is not None:
+                old_cell.discard(driver)
+                if not old_cell:
+                    del self._grid[old_cell_id]
+        cell = self._grid.get(cell_id)
+        if cell is None:
+            cell = self._grid[cell_id] = set()
+        cell.add(driver)
+        self._driver_cell[driver.user_id] = cell_id
+
+    def cells_for_radius(self, center: Location,
+                         radius_km: float) -> List[Tuple[int, int]]:
+        """Cells whose area can intersect the query radius.
+
+        Enough rings of cells are taken to cover the radius (at least
+        the Moore neighborhood, at most _MAX_RINGS), and outer-ring
+        cells provably farther than the radius are pruned so the scan
+        touches only the bounding box of the query, not a full square.
+        """
+        cell_km = self._cell_size * _KM_PER_DEG
+        rings = max(1, min(_MAX_RINGS, math.ceil(radius_km / cell_km)))
+        inv = self._inv_cell_size
+        center_x = int(center.latitude * inv)
+        center_y = int(center.longitude * inv)
+
+        cells = []
+        span = range(-rings, rings + 1)
+        for dx in span:
+            for dy in span:
+                ring = max(abs(dx), abs(dy))
+                # Nearest possible point of a ring-r cell is (r-1)
+                # whole cells away from the center cell
+                if ring > 1 and (ring - 1) * cell_km > radius_km:
+                    continue
+                cells.append((center_x + dx, center_y + dy))
+        return cells
+
+    def collect(self, cells: List[Tuple[int, int]]) -> List['Driver']:
+        """Union of the drivers indexed under the given cells."""
+        drivers = []
+        grid_get = self._grid.get
+        extend = drivers.extend
+        for cell_id in cells:
+            cell = grid_get(cell_id)
+            if cell:
+                extend(cell)
+        return drivers
 
     def search(self, center: Location, radius_km: float = 2.0) -> List['Driver']:
         """
-        Returns drivers in the cell containing 'center' and its neighbors.
-        For simplicity, we just check the 9-cell neighborhood (Moore neighborhood).
-        radius_km is essentially ignored in this simplified grid lookup, 
-        we rely on the grid cell size approx.
+        Returns drivers in all cells that can intersect radius_km
+        around 'center' (at minimum the 9-cell Moore neighborhood).
+        """
+        return self.collect(self.cells_for_radius(center, radius_km))
+
+    def search_many(self, centers: List[Location]) -> List[List['Driver']]:
+        """
+        Batch form of search for fanning out many pending requests in
+        one tick. Hoists the per-call attribute lookups out of the loop
+        and probes the grid once per (center, neighbor) pair, so the
+        per-request interpreter overhead is amortized across the batch.
         """
-        center_x = int(center.latitude / self._cell_size)
-        center_y = int(center.longitude / self._cell_size)
-        
-        nearby_drivers = []
-        
-        # Check current cell and 8 neighbors
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                cell_key = f"{center_x + dx},{center_y + dy}"
-                if cell_key in self._grid:
-                    nearby_drivers.extend(list(self._grid[cell_key]))
-                    
-        return nearby_drivers
+        grid_get = self._grid.get
+        inv = self._inv_cell_size
+        results = []
+        for center in centers:
+            center_x = int(center.latitude * inv)
+            center_y = int(center.longitude * inv)
+            nearby_drivers = []
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    cell = grid_get((center_x + dx, center_y + dy))
+                    if cell:
+                        nearby_drivers.extend(cell)
+            results.append(nearby_drivers)
+        return results
@@ -1,18 +1,62 @@
-from datetime import datetime, timedelta
+import threading
+import time
 import uuid
+from collections import deque
+from datetime import datetime
 from src.model.location import Location
 from src.model.product import Product
 
+# Quotes are minted in bursts from many threads; drawing uuid4 one at a
+# time contends on /dev/urandom per call. Pre-generate ids in batches
+# and pop from a shared pool instead.
+_UUID_BATCH = 256
+_uuid_pool = deque()
+_uuid_lock = threading.Lock()
+
+
+def _next_quote_id() -> str:
+    with _uuid_lock:
+        if not _uuid_pool:
+            _uuid_pool.extend(uuid.uuid4().hex for _ in range(_UUID_BATCH))
+        return _uuid_pool.popleft()
+
+
 class FareQuote:
+    __slots__ = ("quote_id", "amount", "product", "pickup", "dropoff",
+                 "_ts_ns", "ttl_minutes", "_expiry_ns", "_expiry_mono_ns")
+
     def __init__(self, amount: float, product: Product, pickup: Location, dropoff: Location):
-        self.quote_id = str(uuid.uuid4())
+        self.quote_id = _next_quote_id()
         self.amount = amount
         self.product = product
         self.pickup = pickup
         self.dropoff = dropoff
-        self.timestamp = datetime.now()
+        # Store the cheap integer clock; the datetime views below are
+        # materialized only if someone asks for them
+        self._ts_ns = time.time_ns()
         self.ttl_minutes = 5
-        self.expiry_time = self.timestamp + timedelta(minutes=self.ttl_minutes)
+        ttl_ns = self.ttl_minutes * 60 * 1_000_000_000
+        self._expiry_ns = self._ts_ns + ttl_ns
+        # Expiry is checked against the monotonic clock: one 64-bit
+        # compare per request_ride, immune to wall-clock jumps
+        self._expiry_mono_ns = time.monotonic_ns() + ttl_ns
+
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self._ts_ns / 1_000_000_000)
+
+    @property
+    def expiry_time(self) -> datetime:
+        return datetime.fromtimestamp(self._expiry_ns / 1_000_000_000)
+
+    @expiry_time.setter
+    def expiry_time(self, value: datetime):
+        # Kept settable so clients can force expiry (see main.py);
+        # the monotonic deadline shifts by the same wall-clock delta
+        self._expiry_ns = int(value.timestamp() * 1_000_000_000)
+        self._expiry_mono_ns = (
+            time.monotonic_ns() + (self._expiry_ns - time.time_ns())
+        )
 
     def is_expired(self) -> bool:
-        return datetime.now() > self.expiry_time
+        return time.monotonic_ns() > self._expiry_mono_ns
@@ -1,6 +1,11 @@
 import math
 
 class Location:
+    # Slots throughout the hot model classes: no per-instance __dict__,
+    # so a fleet's worth of objects packs tighter and .latitude/.longitude
+    # in the matching loops is an array deref, not a dict probe
+    __slots__ = ("latitude", "longitude")
+
     def __init__(self, latitude: float, longitude: float):
         self.latitude = latitude
         self.longitude = longitude
@@ -1,51 +1,61 @@
 from enum import Enum
-from abc import ABC, abstractmethod
+from abc import ABC
 
 class ProductType(Enum):
     UBER_GO = "UberGo"
     UBER_XL = "UberXL"
     UBER_SHARE = "UberShare"
 
+# Flat (base, per_km, per_min) rate table: one dict lookup at product
+# construction replaces three virtually dispatched rate methods per
+# fare computation
+_RATES = {
+    ProductType.UBER_GO: (50.0, 10.0, 2.0),
+    ProductType.UBER_XL: (80.0, 15.0, 3.0),
+}
+
 class Product(ABC):
-    def __init__(self, id: int, name: str, product_type: ProductType):
-        self.id = id
+    # Products carry only rate constants, so one shared instance per
+    # concrete class serves every request — construction at a call site
+    # like UberGo() just returns the interned object, and product
+    # equality is a pointer compare.
+    _instances = {}
+
+    def __new__(cls, *args, **kwargs):
+        inst = cls._instances.get(cls)
+        if inst is None:
+            inst = super().__new__(cls)
+            cls._instances[cls] = inst
+        return inst
+
+    def __init__(self, name: str, product_type: ProductType):
+        if hasattr(self, "product_type"):
+            # Re-construction hands back the interned instance above;
+            # never re-run field setup on the shared object
+            return
         self.name = name
         self.product_type = product_type
+        # (base, per_km, per_min) resolved once at construction; hot
+        # paths unpack the tuple instead of dispatching rate methods
+        self.rates = _RATES[product_type]
 
-    @abstractmethod
     def get_base_rate(self):
-        pass
+        return self.rates[0]
 
-    @abstractmethod
     def get_per_km_rate(self):
-        pass
+        return self.rates[1]
 
-    @abstractmethod
     def get_per_min_rate(self):
-        pass
+        return self.rates[2]
 
 class UberGo(Product):
-    def __init__(self, id):
-        super().__init__(id, "UberGo", ProductType.UBER_GO)
-    
-    def get_base_rate(self):
-        return 50.0
-    
-    def get_per_km_rate(self):
-        return 10.0
-    
-    def get_per_min_rate(self):
-        return 2.0
+    def __init__(self):
+        super().__init__("UberGo", ProductType.UBER_GO)
 
 class UberXL(Product):
-    def __init__(self, id):
-        super().__init__(id, "UberXL", ProductType.UBER_XL)
-    
-    def get_base_rate(self):
-        return 80.0
-    
-    def get_per_km_rate(self):
-        return 15.0
-    
-    def get_per_min_rate(self):
-        return 3.0
+    def __init__(self):
+        super().__init__("UberXL", ProductType.UBER_XL)
+
+# Interned singletons, importable directly
+UBER_GO = UberGo()
+UBER_XL = UberXL()
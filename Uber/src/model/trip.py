@@ -16,6 +16,9 @@ class TripStatus(Enum):
 
 class Trip:
     """The Domain Object holding Trip data"""
+    __slots__ = ("trip_id", "rider", "driver", "pickup", "dropoff",
+                 "product", "estimated_fare", "status", "otp")
+
     def __init__(self, rider: Rider, pickup: Location, dropoff: Location, product: Product):
         self.trip_id = str(uuid.uuid4())
         self.rider = rider
@@ -1,4 +1,3 @@
-from threading import Lock
 from enum import Enum
 from src.model.location import Location
 from src.model.vehicle import Vehicle
@@ -8,6 +7,8 @@ class UserType(Enum):
     DRIVER = 2
 
 class User:
+    __slots__ = ("_user_id", "name", "phone", "user_type")
+
     def __init__(self, user_id:int, name:str, phone:str, user_type:UserType):
         self._user_id = user_id
         self.name = name
@@ -20,35 +21,34 @@ class User:
         return self._user_id
 
 class Driver(User):
+    __slots__ = ("rating", "location", "vehicle", "_free")
 
     def __init__(self, user_id, name, phone, location:Location, vehicle: Vehicle, rating: float = 5.0):
         super().__init__(user_id, name, phone, UserType.DRIVER)
         self.rating = rating
         self.location = location
         self.vehicle = vehicle
-        self._is_available = True
-        self._lock = Lock()
-    
+        # Availability is a one-slot token dict instead of a flag
+        # guarded by a per-driver Lock: dict.pop is a single atomic
+        # bytecode under the GIL, so booking is a lock-free
+        # test-and-set and reads never contend
+        self._free = {True: True}
+
     def is_available(self):
-        with self._lock:
-            return self._is_available
-            
+        return bool(self._free)
+
     def mark_available(self):
-        with self._lock:
-            self._is_available = True
+        self._free[True] = True
 
     def try_book(self) -> bool:
         """
         Atomically tries to book the driver.
         Returns True if successful (was available), False otherwise.
         """
-        with self._lock:
-            if self._is_available:
-                self._is_available = False
-                return True
-            return False
+        return self._free.pop(True, None) is not None
 
 class Rider(User):
-    
+    __slots__ = ()
+
     def __init__(self, user_id, name, phone):
         super().__init__(user_id, name, phone, UserType.RIDER)
@@ -1,5 +1,6 @@
+import time
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Tuple
 from threading import RLock
 
 from src.model.user import Driver
@@ -18,35 +19,130 @@ class DriverStorage(ABC):
 class InMemoryListStorage(DriverStorage):
     """
     O(N) Complexity.
-    Stores drivers in a simple list. Returns ALL drivers for 'nearby' queries 
+    Stores drivers in a simple list. Returns ALL drivers for 'nearby' queries
     (relying on the strategy to filter by distance).
+
+    Copy-on-write: _drivers is an immutable tuple republished by each
+    write, so readers just grab the current attribute — an atomic read
+    under the GIL — with no lock and no defensive O(N) copy per call.
     """
     def __init__(self):
-        self._drivers: List[Driver] = []
+        self._drivers: Tuple[Driver, ...] = ()
         self._lock = RLock()
-        
+
     def add(self, driver: Driver):
-         with self._lock:
-            self._drivers.append(driver)
-            
-    def get_nearby_drivers(self, location: Location) -> List[Driver]:
         with self._lock:
-            return list(self._drivers) # Return copy
+            self._drivers = self._drivers + (driver,)
+
+    def add_many(self, drivers: List[Driver]):
+        """Bulk load with a single tuple rebuild instead of one per driver."""
+        with self._lock:
+            self._drivers = self._drivers + tuple(drivers)
+
+    def get_nearby_drivers(self, location: Location) -> Tuple[Driver, ...]:
+        return self._drivers
+
+# Power of two so a cell's shard is hash(cell) & mask. 256 shards keeps
+# collisions rare for any realistic driver density.
+_NUM_SHARDS = 256
+_SHARD_MASK = _NUM_SHARDS - 1
 
 class SpatialGridStorage(DriverStorage):
     """
     O(K) Complexity.
-    Stores drivers in a Grid Spatial Index. Returns only drivers in 
+    Stores drivers in a Grid Spatial Index. Returns only drivers in
     neighboring cells.
+
+    Locking is sharded per cell rather than one global lock: location
+    updates in different parts of the city never contend. Shard locks
+    are always acquired in ascending shard order to rule out deadlock.
     """
+    # Cached neighborhood results older than this are discarded even if
+    # no write invalidated them
+    _CACHE_TTL_S = 1.0
+    _CACHE_MAX_ENTRIES = 4096
+
     def __init__(self):
         self._index = SpatialIndex()
-        self._lock = RLock()
-        
+        self._shard_locks = [RLock() for _ in range(_NUM_SHARDS)]
+        # Monotonic per-cell write counters plus a short-TTL result
+        # cache: a repeat search of the same neighborhood within the
+        # TTL is answered with plain dict reads, no shard locks. Any
+        # driver entering or leaving a cell bumps its version, which
+        # changes the neighborhood signature and misses the cache.
+        self._cell_versions: dict = {}
+        self._search_cache: dict = {}
+
+    def _acquire_shards(self, cells):
+        shard_ids = sorted({hash(c) & _SHARD_MASK for c in cells if c is not None})
+        for sid in shard_ids:
+            self._shard_locks[sid].acquire()
+        return shard_ids
+
+    def _release_shards(self, shard_ids):
+        for sid in reversed(shard_ids):
+            self._shard_locks[sid].release()
+
     def add(self, driver: Driver):
-        with self._lock:
-            self._index.update(driver)
-            
+        index = self._index
+        # Lock the shards of both the cell being left and the one being
+        # entered; the move then happens atomically w.r.t. searches
+        new_cell = index.cell_of(driver.location)
+        old_cell = index.current_cell_of(driver)
+        shard_ids = self._acquire_shards((old_cell, new_cell))
+        try:
+            index.update(driver)
+            versions = self._cell_versions
+            if old_cell is not None and old_cell != new_cell:
+                versions[old_cell] = versions.get(old_cell, 0) + 1
+            versions[new_cell] = versions.get(new_cell, 0) + 1
+        finally:
+            self._release_shards(shard_ids)
+
+    _DEFAULT_RADIUS_KM = 2.0
+
     def get_nearby_drivers(self, location: Location) -> List[Driver]:
-        with self._lock:
-            return self._index.search(location)
+        index = self._index
+        center = index.cell_of(location)
+        cells = index.cells_for_radius(location, self._DEFAULT_RADIUS_KM)
+        versions = self._cell_versions
+        signature = tuple(versions.get(c, 0) for c in cells)
+
+        cached = self._search_cache.get(center)
+        now = time.monotonic()
+        if cached is not None:
+            cached_at, cached_signature, result = cached
+            if cached_signature == signature and now - cached_at < self._CACHE_TTL_S:
+                return list(result)
+
+        shard_ids = self._acquire_shards(cells)
+        try:
+            result = index.collect(cells)
+        finally:
+            self._release_shards(shard_ids)
+
+        if len(self._search_cache) >= self._CACHE_MAX_ENTRIES:
+            self._search_cache.clear()
+        self._search_cache[center] = (now, signature, result)
+        return list(result)
+
+    @property
+    def cell_size_degrees(self) -> float:
+        return self._index.cell_size_degrees
+
+    def iter_nearby_batches(self, location: Location):
+        """Lazily yield per-cell driver snapshots, center cell first.
+
+        Each cell is snapshotted under just its own shard lock, so a
+        consumer that stops after the center cell never locks or even
+        probes the outer ring.
+        """
+        index = self._index
+        cells = index.neighborhood_cells(location)
+        for i, cell_id in enumerate(cells):
+            with self._shard_locks[hash(cell_id) & _SHARD_MASK]:
+                batch = index.drivers_in_cell(cell_id)
+            # The center batch is yielded even when empty so consumers
+            # can rely on "first yield == center cell"
+            if batch or i == 0:
+                yield batch
@@ -1,33 +1,199 @@
-from typing import List
-from threading import RLock
+import itertools
+import queue
+import threading
+from typing import Dict, List
+
+import numpy as np
+
 from src.model.user import Driver
-from src.model.product import Product
+from src.model.product import Product, ProductType
 from src.model.location import Location
 from src.strategy.matching.driver_matching_strategy import DriverMatchingStrategy
 from src.repository.driver_repository import DriverStorage, InMemoryListStorage, SpatialGridStorage
 
+_INITIAL_CAPACITY = 16
+
+# One bit per ProductType, in enum declaration order
+_TYPE_BIT = {pt: 1 << i for i, pt in enumerate(ProductType)}
+
+def _vehicle_bitmap(vehicle) -> int:
+    if vehicle is None:
+        return 0
+    bits = 0
+    for pt in vehicle.supported_products:
+        bits |= _TYPE_BIT[pt]
+    return bits
+
 class DriverMatchingService:
     def __init__(self, strategy: DriverMatchingStrategy, use_spatial_index: bool = False):
         self._strategy = strategy
         self._use_spatial_index = use_spatial_index
-        
+
         if use_spatial_index:
             self._storage: DriverStorage = SpatialGridStorage()
         else:
             self._storage: DriverStorage = InMemoryListStorage()
 
+        # Structure-of-arrays shadow of the fleet: coordinates and
+        # ratings live in packed float64 columns parallel to _drivers,
+        # so full-fleet distance ranking is a handful of NumPy ufunc
+        # passes instead of a Python-level key call per driver. Arrays
+        # grow geometrically; _driver_row maps user_id -> row.
+        self._drivers: List[Driver] = []
+        self._driver_row: Dict[int, int] = {}
+        self._lat = np.empty(_INITIAL_CAPACITY, np.float64)
+        self._lon = np.empty(_INITIAL_CAPACITY, np.float64)
+        self._ratings = np.empty(_INITIAL_CAPACITY, np.float64)
+        # Product-support bitmap per driver (bit i = supports the i-th
+        # ProductType), computed once at insert; the per-request filter
+        # is then a single vectorized bit test instead of a supports()
+        # method call per driver
+        self._type_bits = np.zeros(_INITIAL_CAPACITY, np.uint64)
+
+        # Location pings are queued and applied by one background
+        # thread: the ping path is a lock-free SimpleQueue.put, and the
+        # flusher coalesces a burst of pings from the same driver into
+        # a single re-index (only the latest position matters)
+        self._location_updates = queue.SimpleQueue()
+        # Serializes batch application between the daemon flusher and
+        # synchronous flushes, so a sync flush can't return while the
+        # daemon still holds an unapplied batch
+        self._flush_lock = threading.Lock()
+        # Pings are stamped at enqueue (count() is GIL-atomic) and a
+        # per-driver high-water mark is kept at apply time, so when a
+        # driver's pings land split across the two consumers the older
+        # one can never overwrite the newer coordinates
+        self._ping_seq = itertools.count()
+        self._applied_seq: Dict[int, int] = {}
+        self._flusher = threading.Thread(
+            target=self._flush_location_updates_forever, daemon=True
+        )
+        self._flusher.start()
+
     def add_driver(self, driver: Driver):
+        row = self._driver_row.get(driver.user_id)
+        if row is None:
+            row = len(self._drivers)
+            self._drivers.append(driver)
+            self._driver_row[driver.user_id] = row
+            if row >= len(self._lat):
+                capacity = len(self._lat) * 2
+                self._lat = np.resize(self._lat, capacity)
+                self._lon = np.resize(self._lon, capacity)
+                self._ratings = np.resize(self._ratings, capacity)
+                self._type_bits = np.resize(self._type_bits, capacity)
+        self._lat[row] = driver.location.latitude
+        self._lon[row] = driver.location.longitude
+        self._ratings[row] = driver.rating
+        self._type_bits[row] = _vehicle_bitmap(driver.vehicle)
         self._storage.add(driver)
-        
+
+    def update_driver_location(self, driver: Driver, location: Location):
+        """Queue a location ping; applied asynchronously in batches."""
+        self._location_updates.put((next(self._ping_seq), driver, location))
+
+    def _apply_location_batch(self, first):
+        # Drain whatever else is queued, keeping the last ping per
+        # driver, then touch the index once per driver
+        with self._flush_lock:
+            latest = {first[1].user_id: first}
+            while True:
+                try:
+                    item = self._location_updates.get_nowait()
+                except queue.Empty:
+                    break
+                prev = latest.get(item[1].user_id)
+                if prev is None or item[0] > prev[0]:
+                    latest[item[1].user_id] = item
+            applied_seq = self._applied_seq
+            for seq, driver, location in latest.values():
+                if seq <= applied_seq.get(driver.user_id, -1):
+                    continue  # the other consumer already applied newer
+                applied_seq[driver.user_id] = seq
+                driver.location = location
+                row = self._driver_row.get(driver.user_id)
+                if row is not None:
+                    self._lat[row] = location.latitude
+                    self._lon[row] = location.longitude
+                self._storage.add(driver)
+
+    def _flush_location_updates_forever(self):
+        while True:
+            self._apply_location_batch(self._location_updates.get())
+
+    def flush_location_updates(self):
+        """Synchronously apply queued pings (for deterministic reads)."""
+        try:
+            first = self._location_updates.get_nowait()
+        except queue.Empty:
+            # Nothing queued, but the daemon may hold a dequeued batch
+            # it has not applied yet; taking the lock waits it out so
+            # reads after this call see every prior ping
+            with self._flush_lock:
+                return
+        self._apply_location_batch(first)
+
     def find_nearest_driver(self, pickup: Location, product: Product) -> Driver:
+        # Fast path: nearest-match over the grid consumes cells lazily
+        # (center first) and usually stops before touching the outer
+        # ring — see NearestLocationStrategy.find_driver_lazy
+        strategy = self._strategy
+        storage = self._storage
+        if hasattr(strategy, "find_driver_lazy") and hasattr(storage, "iter_nearby_batches"):
+            product_type = product.product_type
+            batches = (
+                [d for d in batch if d.vehicle.supports(product_type)]
+                for batch in storage.iter_nearby_batches(pickup)
+            )
+            return strategy.find_driver_lazy(
+                pickup, batches, storage.cell_size_degrees
+            )
+
+        # Vector path: the list storage scans the whole fleet anyway,
+        # so rank it in the SoA columns — one ufunc sweep instead of a
+        # Python key call per driver
+        if hasattr(strategy, "find_driver_vec") and isinstance(storage, InMemoryListStorage):
+            n = len(self._drivers)
+            if n == 0:
+                return None
+            bit = np.uint64(_TYPE_BIT[product.product_type])
+            supports = (self._type_bits[:n] & bit) != 0
+            return strategy.find_driver_vec(
+                pickup, self._lat[:n], self._lon[:n],
+                self._ratings[:n], supports, self._drivers
+            )
+
         # 1. Efficient Lookup (O(K) or O(N))
         nearby_drivers = self._storage.get_nearby_drivers(pickup)
-        
+
+        # Fused path for grid lookups: gather the candidates' SoA rows
+        # and rank with the support mask folded in — one vectorized
+        # pass, no intermediate filtered list and no supports() call
+        # per driver
+        if hasattr(strategy, "find_driver_vec") and nearby_drivers:
+            driver_row = self._driver_row
+            try:
+                rows = np.fromiter(
+                    (driver_row[d.user_id] for d in nearby_drivers),
+                    np.intp, len(nearby_drivers)
+                )
+            except KeyError:
+                # Candidate missing from the SoA shadow (registered
+                # straight into storage); filter the slow way below
+                pass
+            else:
+                bit = np.uint64(_TYPE_BIT[product.product_type])
+                supports = (self._type_bits[rows] & bit) != 0
+                return strategy.find_driver_vec(
+                    pickup, self._lat[rows], self._lon[rows],
+                    self._ratings[rows], supports, nearby_drivers
+                )
+
         # 2. Filter by Product
         candidate_drivers = [
-            d for d in nearby_drivers 
+            d for d in nearby_drivers
             if d.vehicle.supports(product.product_type)
         ]
-        
+
         # 3. Apply Matching Strategy
         return self._strategy.find_driver(pickup, candidate_drivers)
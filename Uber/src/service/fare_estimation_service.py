@@ -1,24 +1,83 @@
+import time
 from datetime import datetime
+
+import numpy as np
+
+from src.common.geo import haversine_km, haversine_pairwise
 from src.model.fare_quote import FareQuote
 from src.strategy.pricing.pricing_strategy import  PricingStrategy, NightBasedPriceStrategy, LocationBasedPriceStrategy
 
+# Strategies are stateless, so two shared instances serve every quote
+# instead of an allocation per request
+_NIGHT_STRATEGY = NightBasedPriceStrategy()
+_DAY_STRATEGY = LocationBasedPriceStrategy()
+
+# Day/night is recomputed at most once a minute; in between, every
+# quote pays one time.monotonic() call (a vDSO read) and a global
+# lookup instead of constructing a datetime per request. The boundary
+# can shift by up to a minute, which is well inside quote TTL. The
+# refresh race is benign: two threads at the deadline both recompute
+# the same value.
+_IS_NIGHT = False
+_NEXT_REFRESH = 0.0
+_REFRESH_INTERVAL_S = 60.0
+
+
+def _recompute_is_night(now: float):
+    global _IS_NIGHT, _NEXT_REFRESH
+    hour = datetime.now().hour
+    _IS_NIGHT = hour < 6 or hour >= 22
+    _NEXT_REFRESH = now + _REFRESH_INTERVAL_S
+
+
 class PricingStrategyFactory:
     @staticmethod
     def get_strategy():
-        if FareEstimationService.is_night(): 
-            return NightBasedPriceStrategy()
-        return LocationBasedPriceStrategy()
+        return _NIGHT_STRATEGY if FareEstimationService.is_night() else _DAY_STRATEGY
 
 class FareEstimationService:
-    
+
     @staticmethod
     def is_night():
-        current_hour = datetime.now().hour
-        return current_hour < 6 or current_hour >= 22
+        now = time.monotonic()
+        if now > _NEXT_REFRESH:
+            _recompute_is_night(now)
+        return _IS_NIGHT
 
     def calculate_fare_quote(self, pickup, dropoff, product) -> FareQuote:
         pricing_strategy = PricingStrategyFactory.get_strategy()
-        distance = ((pickup.latitude - dropoff.latitude)**2 + (pickup.longitude - dropoff.longitude)**2)**0.5
+        # Haversine in km: the old raw-degree Euclidean both mispriced
+        # longitude away from the equator and billed in no real unit
+        distance = haversine_km(
+            pickup.latitude, pickup.longitude,
+            dropoff.latitude, dropoff.longitude
+        )
         price = pricing_strategy.get_price(distance, product)
-        
+
         return FareQuote(price, product, pickup, dropoff)
+
+    def calculate_fare_quotes_batch(self, pickups, dropoffs, product) -> list:
+        """
+        Quote many (pickup, dropoff) pairs in one pass — for replay and
+        surge-simulation workloads that price millions of routes.
+
+        The fare formula is fused into a single vector expression over
+        the whole batch: distances via the vectorized haversine, then
+        (base + d * per_km) * night_multiplier with the multiplier
+        resolved once as a scalar — no strategy dispatch per pair.
+        """
+        pickup_lats = np.fromiter((p.latitude for p in pickups), np.float64, len(pickups))
+        pickup_lons = np.fromiter((p.longitude for p in pickups), np.float64, len(pickups))
+        drop_lats = np.fromiter((d.latitude for d in dropoffs), np.float64, len(dropoffs))
+        drop_lons = np.fromiter((d.longitude for d in dropoffs), np.float64, len(dropoffs))
+
+        d_km = haversine_pairwise(pickup_lats, pickup_lons, drop_lats, drop_lons)
+
+        base, per_km, _ = product.rates
+        mult = 1.5 if self.is_night() else 1.0
+        prices = (base + d_km * per_km) * mult
+
+        return [
+            FareQuote(float(price), product, pickup, dropoff)
+            for price, pickup, dropoff in zip(prices, pickups, dropoffs)
+        ]
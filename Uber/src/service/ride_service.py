@@ -1,4 +1,8 @@
-import random
+import secrets
+import threading
+
+import numpy as np
+
 from src.model.user import Driver
 from src.model.location import Location
 from src.model.product import Product
@@ -9,6 +13,24 @@ from src.service.fare_estimation_service import FareEstimationService
 from src.service.eta_estimation_service import ETAEstimationService
 from src.common.exceptions import QuoteExpiredException
 
+
+def _generate_otp() -> int:
+    # secrets draws from the OS entropy pool without the module-wide
+    # lock that random's shared Mersenne state takes per call, so
+    # concurrent bookings don't serialize here; rejection sampling
+    # keeps the 4-digit distribution unbiased
+    while True:
+        draw = secrets.randbits(14)
+        if draw < 9000:
+            return 1000 + draw
+
+
+# Compact codes for the status column; declaration order of TripStatus
+_STATUS_CODE = {status: i for i, status in enumerate(TripStatus)}
+_ACTIVE_CODES = (_STATUS_CODE[TripStatus.ASSIGNED],
+                 _STATUS_CODE[TripStatus.IN_TRANSIT])
+
+
 class RideService:
     """The Logic Layer/Service that orchestrates the workflow"""
     def __init__(self, fare_estimation_svc: FareEstimationService, eta_svc: ETAEstimationService, matching_svc: DriverMatchingService):
@@ -16,6 +38,40 @@ class RideService:
         self.eta_svc = eta_svc
         self.matching_svc = matching_svc
         self._trips = {} # trip_id -> Trip
+        # Trip rows in insertion order plus a packed int8 status
+        # column mirroring each Trip's state: fleet-wide scans like
+        # active_trips read one contiguous byte array instead of
+        # chasing every Trip object through the heap. Bookings come in
+        # from concurrent request_ride threads, so the row claim, the
+        # resize republish and status writes are all serialized behind
+        # one lock — unlike the old single dict store, none of these
+        # steps is atomic on its own.
+        self._trip_list = []
+        self._trip_row = {} # trip_id -> row index
+        self._status_codes = np.empty(16, np.int8)
+        self._trips_lock = threading.Lock()
+
+    def _record_trip(self, trip):
+        with self._trips_lock:
+            row = len(self._trip_list)
+            if row >= len(self._status_codes):
+                self._status_codes = np.resize(self._status_codes, len(self._status_codes) * 2)
+            self._trip_list.append(trip)
+            self._trip_row[trip.trip_id] = row
+            self._trips[trip.trip_id] = trip
+            self._status_codes[row] = _STATUS_CODE[trip.status]
+
+    def _mirror_status(self, trip):
+        with self._trips_lock:
+            self._status_codes[self._trip_row[trip.trip_id]] = _STATUS_CODE[trip.status]
+
+    def active_trips(self):
+        """All trips currently assigned or in transit, via one column sweep."""
+        with self._trips_lock:
+            codes = self._status_codes[:len(self._trip_list)].copy()
+            trip_list = list(self._trip_list)
+        rows = np.flatnonzero((codes == _ACTIVE_CODES[0]) | (codes == _ACTIVE_CODES[1]))
+        return [trip_list[row] for row in rows]
 
     def get_estimate(self, pickup: Location, dropoff: Location, product: Product) -> 'FareQuote':
         return self.fare_estimation_svc.calculate_fare_quote(pickup, dropoff, product)
@@ -42,8 +98,8 @@ class RideService:
             if driver.try_book():
                 new_trip.driver = driver
                 new_trip.status = TripStatus.ASSIGNED
-                new_trip.otp = random.randint(1000, 9999) # Generate 4-digit OTP
-                self._trips[new_trip.trip_id] = new_trip
+                new_trip.otp = _generate_otp() # 4-digit OTP
+                self._record_trip(new_trip)
                 
                 print(f"[INFO]  RideService: Trip {new_trip.trip_id} assigned to Driver {driver.name}. OTP: {new_trip.otp}")
                 return new_trip
@@ -60,6 +116,7 @@ class RideService:
             
         # Delegate logic to the Rich Domain Model
         if trip.start_ride(otp):
+             self._mirror_status(trip)
              print(f"[INFO]  RideService: Trip {trip_id} STARTED. Rider {trip.rider.name} picked up by {trip.driver.name}.")
              return True
         
@@ -72,6 +129,7 @@ class RideService:
             return False
         
         if trip.end_ride():
+             self._mirror_status(trip)
              print(f"[INFO]  RideService: Trip {trip_id} COMPLETED. Driver {trip.driver.name} is now available.")
              return True
              
@@ -1,8 +1,19 @@
+import heapq
+import math
 from abc import ABC, abstractmethod
 from typing import List
 
+import numpy as np
+
 from src.model.user import Driver
 
+def _squared_distances(pickup, lats, lons):
+    """Squared equirectangular distances from pickup, as one ufunc sweep."""
+    cos_lat = math.cos(math.radians(pickup.latitude))
+    dx = (lons - pickup.longitude) * cos_lat
+    dy = lats - pickup.latitude
+    return dx * dx + dy * dy
+
 class DriverMatchingStrategy(ABC):
     @abstractmethod
     def find_driver(self, pickup, candidate_drivers: List[Driver]) -> Driver:
@@ -12,29 +23,156 @@ class NearestLocationStrategy(DriverMatchingStrategy):
     def find_driver(self, pickup, candidate_drivers: List[Driver]) -> Driver:
         if not candidate_drivers:
             return None
-            
-        def get_distance(driver):
-            # Simple Euclidean distance
-            return ((driver.location.latitude - pickup.latitude)**2 + 
-                   (driver.location.longitude - pickup.longitude)**2)**0.5
-                   
-        return min(candidate_drivers, key=get_distance)
+
+        # Rank by squared equirectangular distance: scaling the
+        # longitude delta by cos(lat) keeps the ordering faithful to
+        # real ground distance at any latitude, and skipping the sqrt
+        # costs nothing since squaring is monotone. Everything loop-
+        # invariant is hoisted so the per-candidate work is four
+        # arithmetic ops and a compare.
+        lat = pickup.latitude
+        lon = pickup.longitude
+        cos_lat = math.cos(math.radians(lat))
+
+        best = None
+        best_d2 = math.inf
+        for driver in candidate_drivers:
+            loc = driver.location
+            dx = (loc.longitude - lon) * cos_lat
+            dy = loc.latitude - lat
+            d2 = dx * dx + dy * dy
+            if d2 < best_d2:
+                best_d2 = d2
+                best = driver
+        return best
+
+    def find_driver_vec(self, pickup, lats, lons, ratings, supports, drivers) -> Driver:
+        """
+        Vectorized nearest match over parallel SoA columns: squared
+        distances in one NumPy expression, unsupported drivers masked
+        to +inf, then a single argmin. Skipping the sqrt is free since
+        argmin of d-squared equals argmin of d.
+        """
+        d2 = _squared_distances(pickup, lats, lons)
+        d2[~supports] = np.inf
+        i = int(np.argmin(d2))
+        return drivers[i] if d2[i] != np.inf else None
+
+    def find_driver_lazy(self, pickup, cell_batches, cell_size_degrees) -> Driver:
+        """
+        Consume per-cell candidate batches, center cell first, and stop
+        early when the outer ring provably cannot contain anyone closer.
+
+        The bound: every driver outside the center cell is at least as
+        far from the pickup as the pickup is from the nearest edge of
+        its own cell. If the center-cell winner beats that margin, the
+        8 neighbor cells are never even snapshotted.
+        """
+        lat = pickup.latitude
+        lon = pickup.longitude
+        cos_lat = math.cos(math.radians(lat))
+
+        best = None
+        best_d2 = math.inf
+        first = True
+        for batch in cell_batches:
+            for driver in batch:
+                loc = driver.location
+                dx = (loc.longitude - lon) * cos_lat
+                dy = loc.latitude - lat
+                d2 = dx * dx + dy * dy
+                if d2 < best_d2:
+                    best_d2 = d2
+                    best = driver
+            if first:
+                first = False
+                if best is not None:
+                    # Distance (in degrees) from the pickup to the
+                    # closest boundary of the cell containing it
+                    frac_lat = lat / cell_size_degrees - math.floor(lat / cell_size_degrees)
+                    frac_lon = lon / cell_size_degrees - math.floor(lon / cell_size_degrees)
+                    margin_lat = min(frac_lat, 1.0 - frac_lat) * cell_size_degrees
+                    margin_lon = min(frac_lon, 1.0 - frac_lon) * cell_size_degrees * cos_lat
+                    margin = min(margin_lat, margin_lon)
+                    if best_d2 <= margin * margin:
+                        return best
+        return best
 
 class RatingBasedMatchingStrategy(DriverMatchingStrategy):
     """
-    Matches the driver with the highest rating. 
+    Matches the driver with the highest rating.
     If ratings are tied, picks the nearest one among them.
     """
     def find_driver(self, pickup, candidate_drivers: List[Driver]) -> Driver:
         if not candidate_drivers:
             return None
-            
-        # Sort by rating (descending), then by distance (ascending)
-        # We need distance for tie-breaking
+
+        lat = pickup.latitude
+        lon = pickup.longitude
+        cos_lat = math.cos(math.radians(lat))
+
+        # -rating (primary), squared distance (secondary); the square
+        # preserves the distance ordering so the tie-break is unchanged
         def get_sort_key(driver):
-            distance = ((driver.location.latitude - pickup.latitude)**2 + 
-                       (driver.location.longitude - pickup.longitude)**2)**0.5
-            # tuple sort: -rating (primary), distance (secondary)
-            return (-driver.rating, distance)
-            
+            loc = driver.location
+            dx = (loc.longitude - lon) * cos_lat
+            dy = loc.latitude - lat
+            return (-driver.rating, dx * dx + dy * dy)
+
         return min(candidate_drivers, key=get_sort_key)
+
+    def find_driver_vec(self, pickup, lats, lons, ratings, supports, drivers) -> Driver:
+        """Vectorized highest-rating match, nearest among ties."""
+        if not supports.any():
+            return None
+        d2 = _squared_distances(pickup, lats, lons)
+        masked_ratings = np.where(supports, ratings, -np.inf)
+        # Best rating first, then nearest among the drivers tied on it
+        tied = np.flatnonzero(masked_ratings == masked_ratings.max())
+        return drivers[int(tied[np.argmin(d2[tied])])]
+
+class TopKNearestRatingStrategy(DriverMatchingStrategy):
+    """
+    Matches the best-rated driver among the K nearest candidates:
+    a middle ground between pure proximity and pure rating.
+    """
+    def __init__(self, k: int = 5):
+        self._k = k
+
+    def find_driver(self, pickup, candidate_drivers: List[Driver]) -> Driver:
+        if not candidate_drivers:
+            return None
+
+        lat = pickup.latitude
+        lon = pickup.longitude
+        cos_lat = math.cos(math.radians(lat))
+
+        def d2_key(driver):
+            loc = driver.location
+            dx = (loc.longitude - lon) * cos_lat
+            dy = loc.latitude - lat
+            return dx * dx + dy * dy
+
+        # nsmallest is a bounded heap pass: O(N log K), no full sort
+        nearest = heapq.nsmallest(self._k, candidate_drivers, key=d2_key)
+        return max(nearest, key=lambda d: d.rating)
+
+    def find_driver_vec(self, pickup, lats, lons, ratings, supports, drivers) -> Driver:
+        """
+        Vectorized variant: argpartition selects the K smallest squared
+        distances in O(N) — no full O(N log N) sort — then one argmax
+        over just those K ratings.
+        """
+        d2 = _squared_distances(pickup, lats, lons)
+        d2[~supports] = np.inf
+        k = min(self._k, len(drivers))
+        if k < len(drivers):
+            idx = np.argpartition(d2, k - 1)[:k]
+        else:
+            idx = np.arange(len(drivers))
+        # Masked-out candidates carry inf distance; drop any that
+        # leaked into the partition when supported drivers are scarce
+        idx = idx[d2[idx] != np.inf]
+        if idx.size == 0:
+            return None
+        return drivers[int(idx[np.argmax(ratings[idx])])]
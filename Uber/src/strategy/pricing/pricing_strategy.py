@@ -1,7 +1,20 @@
 from datetime import datetime
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from src.model.product import Product
 
+# Quotes are quantized to 50 m distance buckets so the popular routes
+# in a dense city hit the same cache lines over and over
+_BUCKETS_PER_KM = 20
+_KM_PER_BUCKET = 1.0 / _BUCKETS_PER_KM
+
+
+@lru_cache(maxsize=4096)
+def _bucketed_price(bucket: int, base: float, per_km: float,
+                    multiplier: float) -> float:
+    return (base + bucket * _KM_PER_BUCKET * per_km) * multiplier
+
+
 class PricingStrategy(ABC):
     @abstractmethod
     def get_price(self, distance, product) -> float:
@@ -10,8 +23,10 @@ class PricingStrategy(ABC):
 class NightBasedPriceStrategy(PricingStrategy):
     def get_price(self, distance, product):
         # Night rate: Base + (Dist * Rate) * NightMultiplier
-        return (product.get_base_rate() + (distance * product.get_per_km_rate())) * 1.5
+        base, per_km, _ = product.rates
+        return _bucketed_price(int(distance * _BUCKETS_PER_KM), base, per_km, 1.5)
 
 class LocationBasedPriceStrategy(PricingStrategy):
     def get_price(self, distance, product):
-        return product.get_base_rate() + (distance * product.get_per_km_rate())
+        base, per_km, _ = product.rates
+        return _bucketed_price(int(distance * _BUCKETS_PER_KM), base, per_km, 1.0)
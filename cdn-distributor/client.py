@@ -49,7 +49,7 @@ if __name__ == "__main__":
     video = Content(
         name="movie.mp4",
         size=1024,
-        data="video_data_bits",
+        data=b"video_data_bits",
         region_tags=["IN", "US"] # Tagged for both
     )
     bucket.upload(video)
@@ -58,7 +58,7 @@ if __name__ == "__main__":
     us_content = Content(
         name="superbowl.mov",
         size=500,
-        data="us_exclusive_data",
+        data=b"us_exclusive_data",
         region_tags=["US"]
     )
     bucket.upload(us_content)
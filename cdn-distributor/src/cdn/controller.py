@@ -1,71 +1,166 @@
 from src.models.content import Content
 from src.models.observer import S3EventListener, EdgeEventListener
 from src.models.retry_policy import RetryPolicy
-from typing import List, Dict
+import sys
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence, Tuple
+from concurrent.futures import ThreadPoolExecutor, wait
 from time import sleep
 
 
 class CDNController(S3EventListener):
 
+    # Dedup only needs to remember recent uploads; everything is
+    # LRU-bounded so a long-running controller can't grow without limit
+    _MAX_PROCESSED_CHECKSUMS = 100_000
+    _MAX_STORED_CONTENT = 10_000
+
     def __init__(self, retry_policy: RetryPolicy):
-        self._edge_nodes: List[EdgeEventListener] = []
+        # Topology is read-copy-update: registration builds new
+        # immutable tuples under the lock and swaps them in; pushes
+        # (which sleep in retries) read a coherent snapshot with no
+        # lock at all, and can't skip nodes or crash mid-iteration
+        # when another thread registers
+        self._edge_nodes: Tuple[EdgeEventListener, ...] = ()
+        self._topology_lock = threading.Lock()
         self._retry_policy = retry_policy
-        self._processed_checksums: Set[str] = set()
-        self._latest_versions: Dict[str, str] = {} # name -> checksum
-        self._content_store: Dict[str, Content] = {} # name -> Content object (Origin Storage)
+        # OrderedDicts used as LRU sets/maps: hits refresh recency,
+        # inserts evict the oldest entry past the cap
+        self._processed_checksums: OrderedDict = OrderedDict() # digest -> None
+        self._latest_versions: OrderedDict = OrderedDict() # name -> checksum digest
+        self._content_store: OrderedDict = OrderedDict() # name -> Content (Origin Storage)
+        # Edge pushes are simulated network IO (they sleep) and are
+        # independent per node, so fan them out: wall time per upload
+        # becomes the slowest edge instead of the sum of all edges
+        self._executor = ThreadPoolExecutor(max_workers=16)
+        # Region -> nodes, built at registration so a tagged upload
+        # touches only its target buckets instead of testing every
+        # node's region per broadcast. Region keys are interned so the
+        # dict probe is a pointer compare. Buckets are tuples, swapped
+        # wholesale under the topology lock like _edge_nodes.
+        self._nodes_by_region: Dict[str, Tuple[EdgeEventListener, ...]] = {}
+        # Retry-wrapped push/invalidate closures, specialized once per
+        # node at registration so broadcasts skip the generic
+        # execute(action, *args) indirection on every call
+        self._push_fns: Dict[EdgeEventListener, callable] = {}
+        self._invalidate_fns: Dict[EdgeEventListener, callable] = {}
 
     def register_edge_node(self, edge_node: EdgeEventListener):
-        self._edge_nodes.append(edge_node)
+        with self._topology_lock:
+            region = sys.intern(edge_node.region)
+            by_region = dict(self._nodes_by_region)
+            by_region[region] = by_region.get(region, ()) + (edge_node,)
+            self._nodes_by_region = by_region
+            self._push_fns[edge_node] = self._retry_policy.bind(edge_node.push)
+            self._invalidate_fns[edge_node] = self._retry_policy.bind(edge_node.invalidate)
+            self._edge_nodes = self._edge_nodes + (edge_node,)
 
     def unregister_edge_node(self, edge_node: EdgeEventListener):
-        self._edge_nodes.remove(edge_node)
+        with self._topology_lock:
+            region = edge_node.region
+            by_region = dict(self._nodes_by_region)
+            by_region[region] = tuple(
+                n for n in by_region.get(region, ()) if n is not edge_node
+            )
+            self._nodes_by_region = by_region
+            self._push_fns.pop(edge_node, None)
+            self._invalidate_fns.pop(edge_node, None)
+            self._edge_nodes = tuple(
+                n for n in self._edge_nodes if n is not edge_node
+            )
+
+    @staticmethod
+    def _lru_put(cache: OrderedDict, key, value, max_size: int):
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > max_size:
+            cache.popitem(last=False)
 
     def fetch_content(self, name: str) -> Optional[Content]:
         """Acts as the 'Origin' for Edge Pull Fallback."""
-        if name in self._content_store:
+        content = self._content_store.get(name)
+        if content is not None:
             print(f"Origin: Serving {name} to edge node.")
-            return self._content_store[name]
+            self._content_store.move_to_end(name)
+            return content
         print(f"Origin: 404 Not Found for {name}")
         return None
 
     def on_upload(self, content: Content):
         print(f"CDN received new content notification: {content.name}")
-        
-        # Store in Origin (Simulating S3/Origin Shield)
-        self._content_store[content.name] = content
-        
-        # 1. Checksum Deduplication
-        if content.checksum in self._processed_checksums:
+
+        # 1. Checksum Deduplication, before any store: the duplicate
+        # path costs one set probe instead of a dict insert that also
+        # pins the redundant Content object in the origin
+        if content.checksum_digest in self._processed_checksums:
+            self._processed_checksums.move_to_end(content.checksum_digest)
+            # Same bytes under a name the origin doesn't serve yet
+            # still need an origin entry (but no edge push)
+            if self._latest_versions.get(content.name) != content.checksum_digest:
+                self._lru_put(self._content_store, content.name, content,
+                              self._MAX_STORED_CONTENT)
+                self._lru_put(self._latest_versions, content.name,
+                              content.checksum_digest, self._MAX_STORED_CONTENT)
             print(f"Skipping duplicate content {content.name} (Checksum: {content.checksum[:8]})")
             return
-        
+
+        # Store in Origin (Simulating S3/Origin Shield)
+        self._lru_put(self._content_store, content.name, content,
+                      self._MAX_STORED_CONTENT)
+
         # 3. Delta Update Simulation
         if content.name in self._latest_versions:
              print(f"File {content.name} has changed. Calculating Delta... (Simulated)")
              print(f"Sending Delta Update for {content.name}...")
-        
-        self._processed_checksums.add(content.checksum)
-        self._latest_versions[content.name] = content.checksum
-        
+
+        self._lru_put(self._processed_checksums, content.checksum_digest,
+                      None, self._MAX_PROCESSED_CHECKSUMS)
+        self._lru_put(self._latest_versions, content.name,
+                      content.checksum_digest, self._MAX_STORED_CONTENT)
+
         self._push_to_edges(content)
 
+    def _routing_targets(self, content: Content) -> Sequence[EdgeEventListener]:
+        # 2. Region-Aware Routing: tagged content goes only to its
+        # regions' buckets; a node serving several tags is pushed once
+        if not content.region_tags:
+            return self._edge_nodes
+        targets = []
+        seen = set()
+        for region in content.region_tags:
+            for node in self._nodes_by_region.get(region, ()):
+                if id(node) not in seen:
+                    seen.add(id(node))
+                    targets.append(node)
+        return targets
+
     def _push_to_edges(self, content: Content):
-        for node in self._edge_nodes:
-            # 2. Region-Aware Routing
-            # If content has region tags, only push to nodes in those regions
-            if content.region_tags and node.region not in content.region_tags:
-                print(f"Skipping {node} (Region: {node.region}) for {content.name} (Tags: {content.region_tags})")
+        futures = []
+        for node in self._routing_targets(content):
+            # The node snapshot is lock-free, so a concurrent
+            # unregister may have already dropped this node's closure;
+            # skip it rather than crash the whole broadcast
+            push_fn = self._push_fns.get(node)
+            if push_fn is None:
                 continue
-
             print(f"Pushing {content.name} to {node}...")
-            self._retry_policy.execute(node.push, content)
+            futures.append(self._executor.submit(push_fn, content))
+        wait(futures)
 
     def invalidate_content(self, content: Content):
         """Simulates Invalidation (Pull Model)"""
         print(f"Invalidating {content.name} across CDN...")
+        futures = []
+        # Invalidation is usually global, or can be regionally scoped too
         for node in self._edge_nodes:
-             # Invalidation is usually global, or can be regionally scoped too
-             self._retry_policy.execute(node.invalidate, content.name)
+            # As in _push_to_edges: a concurrently unregistered node's
+            # closure may be gone already — skip, don't crash
+            invalidate_fn = self._invalidate_fns.get(node)
+            if invalidate_fn is None:
+                continue
+            futures.append(self._executor.submit(invalidate_fn, content.name))
+        wait(futures)
 
 
 class MumbaiEdgeNode(EdgeEventListener):
@@ -1,27 +1,44 @@
 import hashlib
-from typing import List, Optional
+from typing import List, Optional, Union
 from uuid import uuid4
 
 class Content:
-    def __init__(self, name: str, size: int, data: str, region_tags: Optional[List[str]] = None):
+    # Fixed slots: no per-instance __dict__, which trims each Content
+    # object by roughly a third and makes the payload effectively
+    # immutable-shaped — nothing can tack extra state onto it
+    __slots__ = ('_id', 'name', 'file_size', 'data', 'region_tags',
+                 'checksum_digest', 'checksum')
+
+    def __init__(self, name: str, size: int,
+                 data: Union[bytes, memoryview, str],
+                 region_tags: Optional[List[str]] = None):
         self._id = str(uuid4())
         self.name = name
         self.file_size = size
-        self.data = data
+        # Payload is kept as the bytes-like object it arrived as; a
+        # memoryview over a shared buffer is never copied, and edges
+        # cache the same Content reference, so a multi-MB upload exists
+        # once in RAM. Legacy str callers are encoded once, here, not
+        # again per checksum.
+        self.data = data.encode('utf-8') if isinstance(data, str) else data
         self.region_tags = region_tags or []
-        self.checksum = self._calculate_checksum()
+        # Raw 16-byte digest for dedup keys (half the memory of the hex
+        # string and a cheaper hash); hex form derived for display
+        self.checksum_digest = self._calculate_checksum()
+        self.checksum = self.checksum_digest.hex()
 
     @property
     def id(self):
         return self._id
 
-    def _calculate_checksum(self) -> str:
-        """Calculates MD5 checksum of the content data."""
-        return hashlib.md5(self.data.encode('utf-8')).hexdigest()
+    def _calculate_checksum(self) -> bytes:
+        """Digest of the content data, for dedup keys.
+
+        blake2b is markedly faster than the old MD5 and needs no
+        cryptographic caveats for this purpose; it reads bytes and
+        memoryviews directly, so no copy is made to hash.
+        """
+        return hashlib.blake2b(self.data, digest_size=16).digest()
 
     def __str__(self):
         return f"{self.name} (Size: {self.file_size}, Checksum: {self.checksum[:8]})"
-
-    @property
-    def file_type(self):
-        return self._file_type
@@ -1,9 +1,55 @@
+import random
 import time
+from typing import Callable, Optional
 
 class RetryPolicy:
-    def __init__(self, max_retries: int = 3, delay: float = 0.1):
+    def __init__(self, max_retries: int = 3, delay: float = 0.1,
+                 max_delay: float = 5.0,
+                 retryable: Optional[Callable[[Exception], bool]] = None):
         self.max_retries = max_retries
         self.delay = delay
+        self.max_delay = max_delay
+        # Predicate deciding whether an exception is worth retrying;
+        # None retries everything (the previous behavior)
+        self.retryable = retryable
+
+    def compute_delay(self, attempt: int) -> float:
+        """Backoff before retry number `attempt` (0-based), in seconds.
+
+        Exponential so a struggling edge sees pressure halve each
+        round, with +/-50% jitter so concurrent pushes that failed
+        together don't all wake and retry at the same instant.
+        """
+        backoff = self.delay * (2 ** attempt) * random.uniform(0.5, 1.5)
+        return min(backoff, self.max_delay)
+
+    def bind(self, action) -> Callable:
+        """Specialize the retry loop to one single-argument action.
+
+        The returned closure binds the action and policy fields once,
+        so the hot path (a successful call) pays no *args packing and
+        no attribute lookups — just the one call frame.
+        """
+        max_retries = self.max_retries
+        retryable = self.retryable
+        compute_delay = self.compute_delay
+
+        def run(arg):
+            attempts = 0
+            while attempts < max_retries:
+                try:
+                    return action(arg)
+                except Exception as e:
+                    if retryable is not None and not retryable(e):
+                        raise
+                    attempts += 1
+                    print(f"Attempt {attempts} failed: {e}")
+                    if attempts == max_retries:
+                        print("Max retries reached. Action failed.")
+                        raise e
+                    time.sleep(compute_delay(attempts - 1))
+
+        return run
 
     def execute(self, action, *args, **kwargs):
         attempts = 0
@@ -11,9 +57,12 @@ class RetryPolicy:
             try:
                 return action(*args, **kwargs)
             except Exception as e:
+                if self.retryable is not None and not self.retryable(e):
+                    # Non-transient failure: no point burning retries
+                    raise
                 attempts += 1
                 print(f"Attempt {attempts} failed: {e}")
                 if attempts == self.max_retries:
                     print("Max retries reached. Action failed.")
                     raise e
-                time.sleep(self.delay)
+                time.sleep(self.compute_delay(attempts - 1))
@@ -1,5 +1,5 @@
 from src.models.observer import S3EventListener
-from typing import List, Set
+from typing import Tuple
 import weakref
 import threading
 from concurrent.futures import ThreadPoolExecutor
@@ -8,11 +8,21 @@ from src.models.retry_policy import RetryPolicy
 
 class S3EventPublisher:
 
+    # Dead weakrefs are swept from the tuple once this many
+    # notifications have passed since the last compaction
+    _COMPACT_EVERY = 64
+
     def __init__(self):
-        # Use WeakSet to avoid memory leaks (holding references to dead listeners)
-        self._listeners = weakref.WeakSet()
+        # Listeners live in an immutable tuple of weakrefs, swapped
+        # wholesale under the lock on (un)registration — same
+        # read-copy-update shape as the controller's edge topology.
+        # notify_upload just reads the current tuple: no lock and no
+        # per-event list() copy on the hot path, and weakrefs still
+        # keep dead listeners from leaking.
+        self._listeners: Tuple[weakref.ref, ...] = ()
         # Lock for thread-safe registration/unregistration
         self._lock = threading.Lock()
+        self._notifications_since_compact = 0
         # Thread pool for async notifications (non-blocking)
         self._executor = ThreadPoolExecutor(max_workers=5)
         # Retry policy for at-least-once delivery attempts
@@ -20,20 +30,46 @@ class S3EventPublisher:
 
     def register(self, listener: S3EventListener):
         with self._lock:
-            self._listeners.add(listener)
+            if any(ref() is listener for ref in self._listeners):
+                return
+            self._listeners = self._listeners + (weakref.ref(listener),)
 
     def unregister(self, listener: S3EventListener):
         with self._lock:
-            self._listeners.discard(listener)
+            self._listeners = tuple(
+                ref for ref in self._listeners
+                if ref() is not None and ref() is not listener
+            )
 
-    def notify_upload(self, content):
-        # Snapshot listeners under lock to avoid "dictionary changed size" iteration error
+    def _compact(self):
+        # Rebuild the tuple without dead refs; cheap and rare, so it
+        # just reuses the registration lock
         with self._lock:
-            listeners_snapshot = list(self._listeners)
+            self._listeners = tuple(
+                ref for ref in self._listeners if ref() is not None
+            )
+            self._notifications_since_compact = 0
+
+    def notify_upload(self, content):
+        # One read of the immutable tuple is the snapshot; concurrent
+        # registration swaps in a new tuple and can't disturb this
+        # iteration
+        listeners = self._listeners
+
+        dead = 0
+        for ref in listeners:
+            listener = ref()
+            if listener is not None:
+                self._executor.submit(self._notify_one, listener, content)
+            else:
+                dead += 1
 
-        # Dispatch notifications asynchronously
-        for listener in listeners_snapshot:
-            self._executor.submit(self._notify_one, listener, content)
+        # Dead refs are skipped lazily above; only bother rebuilding
+        # the tuple every so often (benign race on the counter — the
+        # worst case is compacting slightly early or late)
+        self._notifications_since_compact += 1
+        if dead and self._notifications_since_compact >= self._COMPACT_EVERY:
+            self._compact()
 
     def _notify_one(self, listener, content):
         """Helper to notify a single listener with error isolation and retries."""